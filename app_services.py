@@ -1,17 +1,24 @@
 import ast
+import atexit
+import codecs
 import csv
 import datetime
 import json
 import os
+import queue
 import re
 import shutil
+import signal
 import subprocess
 import sys
-from dataclasses import dataclass
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from typing import Any
 
-import pandas as pd
-
 def _get_resource_root():
     if getattr(sys, "frozen", False):
         return getattr(sys, "_MEIPASS", os.path.dirname(sys.executable))
@@ -36,10 +43,26 @@ LEGACY_ERROR_LOG_FILE = os.path.join(PROJECT_ROOT, "errors.txt")
 LEGACY_INFO_CSV_FILE = os.path.join(PROJECT_ROOT, "info.csv")
 LEGACY_LOG_FILE = os.path.join(PROJECT_ROOT, "logs.txt")
 REPKG_EXECUTABLE = os.path.join(RESOURCE_ROOT, "RePKG.exe")
+REPKG_EXECUTABLE_ENV = "REPKG_GUI_REPKG_EXECUTABLE"
 WORKSHOP_APP_ID = "431960"
 DEFAULT_OUTPUT_PATH = "./output"
 DEFAULT_BATCH_EXTRACT_WORKERS = 0
 MAX_BATCH_EXTRACT_WORKERS = 32
+DEFAULT_ADAPTIVE_BATCH_EXTRACT_WORKERS = False
+DEFAULT_WATCH_WORKSHOP = False
+DEFAULT_AUTO_EXTRACT_NEW_ITEMS = False
+DEFAULT_EXTRACT_TIMEOUT_SECONDS = 300
+DEFAULT_EXTRACT_TIMEOUT_SECONDS_PER_GB = 600
+MAX_EXTRACT_TIMEOUT_SECONDS = 86400
+EXTRACT_CANCEL_GRACE_SECONDS = 3.0
+EXTRACT_POLL_INTERVAL_SECONDS = 0.2
+EXTRACT_OUTPUT_TAIL_LINES = 200
+EXTRACT_READER_JOIN_SECONDS = 2.0
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUP_COUNT = 3
+LOG_BATCH_SIZE = 512
+LOG_FLUSH_TIMEOUT_SECONDS = 5.0
+LOG_FAILURE_REPORT_INTERVAL_SECONDS = 60.0
 DEFAULT_THEME_PRESET = "dark"
 CUSTOM_THEME_PRESET = "custom"
 THEME_PRESETS = {
@@ -73,11 +96,21 @@ DEFAULT_CONFIG = {
     "steam_path": "",
     "output_path": DEFAULT_OUTPUT_PATH,
     "batch_extract_workers": DEFAULT_BATCH_EXTRACT_WORKERS,
+    "adaptive_batch_extract_workers": DEFAULT_ADAPTIVE_BATCH_EXTRACT_WORKERS,
+    "watch_workshop": DEFAULT_WATCH_WORKSHOP,
+    "auto_extract_new_items": DEFAULT_AUTO_EXTRACT_NEW_ITEMS,
+    "extract_timeout_seconds": DEFAULT_EXTRACT_TIMEOUT_SECONDS,
+    "extract_timeout_seconds_per_gb": DEFAULT_EXTRACT_TIMEOUT_SECONDS_PER_GB,
     "theme_preset": DEFAULT_THEME_PRESET,
     **THEME_PRESETS[DEFAULT_THEME_PRESET],
 }
 CONFIG_KEYS = tuple(DEFAULT_CONFIG.keys())
-INFO_FIELDS = ["preview", "tags", "title", "type", "visibility", "file", "id"]
+INFO_FIELDS = ["preview", "tags", "title", "type", "visibility", "file", "id", "library"]
+LIBRARY_FOLDERS_VDF = os.path.join("steamapps", "libraryfolders.vdf")
+MAX_LIBRARY_SCAN_WORKERS = 8
+PROJECT_JSON_FIELDS = ("title", "type", "tags", "preview", "file", "visibility")
+JSON_BACKEND_ENV = "REPKG_GUI_JSON_BACKEND"
+JSON_BACKENDS = ("orjson", "json")
 PREVIEW_FILENAMES = ("preview.jpg", "preview.jpeg", "preview.gif", "preview.png")
 LOCAL_OUTPUT_MODE = "分别输出至源文件所在文件夹"
 SHARED_OUTPUT_MODE = "在指定文件夹中集中输出"
@@ -89,6 +122,11 @@ class AppConfig:
     steam_path: str = ""
     output_path: str = DEFAULT_OUTPUT_PATH
     batch_extract_workers: int = DEFAULT_BATCH_EXTRACT_WORKERS
+    adaptive_batch_extract_workers: bool = DEFAULT_ADAPTIVE_BATCH_EXTRACT_WORKERS
+    watch_workshop: bool = DEFAULT_WATCH_WORKSHOP
+    auto_extract_new_items: bool = DEFAULT_AUTO_EXTRACT_NEW_ITEMS
+    extract_timeout_seconds: int = DEFAULT_EXTRACT_TIMEOUT_SECONDS
+    extract_timeout_seconds_per_gb: int = DEFAULT_EXTRACT_TIMEOUT_SECONDS_PER_GB
     theme_preset: str = DEFAULT_THEME_PRESET
     theme_background: str = THEME_PRESETS[DEFAULT_THEME_PRESET]["theme_background"]
     theme_surface: str = THEME_PRESETS[DEFAULT_THEME_PRESET]["theme_surface"]
@@ -100,6 +138,11 @@ class AppConfig:
             "steam_path": self.steam_path,
             "output_path": self.output_path,
             "batch_extract_workers": self.batch_extract_workers,
+            "adaptive_batch_extract_workers": self.adaptive_batch_extract_workers,
+            "watch_workshop": self.watch_workshop,
+            "auto_extract_new_items": self.auto_extract_new_items,
+            "extract_timeout_seconds": self.extract_timeout_seconds,
+            "extract_timeout_seconds_per_gb": self.extract_timeout_seconds_per_gb,
             "theme_preset": self.theme_preset,
             "theme_background": self.theme_background,
             "theme_surface": self.theme_surface,
@@ -117,6 +160,7 @@ class WallpaperInfo:
     visibility: str = ""
     file: str = ""
     id: str = ""
+    library: str = ""
 
     def __post_init__(self):
         if self.tags is None:
@@ -131,6 +175,7 @@ class WallpaperInfo:
             "visibility": self.visibility,
             "file": self.file,
             "id": self.id,
+            "library": self.library,
         }
 
 
@@ -145,26 +190,155 @@ class ExtractionOptions:
     overwrite_files: bool = True
 
 
+class _BackgroundLogWriter:
+    def __init__(self):
+        self._queue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._last_failure_report = float("-inf")
+
+    def submit(self, path, line):
+        self._ensure_started()
+        self._queue.put((path, line))
+
+    def flush(self, timeout=LOG_FLUSH_TIMEOUT_SECONDS):
+        if self._thread is None or not self._thread.is_alive():
+            return True
+        done = threading.Event()
+        self._queue.put((None, done))
+        return done.wait(timeout)
+
+    def _ensure_started(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._run, name="repkg-log-writer", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < LOG_BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            pending_lines = {}
+            flush_events = []
+            for path, payload in batch:
+                if path is None:
+                    flush_events.append(payload)
+                else:
+                    pending_lines.setdefault(path, []).append(payload)
+
+            for path, lines in pending_lines.items():
+                self._write_lines(path, lines)
+            for event in flush_events:
+                event.set()
+
+    def _write_lines(self, path, lines):
+        text = "".join(lines)
+        try:
+            parent_dir = os.path.dirname(path)
+            if parent_dir:
+                os.makedirs(parent_dir, exist_ok=True)
+            _rotate_log_file(path, len(text.encode("utf-8")))
+            with open(path, "a", encoding="utf-8") as log_file:
+                log_file.write(text)
+        except OSError as exc:
+            self._report_write_failure(path, len(lines), exc)
+
+    def _report_write_failure(self, path, line_count, exc):
+        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        message = f"{timestamp} - 写入日志 {path} 失败，已丢弃 {line_count} 行: {exc}\n"
+        if path != ERROR_LOG_FILE:
+            self._queue.put((ERROR_LOG_FILE, message))
+            return
+
+        now = time.monotonic()
+        stream = sys.stderr
+        if stream is None or now - self._last_failure_report < LOG_FAILURE_REPORT_INTERVAL_SECONDS:
+            return
+        self._last_failure_report = now
+        try:
+            stream.write(message)
+            stream.flush()
+        except (OSError, ValueError):
+            pass
+
+
+def _rotate_log_file(path, incoming_bytes):
+    if LOG_MAX_BYTES <= 0:
+        return
+    try:
+        current_size = os.path.getsize(path)
+    except OSError:
+        return
+    if current_size == 0 or current_size + incoming_bytes <= LOG_MAX_BYTES:
+        return
+
+    if LOG_BACKUP_COUNT <= 0:
+        os.remove(path)
+        return
+    for index in range(LOG_BACKUP_COUNT - 1, 0, -1):
+        source = f"{path}.{index}"
+        if os.path.exists(source):
+            os.replace(source, f"{path}.{index + 1}")
+    os.replace(path, f"{path}.1")
+
+
+_LOG_WRITER = _BackgroundLogWriter()
+
+
+def flush_logs(timeout=LOG_FLUSH_TIMEOUT_SECONDS):
+    return _LOG_WRITER.flush(timeout)
+
+
+atexit.register(flush_logs)
+
+
 def log_success(message):
-    ensure_runtime_dir()
     timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    with open(LOG_FILE, "a", encoding="utf-8") as log_file:
-        log_file.write(f"{timestamp} - SUCCESS: {message}\n")
+    _LOG_WRITER.submit(LOG_FILE, f"{timestamp} - SUCCESS: {message}\n")
 
 
 def log_error(message):
-    ensure_runtime_dir()
     timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    with open(ERROR_LOG_FILE, "a", encoding="utf-8") as log_file:
-        log_file.write(f"{timestamp} - {message}\n")
+    _LOG_WRITER.submit(ERROR_LOG_FILE, f"{timestamp} - {message}\n")
 
 
-def _write_json_file(path, data):
+def append_jsonl_record(path, record):
+    _LOG_WRITER.submit(path, json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+
+
+def _write_bytes_file(path, data):
     parent_dir = os.path.dirname(path)
     if parent_dir:
         os.makedirs(parent_dir, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as file:
-        json.dump(data, file, indent=4, ensure_ascii=False)
+    file_descriptor, temp_path = tempfile.mkstemp(
+        prefix=f".{os.path.basename(path)}.",
+        suffix=".tmp",
+        dir=parent_dir or None,
+    )
+    try:
+        with os.fdopen(file_descriptor, "wb") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _write_json_file(path, data):
+    _write_bytes_file(path, json.dumps(data, indent=4, ensure_ascii=False).encode("utf-8"))
 
 
 def ensure_runtime_dir():
@@ -256,6 +430,55 @@ def normalize_batch_extract_workers(value):
     return parsed_value
 
 
+def normalize_config_flag(value, default, field_name):
+    if value is None:
+        return default
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str):
+        normalized = value.strip().lower()
+        if normalized in {"true", "1", "yes", "on"}:
+            return True
+        if normalized in {"false", "0", "no", "off"}:
+            return False
+
+    log_error(f"{CONFIG_FILE} 中 {field_name} 无效，已恢复默认值 {default}")
+    return default
+
+
+def normalize_extract_timeout(value, default, field_name):
+    if value is None or isinstance(value, bool):
+        return default
+
+    parsed_value: int | None = None
+    if isinstance(value, int):
+        parsed_value = value
+    elif isinstance(value, float) and value.is_integer():
+        parsed_value = int(value)
+    elif isinstance(value, str) and value.strip().isdigit():
+        parsed_value = int(value.strip())
+
+    if parsed_value is None or parsed_value < 0:
+        log_error(f"{CONFIG_FILE} 中 {field_name} 无效，已恢复默认值 {default}")
+        return default
+
+    if parsed_value > MAX_EXTRACT_TIMEOUT_SECONDS:
+        log_error(f"{CONFIG_FILE} 中 {field_name} 超过上限 {MAX_EXTRACT_TIMEOUT_SECONDS}，已截断")
+        return MAX_EXTRACT_TIMEOUT_SECONDS
+
+    return parsed_value
+
+
+def resolve_extract_timeout(pkg_bytes, base_seconds, seconds_per_gb):
+    if not isinstance(base_seconds, int) or base_seconds <= 0:
+        return None
+
+    scaled_seconds = max(seconds_per_gb, 0) * max(pkg_bytes, 0) / (1024**3)
+    return float(base_seconds) + scaled_seconds
+
+
 def normalize_theme_preset(value):
     if not isinstance(value, str):
         return DEFAULT_THEME_PRESET
@@ -331,6 +554,10 @@ def normalize_preview_path(value):
     return _normalize_path_string(text)
 
 
+def normalize_library_root(value):
+    return _normalize_path_string(value) if isinstance(value, str) else ""
+
+
 def normalize_tags(value):
     if value in (None, "", "None"):
         return []
@@ -367,18 +594,24 @@ def serialize_tags(tags):
     return json.dumps(normalize_tags(tags), ensure_ascii=False)
 
 
-def normalize_wallpaper_info(raw_record):
+def normalize_wallpaper_info(raw_record, vocabulary=None):
     if not isinstance(raw_record, dict):
         raise ValueError("壁纸记录必须是对象")
 
+    tags = normalize_tags(raw_record.get("tags", []))
+    wallpaper_type = normalize_wallpaper_type(raw_record.get("type", ""))
+    if vocabulary is not None:
+        tags = list(vocabulary.intern_tags(tags))
+        wallpaper_type = vocabulary.intern_type(wallpaper_type)
     return WallpaperInfo(
         preview=normalize_preview_path(raw_record.get("preview", "")),
-        tags=normalize_tags(raw_record.get("tags", [])),
+        tags=tags,
         title=normalize_wallpaper_title(raw_record.get("title", "")),
-        type=normalize_wallpaper_type(raw_record.get("type", "")),
+        type=wallpaper_type,
         visibility=normalize_visibility(raw_record.get("visibility", "")),
         file=normalize_project_file(raw_record.get("file", "")),
         id=normalize_wallpaper_id(raw_record.get("id", "")),
+        library=normalize_library_root(raw_record.get("library", "")),
     )
 
 
@@ -421,6 +654,31 @@ def normalize_config_data(raw_config):
     batch_extract_workers = normalize_batch_extract_workers(
         raw_config.get("batch_extract_workers", DEFAULT_BATCH_EXTRACT_WORKERS)
     )
+    adaptive_batch_extract_workers = normalize_config_flag(
+        raw_config.get("adaptive_batch_extract_workers", DEFAULT_ADAPTIVE_BATCH_EXTRACT_WORKERS),
+        DEFAULT_ADAPTIVE_BATCH_EXTRACT_WORKERS,
+        "adaptive_batch_extract_workers",
+    )
+    watch_workshop = normalize_config_flag(
+        raw_config.get("watch_workshop", DEFAULT_WATCH_WORKSHOP),
+        DEFAULT_WATCH_WORKSHOP,
+        "watch_workshop",
+    )
+    auto_extract_new_items = normalize_config_flag(
+        raw_config.get("auto_extract_new_items", DEFAULT_AUTO_EXTRACT_NEW_ITEMS),
+        DEFAULT_AUTO_EXTRACT_NEW_ITEMS,
+        "auto_extract_new_items",
+    )
+    extract_timeout_seconds = normalize_extract_timeout(
+        raw_config.get("extract_timeout_seconds", DEFAULT_EXTRACT_TIMEOUT_SECONDS),
+        DEFAULT_EXTRACT_TIMEOUT_SECONDS,
+        "extract_timeout_seconds",
+    )
+    extract_timeout_seconds_per_gb = normalize_extract_timeout(
+        raw_config.get("extract_timeout_seconds_per_gb", DEFAULT_EXTRACT_TIMEOUT_SECONDS_PER_GB),
+        DEFAULT_EXTRACT_TIMEOUT_SECONDS_PER_GB,
+        "extract_timeout_seconds_per_gb",
+    )
     theme_preset = normalize_theme_preset(raw_config.get("theme_preset", DEFAULT_THEME_PRESET))
     if theme_preset != raw_config.get("theme_preset", DEFAULT_THEME_PRESET):
         log_error(f"{CONFIG_FILE} 中 theme_preset 无效，已恢复默认主题")
@@ -435,6 +693,11 @@ def normalize_config_data(raw_config):
         steam_path=steam_path,
         output_path=output_path,
         batch_extract_workers=batch_extract_workers,
+        adaptive_batch_extract_workers=adaptive_batch_extract_workers,
+        watch_workshop=watch_workshop,
+        auto_extract_new_items=auto_extract_new_items,
+        extract_timeout_seconds=extract_timeout_seconds,
+        extract_timeout_seconds_per_gb=extract_timeout_seconds_per_gb,
         theme_preset=theme_preset,
         theme_background=theme_values["theme_background"],
         theme_surface=theme_values["theme_surface"],
@@ -443,16 +706,67 @@ def normalize_config_data(raw_config):
     )
 
 
+_CONFIG_CACHE = {}
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+
+def _stat_config_file(path):
+    try:
+        stat_result = os.stat(path)
+    except OSError:
+        return None
+    return stat_result.st_mtime_ns, stat_result.st_size
+
+
+def _get_cached_config(path):
+    file_signature = _stat_config_file(path)
+    if file_signature is None:
+        return None
+    with _CONFIG_CACHE_LOCK:
+        cached = _CONFIG_CACHE.get(path)
+    if cached is None or cached[0] != file_signature:
+        return None
+    return replace(cached[1])
+
+
+def _store_cached_config(path, config):
+    file_signature = _stat_config_file(path)
+    with _CONFIG_CACHE_LOCK:
+        if file_signature is None:
+            _CONFIG_CACHE.pop(path, None)
+        else:
+            _CONFIG_CACHE[path] = (file_signature, replace(config))
+
+
+def invalidate_config_cache(path=None):
+    with _CONFIG_CACHE_LOCK:
+        if path is None:
+            _CONFIG_CACHE.clear()
+        else:
+            _CONFIG_CACHE.pop(path, None)
+
+
 def load_config():
+    config_file = CONFIG_FILE
+    cached_config = _get_cached_config(config_file)
+    if cached_config is not None:
+        return cached_config
+
+    config = _load_config_from_disk(config_file)
+    _store_cached_config(config_file, config)
+    return replace(config)
+
+
+def _load_config_from_disk(config_file):
     ensure_config_file()
 
     try:
-        with open(CONFIG_FILE, "r", encoding="utf-8") as file:
+        with open(config_file, "r", encoding="utf-8") as file:
             raw_config = json.load(file)
     except json.JSONDecodeError as exc:
-        log_error(f"{CONFIG_FILE} 文件格式错误: {exc}，已恢复默认配置")
+        log_error(f"{config_file} 文件格式错误: {exc}，已恢复默认配置")
         config = AppConfig()
-        _write_json_file(CONFIG_FILE, config.to_dict())
+        _write_json_file(config_file, config.to_dict())
         return config
 
     try:
@@ -460,13 +774,13 @@ def load_config():
     except ValueError as exc:
         log_error(f"{exc}，已恢复默认配置")
         config = AppConfig()
-        _write_json_file(CONFIG_FILE, config.to_dict())
+        _write_json_file(config_file, config.to_dict())
         return config
 
     normalized = config.to_dict()
     if normalized != raw_config:
-        _write_json_file(CONFIG_FILE, normalized)
-        log_success(f"已规范化 {CONFIG_FILE} 配置内容")
+        _write_json_file(config_file, normalized)
+        log_success(f"已规范化 {config_file} 配置内容")
 
     return config
 
@@ -475,13 +789,13 @@ def read_config_value(key):
     if key not in CONFIG_KEYS:
         raise KeyError(f"不支持的配置字段: {key}")
 
-    config = load_config()
-    value = getattr(config, key)
-    if value:
-        log_success(f"成功读取路径: {value}")
-        return value
+    value = getattr(load_config(), key)
+    return value or None
 
-    return None
+
+def _save_config(config):
+    _write_json_file(CONFIG_FILE, config.to_dict())
+    _store_cached_config(CONFIG_FILE, config)
 
 
 def write_config_value(key, value):
@@ -492,7 +806,7 @@ def write_config_value(key, value):
     updated_config = config.to_dict()
     updated_config[key] = value
     normalized_config = normalize_config_data(updated_config)
-    _write_json_file(CONFIG_FILE, normalized_config.to_dict())
+    _save_config(normalized_config)
     log_success(f"成功写入配置 {key}: {getattr(normalized_config, key)}")
 
 
@@ -505,16 +819,154 @@ def write_config_values(values):
     updated_config = config.to_dict()
     updated_config.update(values)
     normalized_config = normalize_config_data(updated_config)
-    _write_json_file(CONFIG_FILE, normalized_config.to_dict())
+    _save_config(normalized_config)
     log_success(f"成功批量写入配置: {', '.join(sorted(values.keys()))}")
 
 
-def get_workshop_directory(steam_path):
-    return os.path.join(os.path.dirname(steam_path), "steamapps", "workshop", "content", WORKSHOP_APP_ID)
+_VDF_TOKEN_PATTERN = re.compile(r'"((?:[^"\\]|\\.)*)"|(\{)|(\})|(//[^\n]*)|([^\s{}"]+)')
+_VDF_ESCAPE_PATTERN = re.compile(r"\\(.)")
+_VDF_ESCAPES = {"n": "\n", "t": "\t"}
+_LIBRARY_ROOTS_CACHE = {}
+_LIBRARY_ROOTS_CACHE_LOCK = threading.Lock()
+
+
+def parse_vdf(text):
+    root = {}
+    stack = [root]
+    pending_key = None
+    for match in _VDF_TOKEN_PATTERN.finditer(text):
+        quoted, open_brace, close_brace, comment, bare = match.groups()
+        if comment is not None:
+            continue
+        if open_brace is not None:
+            if pending_key is None:
+                raise ValueError("VDF 对象缺少键名")
+            child = {}
+            stack[-1][pending_key] = child
+            stack.append(child)
+            pending_key = None
+        elif close_brace is not None:
+            if pending_key is not None or len(stack) == 1:
+                raise ValueError("VDF 花括号不匹配")
+            stack.pop()
+        else:
+            if quoted is None and bare.startswith("[") and bare.endswith("]"):
+                continue
+            token = _VDF_ESCAPE_PATTERN.sub(lambda escape: _VDF_ESCAPES.get(escape.group(1), escape.group(1)), quoted) if quoted is not None else bare
+            if pending_key is None:
+                pending_key = token
+            else:
+                stack[-1][pending_key] = token
+                pending_key = None
+
+    if pending_key is not None or len(stack) != 1:
+        raise ValueError("VDF 内容不完整")
+    return root
+
+
+def _get_vdf_child(mapping, key):
+    lowered_key = key.lower()
+    for candidate_key, value in mapping.items():
+        if candidate_key.lower() == lowered_key:
+            return value
+    return None
+
+
+def read_steam_library_folders(vdf_path):
+    with open(vdf_path, "r", encoding="utf-8", errors="replace") as file:
+        data = parse_vdf(file.read())
+
+    folders = _get_vdf_child(data, "libraryfolders")
+    if not isinstance(folders, dict):
+        return []
+
+    libraries = []
+    for key, value in folders.items():
+        if not key.isdigit():
+            continue
+        if isinstance(value, str):
+            libraries.append((_normalize_path_string(value), None))
+        elif isinstance(value, dict):
+            library_path = _get_vdf_child(value, "path")
+            apps = _get_vdf_child(value, "apps")
+            if isinstance(library_path, str) and library_path.strip():
+                libraries.append(
+                    (
+                        _normalize_path_string(library_path),
+                        frozenset(apps.keys()) if isinstance(apps, dict) else None,
+                    )
+                )
+    return libraries
+
+
+def _resolve_library_roots(primary_root, vdf_path):
+    roots = [primary_root]
+    seen = {os.path.normcase(os.path.normpath(primary_root))}
+    try:
+        libraries = read_steam_library_folders(vdf_path)
+    except FileNotFoundError:
+        return tuple(roots)
+    except (OSError, ValueError) as exc:
+        log_error(f"解析 Steam 库列表 {vdf_path} 失败: {exc}")
+        return tuple(roots)
+
+    for library_path, apps in libraries:
+        library_key = os.path.normcase(os.path.normpath(library_path))
+        if library_key in seen:
+            continue
+        has_workshop_app = apps is not None and WORKSHOP_APP_ID in apps
+        if not has_workshop_app and not os.path.isdir(_get_library_workshop_directory(library_path)):
+            continue
+        seen.add(library_key)
+        roots.append(library_path)
+    return tuple(roots)
+
+
+def get_steam_library_roots(steam_path):
+    primary_root = os.path.dirname(steam_path)
+    vdf_path = os.path.join(primary_root, LIBRARY_FOLDERS_VDF)
+    try:
+        stat_result = os.stat(vdf_path)
+        signature = (stat_result.st_mtime_ns, stat_result.st_size)
+    except OSError:
+        signature = None
+
+    cache_key = os.path.normcase(os.path.abspath(vdf_path))
+    with _LIBRARY_ROOTS_CACHE_LOCK:
+        cached = _LIBRARY_ROOTS_CACHE.get(cache_key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+    roots = _resolve_library_roots(primary_root, vdf_path) if signature is not None else (primary_root,)
+    with _LIBRARY_ROOTS_CACHE_LOCK:
+        _LIBRARY_ROOTS_CACHE[cache_key] = (signature, roots)
+    return roots
+
+
+def _get_library_workshop_directory(library_root):
+    return os.path.join(library_root, "steamapps", "workshop", "content", WORKSHOP_APP_ID)
+
+
+def get_workshop_directory(steam_path, library_root=None):
+    return _get_library_workshop_directory(library_root or os.path.dirname(steam_path))
+
+
+def get_workshop_directories(steam_path):
+    return [_get_library_workshop_directory(library_root) for library_root in get_steam_library_roots(steam_path)]
+
+
+def locate_item_directory(steam_path, item_id):
+    library_roots = get_steam_library_roots(steam_path)
+    if len(library_roots) > 1:
+        for library_root in library_roots:
+            candidate = os.path.join(_get_library_workshop_directory(library_root), str(item_id))
+            if os.path.isdir(candidate):
+                return library_root, candidate
+    return library_roots[0], os.path.join(_get_library_workshop_directory(library_roots[0]), str(item_id))
 
 
 def get_item_directory(steam_path, item_id):
-    return os.path.join(get_workshop_directory(steam_path), str(item_id))
+    return locate_item_directory(steam_path, item_id)[1]
 
 
 def get_scene_pkg_path(steam_path, item_id):
@@ -525,9 +977,74 @@ def sanitize_wallpaper_title(title):
     return re.sub(r'[\\/*?:"<>|]', "", title)
 
 
+@dataclass(frozen=True)
+class JsonBackend:
+    name: str
+    loads: Any
+
+
+def _load_orjson_backend():
+    try:
+        import orjson
+    except ImportError:
+        return None
+
+    orjson_loads = orjson.loads
+    orjson_error = orjson.JSONDecodeError
+
+    def loads(data):
+        payload = data[len(codecs.BOM_UTF8) :] if data.startswith(codecs.BOM_UTF8) else data
+        try:
+            return orjson_loads(payload)
+        except orjson_error:
+            return json.loads(data)
+
+    return JsonBackend(name="orjson", loads=loads)
+
+
+def _load_json_backend(name):
+    if name == "orjson":
+        return _load_orjson_backend()
+    if name == "json":
+        return JsonBackend(name="json", loads=json.loads)
+    return None
+
+
+def resolve_json_backend(preferred=None):
+    normalized = (preferred or "").strip().lower()
+    candidates = (normalized, *JSON_BACKENDS) if normalized in JSON_BACKENDS else JSON_BACKENDS
+    for name in candidates:
+        backend = _load_json_backend(name)
+        if backend is not None:
+            return backend
+    return JsonBackend(name="json", loads=json.loads)
+
+
+_JSON_BACKEND_LOCK = threading.Lock()
+_active_json_backend = None
+
+
+def get_json_backend():
+    global _active_json_backend
+    backend = _active_json_backend
+    if backend is None:
+        with _JSON_BACKEND_LOCK:
+            if _active_json_backend is None:
+                _active_json_backend = resolve_json_backend(os.environ.get(JSON_BACKEND_ENV))
+            backend = _active_json_backend
+    return backend
+
+
+def set_json_backend(name):
+    global _active_json_backend
+    with _JSON_BACKEND_LOCK:
+        _active_json_backend = resolve_json_backend(name) if name is not None else None
+    return get_json_backend()
+
+
 def read_json_object(file_path):
-    with open(file_path, "r", encoding="utf-8") as file:
-        data = json.load(file)
+    with open(file_path, "rb") as file:
+        data = get_json_backend().loads(file.read())
 
     if not isinstance(data, dict):
         raise ValueError(f"{file_path} 顶层必须是 JSON 对象")
@@ -535,6 +1052,11 @@ def read_json_object(file_path):
     return data
 
 
+def read_project_fields(file_path):
+    data = read_json_object(file_path)
+    return {field: data[field] for field in PROJECT_JSON_FIELDS if field in data}
+
+
 def find_preview_file(folder_path, directory_entries):
     for filename in directory_entries:
         if filename.lower() in PREVIEW_FILENAMES:
@@ -557,54 +1079,133 @@ def resolve_preview_path(folder_path, preview_value, directory_entries):
     return fallback_preview or normalized_preview
 
 
-def collect_workshop_info(steam_path):
+def collect_workshop_item_info(folder_path, foldername, library_root="", vocabulary=None):
+    try:
+        directory_entries = sorted(os.listdir(folder_path))
+    except OSError as exc:
+        log_error(f"读取目录 {folder_path} 时发生错误: {exc}")
+        return None
+
+    project_data = {}
+    json_candidates = sorted(
+        (filename for filename in directory_entries if filename.lower().endswith(".json")),
+        key=lambda filename: (filename.lower() != "project.json", filename.lower()),
+    )
+    for filename in json_candidates:
+        file_path = os.path.join(folder_path, filename)
+        try:
+            project_data = read_project_fields(file_path)
+            break
+        except (json.JSONDecodeError, OSError, ValueError) as exc:
+            log_error(f"读取元数据文件 {file_path} 失败: {exc}")
+
+    return normalize_wallpaper_info(
+        {
+            "id": normalize_wallpaper_id(foldername),
+            "preview": resolve_preview_path(folder_path, project_data.get("preview", ""), directory_entries),
+            "tags": project_data.get("tags", []),
+            "title": project_data.get("title", ""),
+            "type": project_data.get("type", ""),
+            "visibility": project_data.get("visibility", ""),
+            "file": project_data.get("file", ""),
+            "library": library_root,
+        },
+        vocabulary,
+    )
+
+
+def _collect_library_info(library_root, directory, vocabulary):
+    extracted_info = []
+    try:
+        foldernames = os.listdir(directory)
+    except OSError as exc:
+        log_error(f"读取目录 {directory} 时发生错误: {exc}")
+        return extracted_info
+
+    for foldername in foldernames:
+        folder_path = os.path.join(directory, foldername)
+        if not os.path.isdir(folder_path):
+            continue
+
+        item_info = collect_workshop_item_info(folder_path, foldername, library_root, vocabulary)
+        if item_info is not None:
+            extracted_info.append(item_info)
+    return extracted_info
+
+
+def collect_workshop_info(steam_path, vocabulary=None):
     if not steam_path:
         raise ValueError(f"{CONFIG_FILE} 中 steam_path 未找到或无效")
 
-    directory = get_workshop_directory(steam_path)
-    if not os.path.exists(directory):
-        raise FileNotFoundError(f"目录 {directory} 不存在")
+    libraries = [
+        (library_root, _get_library_workshop_directory(library_root))
+        for library_root in get_steam_library_roots(steam_path)
+    ]
+    libraries = [(library_root, directory) for library_root, directory in libraries if os.path.isdir(directory)]
+    if not libraries:
+        raise FileNotFoundError(f"目录 {get_workshop_directory(steam_path)} 不存在")
+
+    if len(libraries) == 1:
+        library_results = [_collect_library_info(*libraries[0], vocabulary)]
+    else:
+        with ThreadPoolExecutor(
+            max_workers=min(len(libraries), MAX_LIBRARY_SCAN_WORKERS),
+            thread_name_prefix="repkg-scan",
+        ) as executor:
+            library_results = list(
+                executor.map(lambda library: _collect_library_info(*library, vocabulary), libraries)
+            )
 
     extracted_info = []
-    for foldername in os.listdir(directory):
-        folder_path = os.path.join(directory, foldername)
+    seen_ids = set()
+    for library_info in library_results:
+        for item_info in library_info:
+            if item_info.id in seen_ids:
+                continue
+            seen_ids.add(item_info.id)
+            extracted_info.append(item_info)
+    return extracted_info
+
+
+def collect_workshop_items(steam_path, item_ids, vocabulary=None):
+    extracted_info = []
+    for item_id in item_ids:
+        library_root, folder_path = locate_item_directory(steam_path, item_id)
         if not os.path.isdir(folder_path):
             continue
 
+        item_info = collect_workshop_item_info(folder_path, str(item_id), library_root, vocabulary)
+        if item_info is not None:
+            extracted_info.append(item_info)
+    return extracted_info
+
+
+def scan_workshop_signatures(steam_path):
+    signatures = {}
+    for directory in get_workshop_directories(steam_path):
         try:
-            directory_entries = sorted(os.listdir(folder_path))
-        except OSError as exc:
-            log_error(f"读取目录 {folder_path} 时发生错误: {exc}")
+            entries = list(os.scandir(directory))
+        except OSError:
             continue
 
-        project_data = {}
-        json_candidates = sorted(
-            (filename for filename in directory_entries if filename.lower().endswith(".json")),
-            key=lambda filename: (filename.lower() != "project.json", filename.lower()),
-        )
-        for filename in json_candidates:
-            file_path = os.path.join(folder_path, filename)
+        for entry in entries:
+            item_id = normalize_wallpaper_id(entry.name)
+            if item_id in signatures:
+                continue
             try:
-                project_data = read_json_object(file_path)
-                break
-            except (json.JSONDecodeError, OSError, ValueError) as exc:
-                log_error(f"读取元数据文件 {file_path} 失败: {exc}")
-
-        extracted_info.append(
-            normalize_wallpaper_info(
-                {
-                    "id": normalize_wallpaper_id(foldername),
-                    "preview": resolve_preview_path(folder_path, project_data.get("preview", ""), directory_entries),
-                    "tags": project_data.get("tags", []),
-                    "title": project_data.get("title", ""),
-                    "type": project_data.get("type", ""),
-                    "visibility": project_data.get("visibility", ""),
-                    "file": project_data.get("file", ""),
-                }
-            )
-        )
+                if not entry.is_dir():
+                    continue
+                folder_stat = entry.stat()
+            except OSError:
+                continue
 
-    return extracted_info
+            try:
+                project_stat = os.stat(os.path.join(entry.path, "project.json"))
+                project_signature = (project_stat.st_mtime_ns, project_stat.st_size)
+            except OSError:
+                project_signature = (0, -1)
+            signatures[item_id] = (folder_stat.st_mtime_ns, *project_signature)
+    return signatures
 
 
 def write_info_csv(extracted_info, file_path=None):
@@ -626,37 +1227,66 @@ def extract_info_to_csv(steam_path=None, file_path=None):
     return write_info_csv(extracted_info, file_path)
 
 
+def _load_pandas():
+    global pd
+    if "pd" not in globals():
+        import pandas as pd
+    return pd
+
+
+def __getattr__(name):
+    if name == "pd":
+        return _load_pandas()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def parse_tags(tags_str):
     return normalize_tags(tags_str)
 
 
-def read_info_csv(file_path):
+def read_info_csv(file_path, vocabulary=None):
+    pandas = _load_pandas()
     try:
-        df = pd.read_csv(file_path, keep_default_na=False)
+        df = pandas.read_csv(file_path, keep_default_na=False)
         df = df.reindex(columns=INFO_FIELDS, fill_value="")
         df["preview"] = df["preview"].apply(normalize_preview_path)
         df["tags"] = df["tags"].apply(parse_tags)
         df["title"] = df["title"].apply(normalize_wallpaper_title)
         df["type"] = df["type"].apply(normalize_wallpaper_type)
+        if vocabulary is not None:
+            df["tags"] = df["tags"].apply(lambda tags: list(vocabulary.intern_tags(tags)))
+            df["type"] = df["type"].apply(vocabulary.intern_type)
         df["visibility"] = df["visibility"].apply(normalize_visibility)
         df["file"] = df["file"].apply(normalize_project_file)
         df["id"] = df["id"].apply(normalize_wallpaper_id)
+        df["library"] = df["library"].apply(normalize_library_root)
         log_success(f"成功读取 CSV 文件: {file_path}")
         return df
     except FileNotFoundError:
         log_error(f"文件 {file_path} 未找到")
-    except pd.errors.EmptyDataError:
+    except pandas.errors.EmptyDataError:
         log_error(f"文件 {file_path} 为空")
-    except pd.errors.ParserError:
+    except pandas.errors.ParserError:
         log_error(f"无法解析文件 {file_path}")
     except (OSError, ValueError) as exc:
         log_error(f"读取文件 {file_path} 时发生错误: {exc}")
     return None
 
 
+def get_repkg_executable():
+    return os.environ.get(REPKG_EXECUTABLE_ENV, "").strip() or REPKG_EXECUTABLE
+
+
+def get_repkg_command_prefix():
+    executable = get_repkg_executable()
+    if executable.lower().endswith(".py"):
+        return [sys.executable, executable]
+    return [executable]
+
+
 def build_extract_command(options, item_id, title):
     scene_pkg_path = get_scene_pkg_path(options.steam_path, item_id)
-    command = [REPKG_EXECUTABLE, "extract", scene_pkg_path]
+    command = [*get_repkg_command_prefix(), "extract", scene_pkg_path]
 
     if options.not_convert_tex_to_image:
         command.append("--no-tex-convert")
@@ -682,5 +1312,121 @@ def build_extract_command(options, item_id, title):
     return command
 
 
-def run_extract_command(command):
-    return subprocess.run(command, shell=False, capture_output=True, text=True)
+def _popen_process_group_kwargs():
+    if os.name == "nt":
+        return {}
+    return {"start_new_session": True}
+
+
+def _signal_process_tree(process, force):
+    if process.poll() is not None:
+        return
+
+    if os.name == "nt":
+        if force:
+            subprocess.run(
+                ["taskkill", "/F", "/T", "/PID", str(process.pid)],
+                shell=False,
+                capture_output=True,
+            )
+        else:
+            process.terminate()
+        return
+
+    try:
+        os.killpg(process.pid, signal.SIGKILL if force else signal.SIGTERM)
+    except (ProcessLookupError, PermissionError):
+        if force:
+            process.kill()
+        else:
+            process.terminate()
+
+
+def kill_process_tree(process):
+    _signal_process_tree(process, force=True)
+    if process.poll() is None:
+        process.kill()
+
+
+def _stop_extract_process(process, grace_period):
+    _signal_process_tree(process, force=False)
+    try:
+        process.wait(timeout=grace_period)
+    except subprocess.TimeoutExpired:
+        kill_process_tree(process)
+        process.wait()
+
+
+def _pump_extract_stream(pipe, stream_name, tail, on_output):
+    try:
+        for raw_line in pipe:
+            line = raw_line.rstrip("\r\n")
+            tail.append(line)
+            if on_output is not None:
+                try:
+                    on_output(stream_name, line)
+                except Exception as exc:
+                    log_error(f"处理 RePKG 输出时发生错误: {exc}")
+    except (OSError, ValueError):
+        pass
+    finally:
+        try:
+            pipe.close()
+        except OSError:
+            pass
+
+
+def _collect_extract_output(readers, tails):
+    for reader in readers:
+        reader.join(EXTRACT_READER_JOIN_SECONDS)
+    return tuple("\n".join(tail) for tail in tails)
+
+
+def run_extract_command(
+    command,
+    cancel_event=None,
+    timeout=None,
+    grace_period=EXTRACT_CANCEL_GRACE_SECONDS,
+    on_output=None,
+    tail_lines=EXTRACT_OUTPUT_TAIL_LINES,
+):
+    process = subprocess.Popen(
+        command,
+        shell=False,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        errors="replace",
+        bufsize=1,
+        **_popen_process_group_kwargs(),
+    )
+    tails = (deque(maxlen=tail_lines), deque(maxlen=tail_lines))
+    readers = [
+        threading.Thread(
+            target=_pump_extract_stream,
+            args=(pipe, stream_name, tail, on_output),
+            name=f"repkg-{stream_name}-{process.pid}",
+            daemon=True,
+        )
+        for pipe, stream_name, tail in ((process.stdout, "stdout", tails[0]), (process.stderr, "stderr", tails[1]))
+    ]
+    for reader in readers:
+        reader.start()
+
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while True:
+        try:
+            process.wait(timeout=EXTRACT_POLL_INTERVAL_SECONDS)
+            break
+        except subprocess.TimeoutExpired:
+            if cancel_event is not None and cancel_event.is_set():
+                _stop_extract_process(process, grace_period)
+                break
+            if deadline is not None and time.monotonic() >= deadline:
+                kill_process_tree(process)
+                process.wait()
+                stdout, stderr = _collect_extract_output(readers, tails)
+                raise subprocess.TimeoutExpired(command, timeout, output=stdout, stderr=stderr)
+
+    stdout, stderr = _collect_extract_output(readers, tails)
+    return subprocess.CompletedProcess(command, process.returncode, stdout, stderr)
@@ -0,0 +1,11 @@
+from benchmarks.harness import BenchmarkTimer, isolated_runtime, measure
+from benchmarks.workshop_fixture import SyntheticWorkshop, SyntheticWorkshopSpec, generate_synthetic_workshop
+
+__all__ = [
+    "BenchmarkTimer",
+    "SyntheticWorkshop",
+    "SyntheticWorkshopSpec",
+    "generate_synthetic_workshop",
+    "isolated_runtime",
+    "measure",
+]
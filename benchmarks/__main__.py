@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from collections.abc import Sequence
+from typing import TextIO
+
+from benchmarks.catalog_benchmark import run_catalog_benchmark
+from benchmarks.extraction_benchmark import (
+    DEFAULT_BATCH_SIZES,
+    DEFAULT_PKG_BYTES,
+    DEFAULT_WORKER_COUNTS,
+    FakeRepkgProfile,
+    run_extraction_benchmark,
+)
+from benchmarks.harness import compare_reports
+from benchmarks.workshop_fixture import SyntheticWorkshopSpec
+
+
+def _parse_size(value: str) -> tuple[int, int]:
+    width, _, height = value.lower().partition("x")
+    try:
+        return int(width), int(height or width)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"无效的尺寸: {value}") from None
+
+
+def _parse_int_list(value: str) -> tuple[int, ...]:
+    try:
+        values = tuple(int(part) for part in value.split(",") if part.strip())
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"无效的整数列表: {value}") from None
+    if not values or min(values) < 1:
+        raise argparse.ArgumentTypeError(f"列表中的值必须大于 0: {value}")
+    return values
+
+
+def _add_workshop_arguments(parser: argparse.ArgumentParser, item_count: int) -> None:
+    parser.add_argument("--items", type=int, default=item_count, help="合成壁纸数量")
+    parser.add_argument("--tags", type=int, default=40, help="标签种类数量")
+    parser.add_argument("--tags-per-item", type=int, default=3, help="每个壁纸的标签数量")
+    parser.add_argument("--preview-formats", default="jpg,png,gif", help="预览图格式，逗号分隔，留空则不生成")
+    parser.add_argument("--preview-size", type=_parse_size, default=(256, 256), help="预览图尺寸，如 256x256")
+    parser.add_argument("--broken-json-rate", type=float, default=0.02, help="损坏 project.json 的比例")
+    parser.add_argument("--scene-rate", type=float, default=0.7, help="scene 类型壁纸的比例")
+    parser.add_argument("--properties-per-item", type=int, default=0, help="每个 project.json 中 general.properties 的条目数")
+    parser.add_argument("--seed", type=int, default=0, help="随机种子")
+    parser.add_argument("--repeat", type=int, default=5, help="每项计时的重复次数")
+    parser.add_argument("--work-dir", help="生成合成 Workshop 的临时目录")
+    parser.add_argument("--output", help="把 JSON 结果写入文件，默认输出到标准输出")
+
+
+def build_workshop_spec(args: argparse.Namespace, pkg_bytes: int = 0) -> SyntheticWorkshopSpec:
+    return SyntheticWorkshopSpec(
+        item_count=args.items,
+        tag_count=args.tags,
+        tags_per_item=args.tags_per_item,
+        preview_formats=tuple(value.strip() for value in args.preview_formats.split(",") if value.strip()),
+        preview_size=args.preview_size,
+        broken_json_rate=args.broken_json_rate,
+        scene_rate=args.scene_rate,
+        properties_per_item=args.properties_per_item,
+        pkg_bytes=pkg_bytes,
+        seed=args.seed,
+    )
+
+
+def run_thumbnails(args: argparse.Namespace) -> dict:
+    from PySide6.QtCore import QSize
+
+    from benchmarks.thumbnail_benchmark import run_thumbnail_benchmark
+
+    return run_thumbnail_benchmark(
+        build_workshop_spec(args),
+        passes=args.passes,
+        viewport_size=QSize(*args.viewport),
+        work_dir=args.work_dir,
+    )
+
+
+def run_compare(args: argparse.Namespace) -> dict:
+    with open(args.baseline, "r", encoding="utf-8") as file:
+        baseline = json.load(file)
+    with open(args.current, "r", encoding="utf-8") as file:
+        current = json.load(file)
+    return compare_reports(baseline, current)
+
+
+def run_catalog(args: argparse.Namespace) -> dict:
+    return run_catalog_benchmark(
+        build_workshop_spec(args),
+        repeat=args.repeat,
+        work_dir=args.work_dir,
+        include_proxy=not args.skip_proxy,
+    )
+
+
+def run_extraction(args: argparse.Namespace) -> dict:
+    return run_extraction_benchmark(
+        worker_counts=args.workers,
+        batch_sizes=args.batch_sizes,
+        profile=FakeRepkgProfile(
+            latency_seconds=args.latency,
+            seconds_per_mb=args.seconds_per_mb,
+            files=args.files,
+            file_bytes=args.file_bytes,
+            failure_rate=args.failure_rate,
+            seed=args.seed,
+        ),
+        pkg_bytes=args.pkg_bytes,
+        repeat=args.repeat,
+        work_dir=args.work_dir,
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="RePKG_GUI 性能基准")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    catalog_parser = subparsers.add_parser("catalog", help="扫描、CSV 读写与筛选基准")
+    _add_workshop_arguments(catalog_parser, item_count=2000)
+    catalog_parser.add_argument("--skip-proxy", action="store_true", help="跳过 Qt 筛选代理模型的计时")
+    catalog_parser.set_defaults(handler=run_catalog)
+
+    extraction_parser = subparsers.add_parser("extraction", help="使用模拟 RePKG 的批量提取基准")
+    extraction_parser.add_argument(
+        "--workers",
+        type=_parse_int_list,
+        default=DEFAULT_WORKER_COUNTS,
+        help="并发数列表，逗号分隔",
+    )
+    extraction_parser.add_argument(
+        "--batch-sizes",
+        type=_parse_int_list,
+        default=DEFAULT_BATCH_SIZES,
+        help="批量大小列表，逗号分隔",
+    )
+    extraction_parser.add_argument("--latency", type=float, default=0.05, help="模拟 RePKG 每项的固定耗时（秒）")
+    extraction_parser.add_argument("--seconds-per-mb", type=float, default=0.0, help="模拟 RePKG 每 MB 额外耗时（秒）")
+    extraction_parser.add_argument("--files", type=int, default=8, help="模拟 RePKG 每项输出的文件数")
+    extraction_parser.add_argument("--file-bytes", type=int, default=4096, help="模拟 RePKG 每个输出文件的大小")
+    extraction_parser.add_argument("--failure-rate", type=float, default=0.0, help="模拟 RePKG 的失败比例")
+    extraction_parser.add_argument("--pkg-bytes", type=int, default=DEFAULT_PKG_BYTES, help="合成 scene.pkg 的大小")
+    extraction_parser.add_argument("--seed", type=int, default=0, help="随机种子")
+    extraction_parser.add_argument("--repeat", type=int, default=1, help="每种组合的重复次数")
+    extraction_parser.add_argument("--work-dir", help="生成合成 Workshop 的临时目录")
+    extraction_parser.add_argument("--output", help="把 JSON 结果写入文件，默认输出到标准输出")
+    extraction_parser.set_defaults(handler=run_extraction)
+
+    thumbnail_parser = subparsers.add_parser("thumbnails", help="缩略图解码与滚动绘制基准（离屏）")
+    _add_workshop_arguments(thumbnail_parser, item_count=300)
+    thumbnail_parser.add_argument("--passes", type=int, default=2, help="滚动遍数，第一遍为冷缓存")
+    thumbnail_parser.add_argument("--viewport", type=_parse_size, default=(900, 700), help="视图尺寸，如 900x700")
+    thumbnail_parser.set_defaults(handler=run_thumbnails, broken_json_rate=0.0)
+
+    compare_parser = subparsers.add_parser("compare", help="对比两份基准 JSON 结果")
+    compare_parser.add_argument("baseline", help="基线结果 JSON")
+    compare_parser.add_argument("current", help="当前结果 JSON")
+    compare_parser.add_argument("--output", help="把 JSON 结果写入文件，默认输出到标准输出")
+    compare_parser.set_defaults(handler=run_compare)
+    return parser
+
+
+def main(argv: Sequence[str] | None = None, stream: TextIO | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    report = args.handler(args)
+    text = json.dumps(report, ensure_ascii=False, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text + "\n")
+    else:
+        (stream or sys.stdout).write(text + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import os
+import tempfile
+from dataclasses import asdict
+from typing import Any
+
+import app_services
+from benchmarks.harness import environment_info, isolated_runtime, measure
+from benchmarks.workshop_fixture import SyntheticWorkshopSpec, generate_synthetic_workshop
+from repkg_gui.domain.entities import CatalogSnapshot, FilterState
+from repkg_gui.domain.enums import FilterField
+from repkg_gui.services.catalog_service import CatalogService
+from repkg_gui.services.catalog_snapshot_store import read_catalog_snapshot, write_catalog_snapshot
+
+
+def _benchmark_filter_proxy(records, tags: tuple[str, ...], repeat: int) -> dict[str, Any]:
+    from repkg_gui.models.catalog_filter_proxy import CatalogFilterProxyModel
+    from repkg_gui.models.catalog_table_model import CatalogTableModel
+
+    model = CatalogTableModel()
+    proxy = CatalogFilterProxyModel()
+    proxy.setSourceModel(model)
+
+    def reset_records() -> int:
+        model.set_records(records)
+        return proxy.rowCount()
+
+    set_records_stats, _ = measure(reset_records, repeat=repeat, item_count=len(records))
+
+    filters = (
+        FilterState(field=FilterField.TAGS, value=tags[0] if tags else ""),
+        FilterState(field=FilterField.TYPE, value="scene"),
+        FilterState(field=FilterField.TITLE, value="Wallpaper 1"),
+    )
+
+    def apply_filters() -> int:
+        visible_rows = 0
+        for filter_state in filters:
+            proxy.set_filter_state(filter_state)
+            visible_rows += proxy.rowCount()
+            proxy.set_filter_state(FilterState())
+        return visible_rows
+
+    filter_stats, visible_rows = measure(apply_filters, repeat=repeat, item_count=len(records) * len(filters) * 2)
+    sort_stats, _ = measure(
+        lambda: proxy.sort(CatalogTableModel.COLUMN_TITLE),
+        repeat=repeat,
+        item_count=len(records),
+    )
+    return {
+        "set_records": set_records_stats,
+        "filter": {**filter_stats, "filters": len(filters), "visible_rows": visible_rows},
+        "sort": sort_stats,
+    }
+
+
+def run_catalog_benchmark(
+    spec: SyntheticWorkshopSpec | None = None,
+    repeat: int = 5,
+    work_dir: str | None = None,
+    include_proxy: bool = True,
+) -> dict[str, Any]:
+    spec = spec or SyntheticWorkshopSpec()
+    with tempfile.TemporaryDirectory(prefix="repkg-bench-", dir=work_dir) as temp_dir:
+        with isolated_runtime(os.path.join(temp_dir, "runtime")):
+            workshop = generate_synthetic_workshop(temp_dir, spec)
+            item_count = len(workshop.item_ids)
+            csv_path = os.path.join(temp_dir, "runtime", "info.csv")
+
+            collect_stats, extracted_info = measure(
+                lambda: app_services.collect_workshop_info(workshop.steam_path),
+                repeat=repeat,
+                item_count=item_count,
+            )
+            write_stats, _ = measure(
+                lambda: app_services.write_info_csv(extracted_info, csv_path),
+                repeat=repeat,
+                item_count=item_count,
+            )
+            read_stats, dataframe = measure(
+                lambda: app_services.read_info_csv(csv_path),
+                repeat=repeat,
+                item_count=item_count,
+            )
+            records_stats, records = measure(
+                lambda: CatalogService.records_from_dataframe(dataframe),
+                repeat=repeat,
+                item_count=item_count,
+            )
+            snapshot = CatalogSnapshot(steam_path=workshop.steam_path, csv_path=csv_path, records=records)
+            write_snapshot_stats, snapshot_path = measure(
+                lambda: write_catalog_snapshot(snapshot),
+                repeat=repeat,
+                item_count=item_count,
+            )
+            read_snapshot_stats, _ = measure(
+                lambda: read_catalog_snapshot(snapshot_path, workshop.steam_path),
+                repeat=repeat,
+                item_count=item_count,
+            )
+            report: dict[str, Any] = {
+                "benchmark": "catalog",
+                "environment": environment_info(),
+                "spec": asdict(spec),
+                "items": item_count,
+                "broken_items": len(workshop.broken_ids),
+                "json_backend": app_services.get_json_backend().name,
+                "csv_bytes": os.path.getsize(csv_path),
+                "snapshot_bytes": os.path.getsize(snapshot_path),
+                "catalog_store_bytes": records.nbytes,
+                "results": {
+                    "collect_workshop_info": collect_stats,
+                    "write_info_csv": write_stats,
+                    "read_info_csv": read_stats,
+                    "records_from_dataframe": records_stats,
+                    "write_catalog_snapshot": write_snapshot_stats,
+                    "read_catalog_snapshot": read_snapshot_stats,
+                },
+            }
+            if include_proxy:
+                report["results"]["filter_proxy"] = _benchmark_filter_proxy(records, workshop.tags, repeat)
+    return report
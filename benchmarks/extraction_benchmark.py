@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any
+
+import app_services
+from benchmarks import fake_repkg
+from benchmarks.harness import environment_info, isolated_runtime
+from benchmarks.workshop_fixture import SyntheticWorkshop, SyntheticWorkshopSpec, generate_synthetic_workshop
+from repkg_gui.domain.entities import ExtractionItemResult, SessionSettings, WallpaperRecord
+from repkg_gui.domain.enums import OutputMode
+from repkg_gui.services.extraction_events import ExtractionEventLog
+from repkg_gui.services.extraction_service import ExtractionService
+from repkg_gui.services.runtime_compat import RuntimeCompatService
+
+FAKE_REPKG_SCRIPT = os.path.abspath(fake_repkg.__file__)
+DEFAULT_WORKER_COUNTS = (1, 2, 4)
+DEFAULT_BATCH_SIZES = (8, 32)
+DEFAULT_PKG_BYTES = 1024 * 1024
+
+
+@dataclass(frozen=True, slots=True)
+class FakeRepkgProfile:
+    latency_seconds: float = 0.05
+    seconds_per_mb: float = 0.0
+    files: int = 8
+    file_bytes: int = 4096
+    failure_rate: float = 0.0
+    seed: int = 0
+
+    def environment(self) -> dict[str, str]:
+        return {
+            fake_repkg.LATENCY_ENV: str(self.latency_seconds),
+            fake_repkg.SECONDS_PER_MB_ENV: str(self.seconds_per_mb),
+            fake_repkg.FILES_ENV: str(self.files),
+            fake_repkg.FILE_BYTES_ENV: str(self.file_bytes),
+            fake_repkg.FAILURE_RATE_ENV: str(self.failure_rate),
+            fake_repkg.SEED_ENV: str(self.seed),
+        }
+
+
+@contextmanager
+def fake_repkg_environment(profile: FakeRepkgProfile, script: str = FAKE_REPKG_SCRIPT) -> Iterator[None]:
+    overrides = {app_services.REPKG_EXECUTABLE_ENV: script, **profile.environment()}
+    originals = {name: os.environ.get(name) for name in overrides}
+    os.environ.update(overrides)
+    try:
+        yield
+    finally:
+        for name, value in originals.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+class ProgressSignalProbe:
+    def __init__(self) -> None:
+        from PySide6.QtCore import QObject, Signal
+
+        class ProgressEmitter(QObject):
+            item_progress = Signal(object)
+            item_finished = Signal(object)
+
+        self._emitter = ProgressEmitter()
+        self._lock = threading.Lock()
+        self.events = 0
+        self.emit_seconds = 0.0
+
+    def _timed(self, emit: Callable[[object], None]) -> Callable[[object], None]:
+        def callback(payload: object) -> None:
+            started_at = time.perf_counter()
+            emit(payload)
+            elapsed = time.perf_counter() - started_at
+            with self._lock:
+                self.events += 1
+                self.emit_seconds += elapsed
+
+        return callback
+
+    def progress_callback(self) -> Callable[[object], None]:
+        return self._timed(self._emitter.item_progress.emit)
+
+    def result_callback(self, results: list[ExtractionItemResult]) -> Callable[[ExtractionItemResult], None]:
+        emit = self._timed(self._emitter.item_finished.emit)
+
+        def callback(result: ExtractionItemResult) -> None:
+            results.append(result)
+            emit(result)
+
+        return callback
+
+
+def run_extraction_case(
+    service: ExtractionService,
+    workshop: SyntheticWorkshop,
+    records: Sequence[WallpaperRecord],
+    batch_size: int,
+    workers: int,
+    output_path: str,
+) -> dict[str, Any]:
+    settings = SessionSettings(
+        steam_path=workshop.steam_path,
+        output_path=output_path,
+        batch_extract_workers=workers,
+        output_mode=OutputMode.SEPARATE,
+        use_wallpaper_name_as_subdir=False,
+    )
+    plan = service.prepare_requests(records, workshop.scene_ids[:batch_size], workshop.steam_path)
+    probe = ProgressSignalProbe()
+    results: list[ExtractionItemResult] = []
+    started_at = time.perf_counter()
+    summary = service.execute_requests(
+        plan,
+        settings,
+        on_result=probe.result_callback(results),
+        on_item_progress=probe.progress_callback(),
+    )
+    wall_seconds = time.perf_counter() - started_at
+    app_services.flush_logs()
+    run_stats = service.events.summarize()[-1]
+
+    total_bytes = sum(request.pkg_bytes for request in plan.requests)
+    busy_seconds = sum(result.duration_seconds for result in results)
+    effective_workers = max(summary.effective_workers, 1)
+    return {
+        "batch_size": len(plan.requests),
+        "workers": workers,
+        "effective_workers": summary.effective_workers,
+        "succeeded": len(summary.succeeded),
+        "failed": len(summary.failed),
+        "wall_seconds": round(wall_seconds, 4),
+        "items_per_second": round(len(plan.requests) / wall_seconds, 2) if wall_seconds > 0 else 0.0,
+        "bytes_per_second": round(total_bytes / wall_seconds, 1) if wall_seconds > 0 else 0.0,
+        "worker_utilization": round(busy_seconds / (wall_seconds * effective_workers), 4) if wall_seconds > 0 else 0.0,
+        "mean_duration_seconds": round(run_stats.mean_duration_seconds, 4),
+        "p95_duration_seconds": round(run_stats.p95_duration_seconds, 4),
+        "mean_queue_wait_seconds": round(run_stats.mean_queue_wait_seconds, 4),
+        "progress_events": probe.events,
+        "progress_emit_seconds": round(probe.emit_seconds, 6),
+        "progress_overhead_ratio": round(probe.emit_seconds / wall_seconds, 6) if wall_seconds > 0 else 0.0,
+    }
+
+
+def run_extraction_benchmark(
+    worker_counts: Sequence[int] = DEFAULT_WORKER_COUNTS,
+    batch_sizes: Sequence[int] = DEFAULT_BATCH_SIZES,
+    profile: FakeRepkgProfile | None = None,
+    pkg_bytes: int = DEFAULT_PKG_BYTES,
+    repeat: int = 1,
+    work_dir: str | None = None,
+) -> dict[str, Any]:
+    profile = profile or FakeRepkgProfile()
+    cases = []
+    with tempfile.TemporaryDirectory(prefix="repkg-bench-", dir=work_dir) as temp_dir:
+        with isolated_runtime(os.path.join(temp_dir, "runtime")), fake_repkg_environment(profile):
+            workshop = generate_synthetic_workshop(
+                temp_dir,
+                SyntheticWorkshopSpec(
+                    item_count=max(batch_sizes),
+                    preview_formats=(),
+                    broken_json_rate=0.0,
+                    scene_rate=1.0,
+                    pkg_bytes=pkg_bytes,
+                    seed=profile.seed,
+                ),
+            )
+            runtime = RuntimeCompatService()
+            records = runtime.collect_workshop_items(workshop.steam_path, workshop.scene_ids)
+            for batch_size in batch_sizes:
+                for workers in worker_counts:
+                    for attempt in range(max(repeat, 1)):
+                        case_name = f"b{batch_size}-w{workers}-r{attempt}"
+                        service = ExtractionService(
+                            runtime=runtime,
+                            events=ExtractionEventLog(path=os.path.join(temp_dir, "events", f"{case_name}.jsonl")),
+                        )
+                        cases.append(
+                            run_extraction_case(
+                                service,
+                                workshop,
+                                records,
+                                batch_size,
+                                workers,
+                                os.path.join(temp_dir, "output", case_name),
+                            )
+                        )
+    return {
+        "benchmark": "extraction",
+        "environment": environment_info(),
+        "profile": asdict(profile),
+        "pkg_bytes": pkg_bytes,
+        "cases": cases,
+    }
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import os
+import sys
+import time
+import zlib
+
+LATENCY_ENV = "FAKE_REPKG_LATENCY_SECONDS"
+SECONDS_PER_MB_ENV = "FAKE_REPKG_SECONDS_PER_MB"
+FILES_ENV = "FAKE_REPKG_FILES"
+FILE_BYTES_ENV = "FAKE_REPKG_FILE_BYTES"
+FAILURE_RATE_ENV = "FAKE_REPKG_FAILURE_RATE"
+SEED_ENV = "FAKE_REPKG_SEED"
+
+
+def _read_float(name: str, default: float) -> float:
+    try:
+        return max(float(os.environ.get(name, default)), 0.0)
+    except ValueError:
+        return default
+
+
+def _read_int(name: str, default: int) -> int:
+    try:
+        return max(int(os.environ.get(name, default)), 0)
+    except ValueError:
+        return default
+
+
+def should_fail(scene_pkg_path: str, failure_rate: float, seed: int) -> bool:
+    if failure_rate <= 0:
+        return False
+    bucket = zlib.crc32(f"{seed}:{os.path.basename(os.path.dirname(scene_pkg_path))}".encode("utf-8")) % 10_000
+    return bucket < failure_rate * 10_000
+
+
+def parse_arguments(argv: list[str]) -> tuple[str, str]:
+    if len(argv) < 2 or argv[0] != "extract":
+        raise ValueError("用法: fake_repkg.py extract <scene.pkg> [-o <输出目录>]")
+    output_directory = ""
+    if "-o" in argv:
+        index = argv.index("-o")
+        if index + 1 >= len(argv):
+            raise ValueError("-o 缺少输出目录")
+        output_directory = argv[index + 1]
+    return argv[1], output_directory
+
+
+def main(argv: list[str] | None = None) -> int:
+    try:
+        scene_pkg_path, output_directory = parse_arguments(list(sys.argv[1:] if argv is None else argv))
+    except ValueError as exc:
+        print(exc, file=sys.stderr)
+        return 2
+    if not os.path.isfile(scene_pkg_path):
+        print(f"找不到文件: {scene_pkg_path}", file=sys.stderr)
+        return 1
+
+    pkg_megabytes = os.path.getsize(scene_pkg_path) / (1024 * 1024)
+    latency = _read_float(LATENCY_ENV, 0.05) + _read_float(SECONDS_PER_MB_ENV, 0.0) * pkg_megabytes
+    file_count = _read_int(FILES_ENV, 8)
+    file_bytes = _read_int(FILE_BYTES_ENV, 4096)
+    output_directory = output_directory or os.path.join(os.path.dirname(scene_pkg_path), "output")
+    os.makedirs(output_directory, exist_ok=True)
+
+    print(f"Extracting package: {scene_pkg_path}", flush=True)
+    step_seconds = latency / (file_count + 1)
+    payload = b"\0" * file_bytes
+    for index in range(file_count):
+        time.sleep(step_seconds)
+        entry = f"materials/fake_{index:04d}.tex"
+        print(f"* Writing: {entry}", flush=True)
+        entry_path = os.path.join(output_directory, entry)
+        os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+        with open(entry_path, "wb") as file:
+            file.write(payload)
+    time.sleep(step_seconds)
+
+    if should_fail(scene_pkg_path, _read_float(FAILURE_RATE_ENV, 0.0), _read_int(SEED_ENV, 0)):
+        print(f"Failed to extract {scene_pkg_path}: simulated failure", file=sys.stderr)
+        return 1
+    print("Done", flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
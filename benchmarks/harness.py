@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import os
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+import app_services
+from repkg_gui.app_metadata import APP_VERSION
+
+RUNTIME_PATH_ATTRIBUTES = {
+    "RUNTIME_DIR": "",
+    "CONFIG_FILE": "config.json",
+    "ERROR_LOG_FILE": "errors.txt",
+    "INFO_CSV_FILE": "info.csv",
+    "LOG_FILE": "logs.txt",
+}
+
+
+@dataclass(slots=True)
+class BenchmarkTimer:
+    samples: list[float] = field(default_factory=list)
+
+    @contextmanager
+    def sample(self) -> Iterator[None]:
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.samples.append(time.perf_counter() - started_at)
+
+    def to_json(self, item_count: int = 0) -> dict[str, Any]:
+        if not self.samples:
+            return {"runs": 0}
+        median_seconds = statistics.median(self.samples)
+        payload: dict[str, Any] = {
+            "runs": len(self.samples),
+            "min_seconds": round(min(self.samples), 6),
+            "median_seconds": round(median_seconds, 6),
+            "mean_seconds": round(statistics.fmean(self.samples), 6),
+            "max_seconds": round(max(self.samples), 6),
+        }
+        if item_count and median_seconds > 0:
+            payload["items_per_second"] = round(item_count / median_seconds, 1)
+        return payload
+
+
+def measure(
+    function: Callable[[], Any],
+    repeat: int = 5,
+    warmup: int = 1,
+    item_count: int = 0,
+) -> tuple[dict[str, Any], Any]:
+    result = None
+    for _ in range(max(warmup, 0)):
+        result = function()
+    timer = BenchmarkTimer()
+    for _ in range(max(repeat, 1)):
+        with timer.sample():
+            result = function()
+    return timer.to_json(item_count), result
+
+
+@contextmanager
+def isolated_runtime(runtime_dir: str) -> Iterator[str]:
+    os.makedirs(runtime_dir, exist_ok=True)
+    originals = {name: getattr(app_services, name) for name in RUNTIME_PATH_ATTRIBUTES}
+    for name, filename in RUNTIME_PATH_ATTRIBUTES.items():
+        setattr(app_services, name, os.path.join(runtime_dir, filename) if filename else runtime_dir)
+    app_services.invalidate_config_cache()
+    try:
+        yield runtime_dir
+    finally:
+        app_services.flush_logs()
+        for name, value in originals.items():
+            setattr(app_services, name, value)
+        app_services.invalidate_config_cache()
+
+
+def peak_memory_bytes() -> int | None:
+    if os.name == "nt":
+        return _windows_peak_working_set()
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _windows_peak_working_set() -> int | None:
+    import ctypes
+    from ctypes import wintypes
+
+    class ProcessMemoryCounters(ctypes.Structure):
+        _fields_ = [
+            ("cb", wintypes.DWORD),
+            ("PageFaultCount", wintypes.DWORD),
+            ("PeakWorkingSetSize", ctypes.c_size_t),
+            ("WorkingSetSize", ctypes.c_size_t),
+            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+            ("PagefileUsage", ctypes.c_size_t),
+            ("PeakPagefileUsage", ctypes.c_size_t),
+        ]
+
+    counters = ProcessMemoryCounters()
+    counters.cb = ctypes.sizeof(counters)
+    try:
+        process = ctypes.windll.kernel32.GetCurrentProcess()
+        if not ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+            return None
+    except (AttributeError, OSError):
+        return None
+    return int(counters.PeakWorkingSetSize)
+
+
+def distribution(samples: list[float]) -> dict[str, Any]:
+    if not samples:
+        return {"count": 0}
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 4),
+        "p50_ms": round(ordered[(len(ordered) - 1) // 2] * 1000, 4),
+        "p95_ms": round(ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)] * 1000, 4),
+        "max_ms": round(ordered[-1] * 1000, 4),
+    }
+
+
+def flatten_metrics(report: dict[str, Any], prefix: str = "") -> dict[str, float]:
+    metrics: dict[str, float] = {}
+    for key, value in report.items():
+        path = f"{prefix}.{key}" if prefix else str(key)
+        if isinstance(value, bool):
+            continue
+        if isinstance(value, (int, float)):
+            metrics[path] = float(value)
+        elif isinstance(value, dict) and key not in ("environment", "spec", "profile"):
+            metrics.update(flatten_metrics(value, path))
+        elif isinstance(value, list):
+            for index, entry in enumerate(value):
+                if isinstance(entry, dict):
+                    metrics.update(flatten_metrics(entry, f"{path}[{index}]"))
+    return metrics
+
+
+def compare_reports(baseline: dict[str, Any], current: dict[str, Any]) -> dict[str, Any]:
+    baseline_metrics = flatten_metrics(baseline)
+    current_metrics = flatten_metrics(current)
+    changes = {}
+    for path in sorted(baseline_metrics.keys() & current_metrics.keys()):
+        before = baseline_metrics[path]
+        after = current_metrics[path]
+        changes[path] = {
+            "baseline": before,
+            "current": after,
+            "change_percent": round((after - before) / before * 100, 2) if before else None,
+        }
+    return {
+        "benchmark": current.get("benchmark", ""),
+        "changes": changes,
+        "only_in_baseline": sorted(baseline_metrics.keys() - current_metrics.keys()),
+        "only_in_current": sorted(current_metrics.keys() - baseline_metrics.keys()),
+    }
+
+
+def environment_info() -> dict[str, Any]:
+    return {
+        "app_version": APP_VERSION,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count() or 1,
+    }
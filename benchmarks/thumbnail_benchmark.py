@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import time
+from collections import defaultdict
+from dataclasses import asdict
+from typing import Any
+
+from PySide6.QtCore import QSize, QThreadPool
+from PySide6.QtWidgets import QApplication
+
+from benchmarks.harness import distribution, environment_info, isolated_runtime, peak_memory_bytes
+from benchmarks.workshop_fixture import SyntheticWorkshopSpec, generate_synthetic_workshop
+from repkg_gui.models.catalog_table_model import CatalogTableModel
+from repkg_gui.models.thumbnail_cache import ThumbnailCache
+from repkg_gui.services.runtime_compat import RuntimeCompatService
+from repkg_gui.ui.widgets.thumbnail_view import THUMBNAIL_SIZE, ThumbnailView
+from repkg_gui.workers.thumbnail_loader import ThumbnailLoader, _ThumbnailLoadTask
+
+DEFAULT_VIEWPORT_SIZE = QSize(900, 700)
+DEFAULT_SCROLL_STEP_RATIO = 0.5
+LOAD_WAIT_TIMEOUT_SECONDS = 30.0
+
+
+def _ensure_application() -> QApplication:
+    application = QApplication.instance()
+    if application is None:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        application = QApplication([])
+    return application
+
+
+def benchmark_decode(records, size: QSize = THUMBNAIL_SIZE) -> dict[str, Any]:
+    loader = ThumbnailLoader()
+    loaded: list[str] = []
+    loader.thumbnail_loaded.connect(lambda key, _image: loaded.append(key))
+    durations_by_format: dict[str, list[float]] = defaultdict(list)
+    bytes_by_format: dict[str, int] = defaultdict(int)
+    for record in records:
+        if not record.preview_path:
+            continue
+        preview_format = os.path.splitext(record.preview_path)[1].lstrip(".").lower()
+        task = _ThumbnailLoadTask(loader, record.preview_path, record.preview_path, size)
+        started_at = time.perf_counter()
+        task.run()
+        durations_by_format[preview_format].append(time.perf_counter() - started_at)
+        bytes_by_format[preview_format] += os.path.getsize(record.preview_path)
+    loader.deleteLater()
+
+    formats = {}
+    for preview_format, durations in sorted(durations_by_format.items()):
+        total_seconds = sum(durations)
+        formats[preview_format] = {
+            **distribution(durations),
+            "images_per_second": round(len(durations) / total_seconds, 1) if total_seconds > 0 else 0.0,
+            "megabytes_per_second": round(bytes_by_format[preview_format] / 1_048_576 / total_seconds, 3)
+            if total_seconds > 0
+            else 0.0,
+        }
+    all_durations = [duration for durations in durations_by_format.values() for duration in durations]
+    total_seconds = sum(all_durations)
+    return {
+        "decoded": len(loaded),
+        "images_per_second": round(len(all_durations) / total_seconds, 1) if total_seconds > 0 else 0.0,
+        "formats": formats,
+    }
+
+
+def _wait_for_loads(application: QApplication, thread_pool: QThreadPool) -> None:
+    deadline = time.monotonic() + LOAD_WAIT_TIMEOUT_SECONDS
+    while time.monotonic() < deadline:
+        application.processEvents()
+        if thread_pool.waitForDone(10):
+            application.processEvents()
+            return
+
+
+def benchmark_scrolling(
+    application: QApplication,
+    records,
+    viewport_size: QSize = DEFAULT_VIEWPORT_SIZE,
+    passes: int = 2,
+) -> dict[str, Any]:
+    thread_pool = QThreadPool()
+    cache = ThumbnailCache()
+    view = ThumbnailView(cache=cache, loader=ThumbnailLoader(thread_pool=thread_pool))
+    model = CatalogTableModel(records)
+    view.setModel(model)
+    view.resize(viewport_size)
+    view.show()
+    application.processEvents()
+
+    scroll_bar = view.verticalScrollBar()
+    step = max(int(view.viewport().height() * DEFAULT_SCROLL_STEP_RATIO), 1)
+    positions = list(range(0, scroll_bar.maximum() + 1, step)) or [0]
+    results = []
+    for pass_index in range(max(passes, 1)):
+        cache.reset_stats()
+        frame_times = []
+        started_at = time.perf_counter()
+        for position in positions:
+            scroll_bar.setValue(position)
+            frame_started_at = time.perf_counter()
+            view.viewport().repaint()
+            frame_times.append(time.perf_counter() - frame_started_at)
+            application.processEvents()
+        scroll_seconds = time.perf_counter() - started_at
+        _wait_for_loads(application, thread_pool)
+        results.append(
+            {
+                "pass": pass_index,
+                "frames": len(frame_times),
+                "paint": distribution(frame_times),
+                "scroll_seconds": round(scroll_seconds, 4),
+                "cache_hits": cache.hit_count,
+                "cache_misses": cache.miss_count,
+                "cache_hit_rate": round(cache.hit_rate, 4),
+            }
+        )
+
+    report = {
+        "viewport": [viewport_size.width(), viewport_size.height()],
+        "scroll_step_pixels": step,
+        "passes": results,
+        "cached_thumbnails": cache.cached_count,
+        "cached_bytes": cache.cached_bytes,
+    }
+    view.close()
+    view.deleteLater()
+    application.processEvents()
+    return report
+
+
+def run_thumbnail_benchmark(
+    spec: SyntheticWorkshopSpec | None = None,
+    passes: int = 2,
+    viewport_size: QSize = DEFAULT_VIEWPORT_SIZE,
+    work_dir: str | None = None,
+) -> dict[str, Any]:
+    spec = spec or SyntheticWorkshopSpec(item_count=300, broken_json_rate=0.0)
+    application = _ensure_application()
+    with tempfile.TemporaryDirectory(prefix="repkg-bench-", dir=work_dir) as temp_dir:
+        with isolated_runtime(os.path.join(temp_dir, "runtime")):
+            workshop = generate_synthetic_workshop(temp_dir, spec)
+            records = tuple(RuntimeCompatService().collect_workshop_items(workshop.steam_path, workshop.item_ids))
+            decode = benchmark_decode(records)
+            scrolling = benchmark_scrolling(application, records, viewport_size, passes)
+    return {
+        "benchmark": "thumbnails",
+        "environment": environment_info(),
+        "spec": asdict(spec),
+        "items": len(records),
+        "results": {
+            "decode": decode,
+            "scrolling": scrolling,
+        },
+        "peak_memory_bytes": peak_memory_bytes(),
+    }
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import io
+import json
+import os
+import random
+from dataclasses import dataclass, field
+
+import app_services
+
+WALLPAPER_TYPES = ("scene", "video", "web", "application")
+PREVIEW_IMAGE_FORMATS = {"jpg": "JPEG", "png": "PNG", "gif": "GIF"}
+
+
+@dataclass(frozen=True, slots=True)
+class SyntheticWorkshopSpec:
+    item_count: int = 1000
+    tag_count: int = 40
+    tags_per_item: int = 3
+    preview_formats: tuple[str, ...] = ("jpg", "png", "gif")
+    preview_size: tuple[int, int] = (256, 256)
+    broken_json_rate: float = 0.02
+    scene_rate: float = 0.7
+    properties_per_item: int = 0
+    pkg_bytes: int = 0
+    seed: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class SyntheticWorkshop:
+    steam_path: str
+    workshop_directory: str
+    item_ids: tuple[str, ...]
+    scene_ids: tuple[str, ...]
+    broken_ids: tuple[str, ...]
+    tags: tuple[str, ...] = field(default_factory=tuple)
+
+
+def render_preview_images(formats: tuple[str, ...], size: tuple[int, int]) -> dict[str, bytes]:
+    from PIL import Image
+
+    rendered = {}
+    for index, preview_format in enumerate(formats):
+        image_format = PREVIEW_IMAGE_FORMATS.get(preview_format.lower())
+        if image_format is None:
+            raise ValueError(f"不支持的预览图格式: {preview_format}")
+        image = Image.new("RGB", size, ((index * 80) % 256, 120, 200))
+        buffer = io.BytesIO()
+        if image_format == "GIF":
+            frames = [Image.new("RGB", size, (200, (frame * 60) % 256, 80)) for frame in range(3)]
+            image.save(buffer, format=image_format, save_all=True, append_images=frames, duration=80, loop=0)
+        else:
+            image.save(buffer, format=image_format)
+        rendered[preview_format.lower()] = buffer.getvalue()
+    return rendered
+
+
+def build_general_properties(count: int) -> dict[str, object]:
+    property_types = ("slider", "color", "bool", "combo", "textinput")
+    return {
+        "properties": {
+            f"property_{index}": {
+                "order": index,
+                "text": f"ui_browse_properties_option_{index}",
+                "type": property_types[index % len(property_types)],
+                "value": index / max(count, 1),
+                "min": 0,
+                "max": 100,
+                "options": [{"label": f"option_{choice}", "value": str(choice)} for choice in range(4)],
+            }
+            for index in range(count)
+        },
+        "supportsaudioprocessing": True,
+    }
+
+
+def generate_synthetic_workshop(root: str, spec: SyntheticWorkshopSpec | None = None) -> SyntheticWorkshop:
+    spec = spec or SyntheticWorkshopSpec()
+    random_source = random.Random(spec.seed)
+    steam_dir = os.path.join(root, "Steam")
+    workshop_directory = app_services.get_workshop_directory(os.path.join(steam_dir, "steam.exe"))
+    os.makedirs(workshop_directory, exist_ok=True)
+    steam_path = os.path.join(steam_dir, "steam.exe")
+    with open(steam_path, "wb"):
+        pass
+
+    previews = render_preview_images(spec.preview_formats, spec.preview_size) if spec.preview_formats else {}
+    preview_formats = tuple(previews)
+    tags = tuple(f"Tag{index:03d}" for index in range(max(spec.tag_count, 1)))
+    general = build_general_properties(spec.properties_per_item) if spec.properties_per_item > 0 else None
+    pkg_payload = b"\0" * spec.pkg_bytes
+    item_ids = []
+    scene_ids = []
+    broken_ids = []
+    for index in range(spec.item_count):
+        item_id = str(1_000_000_000 + index)
+        item_dir = os.path.join(workshop_directory, item_id)
+        os.makedirs(item_dir, exist_ok=True)
+        item_ids.append(item_id)
+
+        wallpaper_type = "scene" if random_source.random() < spec.scene_rate else random_source.choice(WALLPAPER_TYPES[1:])
+        preview_name = ""
+        if preview_formats:
+            preview_format = preview_formats[index % len(preview_formats)]
+            preview_name = f"preview.{preview_format}"
+            with open(os.path.join(item_dir, preview_name), "wb") as file:
+                file.write(previews[preview_format])
+
+        project_data = {
+            "title": f"Synthetic Wallpaper {index}",
+            "type": wallpaper_type,
+            "tags": random_source.sample(tags, min(spec.tags_per_item, len(tags))),
+            "preview": preview_name,
+            "file": "scene.json" if wallpaper_type == "scene" else "index.html",
+            "visibility": random_source.choice(("public", "friends", "private")),
+        }
+        if general is not None:
+            project_data["general"] = general
+        project_text = json.dumps(project_data, ensure_ascii=False)
+        if random_source.random() < spec.broken_json_rate:
+            project_text = project_text[: len(project_text) // 2]
+            broken_ids.append(item_id)
+        with open(os.path.join(item_dir, "project.json"), "w", encoding="utf-8") as file:
+            file.write(project_text)
+
+        if wallpaper_type == "scene":
+            scene_ids.append(item_id)
+            with open(os.path.join(item_dir, "scene.pkg"), "wb") as file:
+                file.write(pkg_payload)
+
+    return SyntheticWorkshop(
+        steam_path=steam_path,
+        workshop_directory=workshop_directory,
+        item_ids=tuple(item_ids),
+        scene_ids=tuple(scene_ids),
+        broken_ids=tuple(broken_ids),
+        tags=tags,
+    )
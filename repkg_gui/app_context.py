@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import os
+import time
 from collections.abc import Iterable
+from typing import Any
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, QTimer, Signal
 
 from app_services import (
     AppConfig,
@@ -11,13 +13,18 @@ from app_services import (
     THEME_COLOR_KEYS,
     THEME_PRESETS,
     load_config,
-    write_config_value,
+    log_error,
+    normalize_config_data,
     write_config_values,
 )
+from repkg_gui.domain.catalog_store import freeze_records
 from repkg_gui.domain.entities import SessionSettings, WallpaperRecord
 
 from .state.session_state import SessionState
 
+CONFIG_WRITE_DELAY_MS = 200
+CONFIG_WRITE_MAX_DELAY_SECONDS = 1.0
+
 
 def is_valid_steam_path(path: str) -> bool:
     normalized = str(path or "").strip()
@@ -36,6 +43,12 @@ class AppContext(QObject):
     def __init__(self, state: SessionState):
         super().__init__()
         self.state = state
+        self._pending_config_updates: dict[str, Any] = {}
+        self._pending_config_since: float | None = None
+        self._config_write_timer = QTimer(self)
+        self._config_write_timer.setSingleShot(True)
+        self._config_write_timer.setInterval(CONFIG_WRITE_DELAY_MS)
+        self._config_write_timer.timeout.connect(self.flush_config_writes)
 
     @classmethod
     def from_config(cls, config: AppConfig) -> "AppContext":
@@ -45,10 +58,46 @@ class AppContext(QObject):
         return is_valid_steam_path(self.state.steam_path)
 
     def refresh_config(self) -> None:
+        if self._pending_config_updates:
+            self.flush_config_writes()
+            return
+        self.state.config = load_config()
+        self.config_changed.emit()
+        self.session_changed.emit()
+
+    @property
+    def has_pending_config_writes(self) -> bool:
+        return bool(self._pending_config_updates)
+
+    def flush_config_writes(self) -> None:
+        self._config_write_timer.stop()
+        if not self._pending_config_updates:
+            return
+
+        updates = self._pending_config_updates
+        self._pending_config_updates = {}
+        self._pending_config_since = None
+        try:
+            write_config_values(updates)
+        except OSError as exc:
+            log_error(f"保存配置失败: {exc}")
+            self.set_status(f"保存配置失败：{exc}")
         self.state.config = load_config()
         self.config_changed.emit()
         self.session_changed.emit()
 
+    def _queue_config_updates(self, updates: dict[str, Any]) -> None:
+        self._pending_config_updates.update(updates)
+        self.state.config = normalize_config_data({**self.state.config.to_dict(), **updates})
+        now = time.monotonic()
+        if self._pending_config_since is None:
+            self._pending_config_since = now
+        if (
+            not self._config_write_timer.isActive()
+            or now - self._pending_config_since < CONFIG_WRITE_MAX_DELAY_SECONDS
+        ):
+            self._config_write_timer.start()
+
     def set_status(self, message: str) -> None:
         self.state.status_message = message
         self.status_changed.emit(message)
@@ -62,6 +111,9 @@ class AppContext(QObject):
             steam_path=self.state.steam_path,
             output_path=self.state.output_path,
             batch_extract_workers=self.state.batch_extract_workers,
+            adaptive_batch_extract_workers=self.state.adaptive_batch_extract_workers,
+            extract_timeout_seconds=self.state.extract_timeout_seconds,
+            extract_timeout_seconds_per_gb=self.state.extract_timeout_seconds_per_gb,
             output_mode=self.state.output_mode,
             not_convert_tex_to_image=self.state.not_convert_tex_to_image,
             use_wallpaper_name_as_subdir=self.state.use_wallpaper_name_as_subdir,
@@ -75,8 +127,8 @@ class AppContext(QObject):
 
     def set_steam_path(self, steam_path: str) -> None:
         normalized = os.path.normpath(str(steam_path or "").strip()) if steam_path else ""
-        write_config_value("steam_path", normalized)
-        self.refresh_config()
+        self._queue_config_updates({"steam_path": normalized})
+        self.flush_config_writes()
         self.steam_path_changed.emit(self.state.steam_path)
         if self.has_valid_steam_path():
             self.set_status(f"已设置 steam.exe 路径：{self.state.steam_path}")
@@ -84,15 +136,37 @@ class AppContext(QObject):
             self.set_status("steam.exe 路径无效，请重新选择。")
 
     def set_output_path(self, output_path: str) -> None:
-        write_config_value("output_path", str(output_path or "").strip())
-        self.refresh_config()
+        self._queue_config_updates({"output_path": str(output_path or "").strip()})
         self.set_status(f"已更新输出目录：{self.state.output_path}")
 
     def set_batch_extract_workers(self, workers: int) -> None:
-        write_config_value("batch_extract_workers", int(workers))
-        self.refresh_config()
+        self._queue_config_updates({"batch_extract_workers": int(workers)})
         self.set_status(f"已更新批量提取并发：{self.state.batch_extract_workers}")
 
+    def set_adaptive_batch_extract_workers(self, enabled: bool) -> None:
+        self._queue_config_updates({"adaptive_batch_extract_workers": bool(enabled)})
+        state_text = "开启" if self.state.adaptive_batch_extract_workers else "关闭"
+        self.set_status(f"已{state_text}自适应批量提取并发")
+
+    def set_watch_workshop(self, enabled: bool) -> None:
+        self._queue_config_updates({"watch_workshop": bool(enabled)})
+        self.flush_config_writes()
+        state_text = "开启" if self.state.watch_workshop else "关闭"
+        self.set_status(f"已{state_text}创意工坊目录监视")
+
+    def set_auto_extract_new_items(self, enabled: bool) -> None:
+        self._queue_config_updates({"auto_extract_new_items": bool(enabled)})
+        state_text = "开启" if self.state.auto_extract_new_items else "关闭"
+        self.set_status(f"已{state_text}新订阅自动提取")
+
+    def set_extract_timeout_seconds(self, seconds: int) -> None:
+        self._queue_config_updates({"extract_timeout_seconds": int(seconds)})
+        self.set_status(f"已更新单项提取超时：{self.state.extract_timeout_seconds} 秒")
+
+    def set_extract_timeout_seconds_per_gb(self, seconds: int) -> None:
+        self._queue_config_updates({"extract_timeout_seconds_per_gb": int(seconds)})
+        self.set_status(f"已更新每 GB 追加超时：{self.state.extract_timeout_seconds_per_gb} 秒")
+
     def set_theme_preset(self, preset: str) -> None:
         normalized_preset = str(preset or "").strip().lower()
         if normalized_preset not in THEME_PRESETS and normalized_preset != CUSTOM_THEME_PRESET:
@@ -101,16 +175,14 @@ class AppContext(QObject):
         updates = {"theme_preset": normalized_preset}
         if normalized_preset in THEME_PRESETS:
             updates.update(THEME_PRESETS[normalized_preset])
-        write_config_values(updates)
-        self.refresh_config()
+        self._queue_config_updates(updates)
         self.set_status(f"已切换主题预设：{self.state.config.theme_preset}")
 
     def set_theme_color(self, color_name: str, color_value: str) -> None:
         if color_name not in THEME_COLOR_KEYS:
             raise KeyError(f"Unknown theme color: {color_name}")
 
-        write_config_values({"theme_preset": CUSTOM_THEME_PRESET, color_name: color_value})
-        self.refresh_config()
+        self._queue_config_updates({"theme_preset": CUSTOM_THEME_PRESET, color_name: color_value})
         self.set_status(f"已更新主题颜色：{color_name}")
 
     def set_output_mode(self, output_mode: str) -> None:
@@ -119,7 +191,7 @@ class AppContext(QObject):
         self.set_status(f"当前输出模式：{output_mode}")
 
     def set_catalog_records(self, records: Iterable[WallpaperRecord]) -> None:
-        normalized_records = tuple(records)
+        normalized_records = freeze_records(records)
         self.state.catalog_records = normalized_records
         self.state.catalog_count = len(normalized_records)
         valid_ids = {record.id for record in normalized_records if record.id}
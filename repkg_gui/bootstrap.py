@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import argparse
 import sys
 from collections.abc import Sequence
 
-from app_services import ensure_config_file, load_config
+from app_services import ensure_config_file, flush_logs, load_config
+
+from . import instrumentation
+from .profiling import DEFAULT_PROFILE_MODE, DEFAULT_PROFILE_SECONDS, PROFILE_MODES
 
 
 def main(argv: Sequence[str] | None = None) -> int:
@@ -14,18 +18,22 @@ def main(argv: Sequence[str] | None = None) -> int:
         print(f"Import error: {exc}", file=sys.stderr)
         return 1
 
+    arguments = list(argv) if argv is not None else list(sys.argv)
+    launch_args, qt_arguments = build_launch_parser().parse_known_args(arguments[1:])
     app = QApplication.instance()
     if app is None:
-        app = QApplication(list(argv) if argv is not None else sys.argv)
+        app = QApplication([*arguments[:1], *qt_arguments])
 
     app.setApplicationName("RePKG_GUI")
     app.setOrganizationName("FLmhp")
+    app.aboutToQuit.connect(flush_logs)
+    instrumentation.mark("startup.qt_ready")
 
     ensure_config_file()
     context = _build_context()
+    app.aboutToQuit.connect(context.flush_config_writes)
     from .theme import apply_theme
 
-    from .ui.dialogs.steam_path_dialog import SteamPathDialog
     from .ui.main_window import MainWindow
 
     from .controllers.extraction_controller import ExtractionController
@@ -38,6 +46,8 @@ def main(argv: Sequence[str] | None = None) -> int:
 
     if not context.has_valid_steam_path():
         context.set_status("未检测到有效的 steam.exe 路径，请先完成设置。")
+        from .ui.dialogs.steam_path_dialog import SteamPathDialog
+
         dialog = SteamPathDialog(context, parent=window)
         if dialog.exec() != QDialog.DialogCode.Accepted:
             return 0
@@ -47,10 +57,21 @@ def main(argv: Sequence[str] | None = None) -> int:
     window.show()
     window.raise_()
     window.activateWindow()
+    instrumentation.mark("startup.window_shown")
+    app.aboutToQuit.connect(window.diagnostics_controller.stop_profiling)
+    if launch_args.profile is not None:
+        window.diagnostics_controller.start_profiling(launch_args.profile, launch_args.profile_mode)
 
     return app.exec()
 
 
+def build_launch_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m repkg_gui", add_help=False, allow_abbrev=False)
+    parser.add_argument("--profile", type=float, nargs="?", const=DEFAULT_PROFILE_SECONDS, metavar="SECONDS")
+    parser.add_argument("--profile-mode", choices=PROFILE_MODES, default=DEFAULT_PROFILE_MODE)
+    return parser
+
+
 def _build_context():
     from .app_context import AppContext
 
@@ -0,0 +1,425 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import signal
+import sys
+import threading
+from collections.abc import Sequence
+from dataclasses import replace
+from typing import Any, TextIO
+
+import app_services
+from repkg_gui.domain.entities import (
+    CatalogSnapshot,
+    ExtractionItemProgress,
+    ExtractionItemResult,
+    ExtractionPlan,
+    ExtractionSummary,
+    FilterState,
+    SessionSettings,
+    WallpaperRecord,
+)
+from repkg_gui.domain.enums import FilterField, OutputMode
+from repkg_gui.job_server import DEFAULT_JOB_SERVER_HOST, DEFAULT_JOB_SERVER_PORT, create_job_server, is_loopback_host
+from repkg_gui.models.selection_model import filter_records
+from repkg_gui.profiling import DEFAULT_PROFILE_MODE, DEFAULT_PROFILE_SECONDS, PROFILE_MODES, ProfileSession
+from repkg_gui.services.catalog_service import CatalogService
+from repkg_gui.services.catalog_snapshot_store import get_snapshot_path
+from repkg_gui.services.extraction_jobs import DEFAULT_MAX_CONCURRENT_JOBS
+from repkg_gui.services.extraction_service import (
+    ExtractionCancelToken,
+    ExtractionService,
+    ExtractionValidationError,
+)
+from repkg_gui.services.runtime_compat import RuntimeCompatService
+
+EXIT_OK = 0
+EXIT_EXTRACTION_FAILED = 1
+EXIT_USAGE_ERROR = 2
+EXIT_NOTHING_TO_DO = 3
+EXIT_CANCELLED = 130
+CLI_JOIN_INTERVAL_SECONDS = 0.2
+
+
+class CliError(Exception):
+    def __init__(self, message: str, exit_code: int = EXIT_USAGE_ERROR) -> None:
+        super().__init__(message)
+        self.exit_code = exit_code
+
+
+class JsonEventWriter:
+    def __init__(self, stream: TextIO | None = None) -> None:
+        self._stream = stream or sys.stdout
+        self._lock = threading.Lock()
+
+    def emit(self, event: str, **payload: Any) -> None:
+        line = json.dumps({"event": event, **payload}, ensure_ascii=False)
+        with self._lock:
+            self._stream.write(line + "\n")
+            self._stream.flush()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m repkg_gui.cli", description="RePKG_GUI 无界面命令行")
+    parser.add_argument("--steam-path", help="steam.exe 路径，默认读取 runtime\\config.json")
+    parser.add_argument(
+        "--profile",
+        type=float,
+        nargs="?",
+        const=DEFAULT_PROFILE_SECONDS,
+        metavar="SECONDS",
+        help="采集性能剖析，最多持续 SECONDS 秒（默认 30 秒），到时停止 cProfile 与栈采样，结果写入 runtime\\profiles",
+    )
+    parser.add_argument(
+        "--profile-mode",
+        choices=PROFILE_MODES,
+        default=DEFAULT_PROFILE_MODE,
+        help="cprofile 写出主线程 pstats，sample 写出所有线程的折叠栈，both 同时写出两者",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    scan_parser = subparsers.add_parser("scan", help="重新扫描本地 Workshop 并刷新 info.csv")
+    scan_parser.set_defaults(handler=run_scan)
+
+    list_parser = subparsers.add_parser("list", help="按条件列出壁纸")
+    _add_catalog_arguments(list_parser)
+    list_parser.set_defaults(handler=run_list)
+
+    extract_parser = subparsers.add_parser("extract", help="按 ID 或筛选条件批量提取")
+    _add_catalog_arguments(extract_parser)
+    extract_parser.add_argument("ids", nargs="*", help="要提取的壁纸 ID")
+    extract_parser.add_argument("--all", action="store_true", help="提取筛选后的全部壁纸")
+    extract_parser.add_argument("--output", help="输出目录，默认读取配置")
+    extract_parser.add_argument(
+        "--output-mode",
+        choices=[mode.value for mode in OutputMode],
+        default=OutputMode.SEPARATE.value,
+        help="输出模式：local / shared / separate",
+    )
+    extract_parser.add_argument("--workers", type=int, help="并发数，0 表示自动")
+    extract_parser.add_argument("--adaptive-workers", action="store_true", help="按吞吐自适应调整并发")
+    extract_parser.add_argument("--timeout", type=int, help="单项基础超时秒数，0 表示不限制")
+    extract_parser.add_argument("--no-tex-convert", action="store_true", help="不把 TEX 转换为图像")
+    extract_parser.add_argument("--id-subdir", action="store_true", help="用壁纸 ID 而不是名称作为子目录")
+    extract_parser.add_argument("--copy-extras", action="store_true", help="复制 project.json 与预览图")
+    extract_parser.add_argument("--no-overwrite", action="store_true", help="不覆盖已有文件")
+    extract_parser.add_argument("--no-item-progress", action="store_true", help="不输出单项实时进度")
+    extract_parser.set_defaults(handler=run_extract)
+
+    serve_parser = subparsers.add_parser("serve", help="在本机回环地址上启动提取任务服务")
+    serve_parser.add_argument("--host", default=DEFAULT_JOB_SERVER_HOST, help="监听地址，只允许回环地址")
+    serve_parser.add_argument("--port", type=int, default=DEFAULT_JOB_SERVER_PORT, help="监听端口，0 表示随机端口")
+    serve_parser.add_argument("--workers", type=int, help="所有任务共享的 RePKG 并发上限，0 表示自动")
+    serve_parser.add_argument(
+        "--max-jobs",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENT_JOBS,
+        help="同时运行的任务数",
+    )
+    serve_parser.set_defaults(handler=run_serve)
+    return parser
+
+
+def _add_catalog_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--tag", help="按标签筛选（包含匹配，不区分大小写）")
+    parser.add_argument("--type", dest="wallpaper_type", help="按类型筛选")
+    parser.add_argument("--title", help="按标题筛选")
+    parser.add_argument("--rescan", action="store_true", help="先重新扫描 Workshop 再读取")
+
+
+def build_filter_states(args: argparse.Namespace) -> tuple[FilterState, ...]:
+    candidates = (
+        (FilterField.TAGS, args.tag),
+        (FilterField.TYPE, args.wallpaper_type),
+        (FilterField.TITLE, args.title),
+    )
+    return tuple(FilterState(field=field, value=value) for field, value in candidates if value)
+
+
+def record_to_json(record: WallpaperRecord) -> dict[str, Any]:
+    return {
+        "id": record.id,
+        "title": record.title,
+        "type": record.type,
+        "tags": list(record.tags),
+        "visibility": record.visibility,
+    }
+
+
+def result_to_json(result: ExtractionItemResult) -> dict[str, Any]:
+    return {
+        "item_id": result.item_id,
+        "title": result.title,
+        "success": result.success,
+        "returncode": result.returncode,
+        "cancelled": result.cancelled,
+        "timed_out": result.timed_out,
+        "duration_seconds": round(result.duration_seconds, 3),
+        "error": result.error,
+    }
+
+
+def summary_to_json(summary: ExtractionSummary) -> dict[str, Any]:
+    return {
+        "requested": summary.requested_count,
+        "succeeded": list(summary.success_ids),
+        "failed": list(summary.failed_ids),
+        "timed_out": list(summary.timed_out_ids),
+        "cancelled": list(summary.cancelled_ids),
+        "skipped": [{"item_id": item.item_id, "reason": item.reason} for item in summary.skipped],
+        "effective_workers": summary.effective_workers,
+    }
+
+
+def resolve_steam_path(args: argparse.Namespace, runtime: RuntimeCompatService) -> str:
+    steam_path = args.steam_path or runtime.load_config().steam_path
+    return os.path.normpath(steam_path) if steam_path else ""
+
+
+def load_catalog(
+    args: argparse.Namespace,
+    catalog_service: CatalogService,
+    steam_path: str,
+) -> CatalogSnapshot:
+    csv_path = app_services.INFO_CSV_FILE
+    has_cache = os.path.exists(csv_path) or os.path.exists(get_snapshot_path(csv_path))
+    if getattr(args, "rescan", False) or not has_cache:
+        if not catalog_service.runtime.has_valid_steam_path(steam_path):
+            raise CliError("steam.exe 路径无效，无法扫描 Workshop")
+        return catalog_service.scan_catalog(steam_path)
+    return catalog_service.load_cached_snapshot(csv_path, steam_path=steam_path)
+
+
+def build_cli_settings(args: argparse.Namespace, runtime: RuntimeCompatService, steam_path: str) -> SessionSettings:
+    settings = replace(
+        runtime.session_settings_from_config(),
+        steam_path=steam_path,
+        output_mode=OutputMode(args.output_mode),
+        not_convert_tex_to_image=args.no_tex_convert,
+        use_wallpaper_name_as_subdir=not args.id_subdir,
+        copy_project_json_and_preview=args.copy_extras,
+        overwrite_files=not args.no_overwrite,
+    )
+    if args.output:
+        settings = replace(settings, output_path=args.output)
+    if args.workers is not None:
+        settings = replace(settings, batch_extract_workers=max(args.workers, 0))
+    if args.adaptive_workers:
+        settings = replace(settings, adaptive_batch_extract_workers=True)
+    if args.timeout is not None:
+        settings = replace(settings, extract_timeout_seconds=max(args.timeout, 0))
+    return settings
+
+
+def select_item_ids(args: argparse.Namespace, records: Sequence[WallpaperRecord]) -> tuple[str, ...]:
+    filter_states = build_filter_states(args)
+    requested_ids = tuple(str(item_id).strip() for item_id in args.ids if str(item_id).strip())
+    if requested_ids:
+        allowed_ids = {record.id for record in filter_records(records, filter_states)}
+        return tuple(item_id for item_id in requested_ids if not filter_states or item_id in allowed_ids)
+    if not args.all and not filter_states:
+        raise CliError("请指定壁纸 ID、筛选条件或 --all")
+    return tuple(record.id for record in filter_records(records, filter_states) if record.id)
+
+
+def run_scan(args: argparse.Namespace, writer: JsonEventWriter) -> int:
+    catalog_service = CatalogService()
+    steam_path = resolve_steam_path(args, catalog_service.runtime)
+    if not catalog_service.runtime.has_valid_steam_path(steam_path):
+        raise CliError("steam.exe 路径无效，无法扫描 Workshop")
+    snapshot = catalog_service.scan_catalog(steam_path)
+    writer.emit("scanned", count=len(snapshot.records), csv_path=snapshot.csv_path)
+    return EXIT_OK
+
+
+def run_list(args: argparse.Namespace, writer: JsonEventWriter) -> int:
+    catalog_service = CatalogService()
+    steam_path = resolve_steam_path(args, catalog_service.runtime)
+    snapshot = load_catalog(args, catalog_service, steam_path)
+    records = filter_records(snapshot.records, build_filter_states(args))
+    for record in records:
+        writer.emit("record", **record_to_json(record))
+    writer.emit("listed", count=len(records), total=len(snapshot.records))
+    return EXIT_OK if records else EXIT_NOTHING_TO_DO
+
+
+def run_extract(args: argparse.Namespace, writer: JsonEventWriter) -> int:
+    runtime = RuntimeCompatService()
+    catalog_service = CatalogService(runtime=runtime)
+    extraction_service = ExtractionService(runtime=runtime)
+    steam_path = resolve_steam_path(args, runtime)
+    settings = build_cli_settings(args, runtime, steam_path)
+    snapshot = load_catalog(args, catalog_service, steam_path)
+    item_ids = select_item_ids(args, snapshot.records)
+    if not item_ids:
+        writer.emit("finished", **summary_to_json(ExtractionSummary(requested_count=0)))
+        return EXIT_NOTHING_TO_DO
+
+    try:
+        extraction_service.validate_environment(settings)
+    except ExtractionValidationError as exc:
+        raise CliError(str(exc)) from exc
+
+    plan = extraction_service.prepare_requests(snapshot.records, item_ids, settings.steam_path)
+    writer.emit(
+        "started",
+        requested=plan.total_count,
+        executable=len(plan.requests),
+        skipped=len(plan.skipped),
+        workers=extraction_service.resolve_effective_workers(plan, settings),
+    )
+    summary = _execute_with_interrupts(extraction_service, plan, settings, writer, not args.no_item_progress)
+    writer.emit("finished", **summary_to_json(summary))
+    if summary.was_cancelled:
+        return EXIT_CANCELLED
+    if summary.failed or summary.skipped:
+        return EXIT_EXTRACTION_FAILED
+    return EXIT_OK
+
+
+def run_serve(args: argparse.Namespace, writer: JsonEventWriter) -> int:
+    if not is_loopback_host(args.host):
+        raise CliError(f"任务服务只能绑定到本机回环地址: {args.host}")
+
+    try:
+        server = create_job_server(
+            host=args.host,
+            port=args.port,
+            steam_path=args.steam_path or "",
+            workers=max(args.workers, 0) if args.workers is not None else None,
+            max_concurrent_jobs=max(args.max_jobs, 1),
+        )
+    except OSError as exc:
+        raise CliError(f"无法启动任务服务: {exc}") from exc
+
+    writer.emit("serving", url=server.url, workers=server.queue.worker_budget.max_workers)
+    serve_thread = threading.Thread(target=server.serve_forever, name="repkg-job-server", daemon=True)
+    serve_thread.start()
+    try:
+        while serve_thread.is_alive():
+            serve_thread.join(CLI_JOIN_INTERVAL_SECONDS)
+    except KeyboardInterrupt:
+        writer.emit("stopping")
+    finally:
+        server.close()
+    writer.emit("stopped")
+    return EXIT_OK
+
+
+def _execute_with_interrupts(
+    extraction_service: ExtractionService,
+    plan: ExtractionPlan,
+    settings: SessionSettings,
+    writer: JsonEventWriter,
+    report_item_progress: bool,
+) -> ExtractionSummary:
+    cancel_token = ExtractionCancelToken()
+    completed_lock = threading.Lock()
+    completed = len(plan.skipped)
+    outcome: dict[str, Any] = {}
+
+    def on_result(result: ExtractionItemResult) -> None:
+        nonlocal completed
+        with completed_lock:
+            completed += 1
+            current = completed
+        writer.emit("item", completed=current, total=plan.total_count, **result_to_json(result))
+
+    def on_item_progress(progress: ExtractionItemProgress) -> None:
+        writer.emit(
+            "item_progress",
+            item_id=progress.item_id,
+            files_extracted=progress.files_extracted,
+            bytes_extracted=progress.bytes_extracted,
+            current_entry=progress.current_entry,
+        )
+
+    def run() -> None:
+        try:
+            outcome["summary"] = extraction_service.execute_requests(
+                plan,
+                settings,
+                on_result=on_result,
+                cancel_token=cancel_token,
+                on_item_progress=on_item_progress if report_item_progress else None,
+            )
+        except BaseException as exc:
+            outcome["error"] = exc
+
+    def handle_interrupt(_signum, _frame) -> None:
+        if cancel_token.is_cancelled:
+            raise KeyboardInterrupt
+        cancel_token.cancel()
+        writer.emit("cancelling")
+
+    install_handler = threading.current_thread() is threading.main_thread()
+    previous_handler = signal.signal(signal.SIGINT, handle_interrupt) if install_handler else None
+    runner = threading.Thread(target=run, name="repkg-cli-extract", daemon=True)
+    try:
+        runner.start()
+        while runner.is_alive():
+            runner.join(CLI_JOIN_INTERVAL_SECONDS)
+    finally:
+        if install_handler:
+            signal.signal(signal.SIGINT, previous_handler)
+
+    if "error" in outcome:
+        error = outcome["error"]
+        if isinstance(error, ExtractionValidationError):
+            raise CliError(str(error)) from error
+        raise error
+    return outcome["summary"]
+
+
+def _with_default_profile_seconds(arguments: list[str]) -> list[str]:
+    if "--profile" not in arguments:
+        return arguments
+    index = arguments.index("--profile") + 1
+    if index < len(arguments) and not arguments[index].startswith("-"):
+        try:
+            float(arguments[index])
+        except ValueError:
+            return [*arguments[:index], str(DEFAULT_PROFILE_SECONDS), *arguments[index:]]
+    return arguments
+
+
+def main(argv: Sequence[str] | None = None, stream: TextIO | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(_with_default_profile_seconds(list(argv) if argv is not None else sys.argv[1:]))
+    writer = JsonEventWriter(stream)
+    profile_session: ProfileSession | None = None
+    profile_timer: threading.Timer | None = None
+    try:
+        if args.profile is not None:
+            profile_session = ProfileSession(args.profile, args.profile_mode).start()
+            profile_timer = threading.Timer(profile_session.duration_seconds, profile_session.stop)
+            profile_timer.daemon = True
+            profile_timer.start()
+        return args.handler(args, writer)
+    except CliError as exc:
+        writer.emit("error", message=str(exc))
+        return exc.exit_code
+    except (OSError, ValueError) as exc:
+        app_services.log_error(f"命令行执行失败: {exc}")
+        writer.emit("error", message=str(exc))
+        return EXIT_USAGE_ERROR
+    finally:
+        if profile_timer is not None:
+            profile_timer.cancel()
+        if profile_session is not None:
+            result = profile_session.stop()
+            writer.emit(
+                "profile",
+                mode=result.mode,
+                duration_seconds=result.duration_seconds,
+                samples=result.sample_count,
+                pstats=result.pstats_path,
+                collapsed=result.collapsed_path,
+            )
+        app_services.flush_logs()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
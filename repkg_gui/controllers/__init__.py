@@ -1,7 +1,11 @@
-__all__ = ["LibraryController"]
+__all__ = ["DiagnosticsController", "LibraryController"]
 
 
 def __getattr__(name: str):
+    if name == "DiagnosticsController":
+        from .diagnostics_controller import DiagnosticsController
+
+        return DiagnosticsController
     if name == "LibraryController":
         from .library_controller import LibraryController
 
@@ -0,0 +1,295 @@
+from __future__ import annotations
+
+import os
+import time
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+import app_services
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from repkg_gui import instrumentation
+from repkg_gui.profiling import DEFAULT_PROFILE_MODE, DEFAULT_PROFILE_SECONDS, ProfileResult, ProfileSession
+from repkg_gui.controllers.settings_controller import HelpSection
+from repkg_gui.domain.entities import (
+    DiagnosticsSnapshot,
+    ExtractionOutcome,
+    ExtractionProgress,
+    ExtractionTaskInfo,
+    WorkerActivity,
+)
+from repkg_gui.workers.extraction_worker import format_byte_size
+
+if TYPE_CHECKING:
+    from repkg_gui.controllers.extraction_controller import ExtractionController
+    from repkg_gui.controllers.library_controller import LibraryController
+    from repkg_gui.ui.widgets.thumbnail_view import ThumbnailView
+
+DIAGNOSTICS_REFRESH_INTERVAL_MS = 1000
+DIAGNOSTICS_EXPORT_PREFIX = "diagnostics"
+
+
+def _format_seconds(seconds: float | None) -> str:
+    if seconds is None:
+        return "尚无数据"
+    if seconds < 1:
+        return f"{seconds * 1000:.1f} ms"
+    return f"{seconds:.2f} s"
+
+
+def diagnostics_to_json(snapshot: DiagnosticsSnapshot) -> dict[str, Any]:
+    catalog = snapshot.catalog
+    return {
+        "captured_at": round(snapshot.captured_at, 3),
+        "catalog": {
+            "total_count": snapshot.catalog_count,
+            "visible_count": snapshot.visible_count,
+            "scan_seconds": catalog.scan_seconds,
+            "scanned_count": catalog.scanned_count,
+            "folders_per_second": round(catalog.folders_per_second, 3),
+            "load_seconds": catalog.load_seconds,
+            "loaded_count": catalog.loaded_count,
+            "filter_seconds": catalog.filter_seconds,
+            "filtered_count": catalog.filtered_count,
+        },
+        "thumbnails": {
+            "cached_count": snapshot.thumbnail_cached_count,
+            "cached_bytes": snapshot.thumbnail_cached_bytes,
+            "hits": snapshot.thumbnail_hits,
+            "misses": snapshot.thumbnail_misses,
+            "hit_rate": round(snapshot.thumbnail_hit_rate, 4),
+            "pending_decodes": snapshot.pending_decodes,
+            "active_decode_threads": snapshot.active_decode_threads,
+        },
+        "extraction": {
+            "running": snapshot.extraction_running,
+            "completed": snapshot.extraction_completed,
+            "total": snapshot.extraction_total,
+            "seconds": round(snapshot.extraction_seconds, 3),
+            "bytes": snapshot.extraction_bytes,
+            "items_per_second": round(snapshot.extraction_items_per_second, 3),
+            "bytes_per_second": round(snapshot.extraction_bytes_per_second, 1),
+            "workers": [
+                {
+                    "worker": activity.worker,
+                    "item_id": activity.item_id,
+                    "files_extracted": activity.files_extracted,
+                    "bytes_extracted": activity.bytes_extracted,
+                    "current_entry": activity.current_entry,
+                    "updated_at": round(activity.updated_at, 3),
+                }
+                for activity in snapshot.workers
+            ],
+        },
+        "spans": {name: dict(stats) for name, stats in snapshot.spans.items()},
+    }
+
+
+def build_diagnostics_sections(snapshot: DiagnosticsSnapshot) -> tuple[HelpSection, ...]:
+    catalog = snapshot.catalog
+    scan_line = f"最近一次扫描：{_format_seconds(catalog.scan_seconds)}"
+    if catalog.scan_seconds:
+        scan_line += f"（{catalog.scanned_count} 个文件夹，{catalog.folders_per_second:.1f} 个/秒）"
+    extraction_state = "进行中" if snapshot.extraction_running else "空闲"
+    return (
+        HelpSection(
+            title="壁纸目录",
+            lines=(
+                f"已加载 {snapshot.catalog_count} 项，当前显示 {snapshot.visible_count} 项。",
+                scan_line,
+                f"目录加载耗时：{_format_seconds(catalog.load_seconds)}（{catalog.loaded_count} 项）",
+                f"最近一次筛选：{_format_seconds(catalog.filter_seconds)}（检查 {catalog.filtered_count} 行）",
+            ),
+        ),
+        HelpSection(
+            title="缩略图",
+            lines=(
+                f"缓存 {snapshot.thumbnail_cached_count} 张，约 {format_byte_size(snapshot.thumbnail_cached_bytes)}。",
+                f"命中率：{snapshot.thumbnail_hit_rate:.1%}（命中 {snapshot.thumbnail_hits} 次，未命中 {snapshot.thumbnail_misses} 次）",
+                f"等待解码：{snapshot.pending_decodes} 张，活动解码线程：{snapshot.active_decode_threads} 个",
+            ),
+        ),
+        HelpSection(
+            title="提取",
+            lines=(
+                f"状态：{extraction_state}，已完成 {snapshot.extraction_completed}/{snapshot.extraction_total} 项。",
+                f"吞吐：{snapshot.extraction_items_per_second:.2f} 项/秒，"
+                f"{format_byte_size(int(snapshot.extraction_bytes_per_second))}/秒",
+                f"活动线程：{len(snapshot.workers)} 个",
+            ),
+        ),
+    )
+
+
+class DiagnosticsController(QObject):
+    snapshot_changed = Signal(object)
+    profiling_started = Signal(object)
+    profiling_finished = Signal(object)
+    profiling_failed = Signal(str)
+
+    def __init__(
+        self,
+        library_controller: LibraryController,
+        thumbnail_view: ThumbnailView | None = None,
+        extraction_controller: ExtractionController | None = None,
+        refresh_interval_ms: int = DIAGNOSTICS_REFRESH_INTERVAL_MS,
+        parent: QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self.library_controller = library_controller
+        self.thumbnail_view = thumbnail_view
+        self.extraction_controller: ExtractionController | None = None
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setInterval(max(refresh_interval_ms, 100))
+        self._refresh_timer.timeout.connect(self.refresh)
+        self._extraction_running = False
+        self._extraction_started_at: float | None = None
+        self._extraction_seconds = 0.0
+        self._extraction_skipped = 0
+        self._extraction_completed = 0
+        self._extraction_total = 0
+        self._finished_bytes = 0
+        self._workers: dict[str, WorkerActivity] = {}
+        self._profile_session: ProfileSession | None = None
+        self._profile_timer = QTimer(self)
+        self._profile_timer.setSingleShot(True)
+        self._profile_timer.timeout.connect(self.stop_profiling)
+        if extraction_controller is not None:
+            self.attach_extraction_controller(extraction_controller)
+
+    @property
+    def is_running(self) -> bool:
+        return self._refresh_timer.isActive()
+
+    @property
+    def is_profiling(self) -> bool:
+        return self._profile_session is not None
+
+    def attach_extraction_controller(self, controller: ExtractionController) -> None:
+        self.extraction_controller = controller
+        controller.task_started.connect(self._handle_task_started)
+        controller.task_progress.connect(self._handle_task_progress)
+        controller.task_finished.connect(self._handle_task_finished)
+        controller.task_failed.connect(self._handle_task_failed)
+
+    def start(self) -> None:
+        self.refresh()
+        self._refresh_timer.start()
+
+    def stop(self) -> None:
+        self._refresh_timer.stop()
+
+    def refresh(self) -> DiagnosticsSnapshot:
+        snapshot = self.snapshot()
+        self.snapshot_changed.emit(snapshot)
+        return snapshot
+
+    def snapshot(self) -> DiagnosticsSnapshot:
+        cache = self.thumbnail_view.cache if self.thumbnail_view is not None else None
+        loader = self.thumbnail_view.loader if self.thumbnail_view is not None else None
+        return DiagnosticsSnapshot(
+            captured_at=time.time(),
+            catalog=self.library_controller.timings,
+            catalog_count=self.library_controller.total_count(),
+            visible_count=self.library_controller.visible_count(),
+            thumbnail_cached_count=cache.cached_count if cache is not None else 0,
+            thumbnail_cached_bytes=cache.cached_bytes if cache is not None else 0,
+            thumbnail_hits=cache.hit_count if cache is not None else 0,
+            thumbnail_misses=cache.miss_count if cache is not None else 0,
+            pending_decodes=cache.pending_count if cache is not None else 0,
+            active_decode_threads=loader.active_thread_count if loader is not None else 0,
+            extraction_running=self._extraction_running,
+            extraction_completed=self._extraction_completed,
+            extraction_total=self._extraction_total,
+            extraction_seconds=self._current_extraction_seconds(),
+            extraction_bytes=self._finished_bytes + sum(activity.bytes_extracted for activity in self._workers.values()),
+            workers=tuple(sorted(self._workers.values(), key=lambda activity: activity.worker)),
+            spans=instrumentation.get_instrumentation().snapshot()["spans"] if instrumentation.is_enabled() else {},
+        )
+
+    def export_snapshot(self, path: str | None = None) -> str:
+        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        target_path = path or os.path.join(app_services.RUNTIME_DIR, f"{DIAGNOSTICS_EXPORT_PREFIX}-{timestamp}.json")
+        app_services._write_json_file(target_path, diagnostics_to_json(self.snapshot()))
+        return target_path
+
+    def start_profiling(
+        self,
+        duration_seconds: float = DEFAULT_PROFILE_SECONDS,
+        mode: str = DEFAULT_PROFILE_MODE,
+    ) -> ProfileSession | None:
+        if self._profile_session is not None:
+            return self._profile_session
+        try:
+            session = ProfileSession(duration_seconds, mode).start()
+        except (RuntimeError, ValueError) as exc:
+            self.profiling_failed.emit(str(exc))
+            return None
+        self._profile_session = session
+        self._profile_timer.start(int(session.duration_seconds * 1000))
+        self.profiling_started.emit(session)
+        return session
+
+    def stop_profiling(self) -> ProfileResult | None:
+        session = self._profile_session
+        if session is None:
+            return None
+        self._profile_timer.stop()
+        self._profile_session = None
+        try:
+            result = session.stop()
+        except OSError as exc:
+            app_services.log_error(f"写入性能剖析结果失败: {exc}")
+            self.profiling_failed.emit(str(exc))
+            return None
+        app_services.log_success(f"性能剖析已完成：{', '.join(result.output_paths)}")
+        self.profiling_finished.emit(result)
+        return result
+
+    def _current_extraction_seconds(self) -> float:
+        if self._extraction_running and self._extraction_started_at is not None:
+            return time.monotonic() - self._extraction_started_at
+        return self._extraction_seconds
+
+    def _handle_task_started(self, task_info: ExtractionTaskInfo) -> None:
+        self._extraction_running = True
+        self._extraction_started_at = time.monotonic()
+        self._extraction_seconds = 0.0
+        self._extraction_skipped = task_info.skipped_count
+        self._extraction_completed = 0
+        self._extraction_total = task_info.executable_count
+        self._finished_bytes = 0
+        self._workers.clear()
+
+    def _handle_task_progress(self, progress: ExtractionProgress) -> None:
+        self._extraction_completed = max(progress.completed - self._extraction_skipped, 0)
+        item_progress = progress.item_progress
+        if item_progress is not None:
+            worker = item_progress.worker or item_progress.item_id
+            self._workers[worker] = WorkerActivity(
+                worker=worker,
+                item_id=item_progress.item_id,
+                files_extracted=item_progress.files_extracted,
+                bytes_extracted=item_progress.bytes_extracted,
+                current_entry=item_progress.current_entry,
+                updated_at=time.time(),
+            )
+            return
+        if not progress.current_item_id:
+            return
+        for worker, activity in tuple(self._workers.items()):
+            if activity.item_id == progress.current_item_id:
+                self._finished_bytes += activity.bytes_extracted
+                del self._workers[worker]
+
+    def _handle_task_finished(self, outcome: ExtractionOutcome) -> None:
+        self._extraction_seconds = self._current_extraction_seconds()
+        self._extraction_running = False
+        self._extraction_completed = len(outcome.summary.succeeded) + len(outcome.summary.failed)
+        self._finished_bytes += sum(activity.bytes_extracted for activity in self._workers.values())
+        self._workers.clear()
+
+    def _handle_task_failed(self, _message: str) -> None:
+        self._extraction_running = False
+        self._extraction_started_at = None
+        self._workers.clear()
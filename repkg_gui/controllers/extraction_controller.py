@@ -14,7 +14,7 @@ from repkg_gui.domain.entities import (
 )
 from repkg_gui.services.extraction_service import ExtractionService
 from repkg_gui.ui.dialogs.progress_dialog import ProgressDialog
-from repkg_gui.workers.extraction_worker import ExtractionWorker
+from repkg_gui.workers.extraction_worker import ExtractionWorker, format_byte_size
 
 
 class ExtractionController(QObject):
@@ -22,6 +22,7 @@ class ExtractionController(QObject):
     task_progress = Signal(object)
     task_finished = Signal(object)
     task_failed = Signal(str)
+    task_idle = Signal()
 
     def __init__(self, context: AppContext, service: ExtractionService | None = None, parent: QObject | None = None) -> None:
         super().__init__(parent)
@@ -90,6 +91,7 @@ class ExtractionController(QObject):
                 message="正在准备提取任务…",
                 worker_count=0,
             )
+            self._progress_dialog.cancel_requested.connect(self.cancel_active_task)
             self._progress_dialog.show()
 
         self.context.set_task_state("extracting")
@@ -114,6 +116,14 @@ class ExtractionController(QObject):
         self._thread.start()
         return True
 
+    def cancel_active_task(self) -> bool:
+        if self._worker is None or self._worker.is_cancelled:
+            return False
+
+        self._worker.cancel()
+        self.context.set_status("正在取消提取任务，未开始的项目将不再执行…")
+        return True
+
     def _handle_started(self, task_info: ExtractionTaskInfo) -> None:
         self._active_task_info = task_info
         status_message = self._build_started_message(task_info)
@@ -124,6 +134,8 @@ class ExtractionController(QObject):
                 total=task_info.requested_count,
                 message=status_message,
                 worker_count=task_info.effective_workers,
+                eta_seconds=task_info.estimated_seconds,
+                adaptive_workers=task_info.adaptive_workers,
             )
         self.task_started.emit(task_info)
 
@@ -131,13 +143,17 @@ class ExtractionController(QObject):
         if progress.message:
             self.context.set_status(progress.message)
         if self._progress_dialog is not None:
-            worker_count = self._active_task_info.effective_workers if self._active_task_info is not None else 0
+            task_info = self._active_task_info
+            worker_count = progress.effective_workers or (task_info.effective_workers if task_info is not None else 0)
             self._progress_dialog.set_progress(
                 completed=progress.completed,
                 total=progress.total,
                 message=progress.message,
                 current_item_id=progress.current_item_id,
                 worker_count=worker_count,
+                eta_seconds=progress.eta_seconds,
+                adaptive_workers=task_info.adaptive_workers if task_info is not None else False,
+                item_detail=self._build_item_detail(progress),
             )
         self.task_progress.emit(progress)
 
@@ -148,18 +164,21 @@ class ExtractionController(QObject):
         self.context.set_status(status_text)
 
         if self._progress_dialog is not None:
+            task_info = self._active_task_info
             self._progress_dialog.set_running(False)
             self._progress_dialog.set_progress(
                 completed=outcome.summary.requested_count,
                 total=outcome.summary.requested_count,
                 message=status_text,
                 worker_count=outcome.summary.effective_workers,
+                adaptive_workers=task_info.adaptive_workers if task_info is not None else False,
             )
             self._progress_dialog.close()
             self._progress_dialog = None
 
         self.task_finished.emit(outcome)
-        self._show_message("提取完成", summary_text, warning=has_warning)
+        message_title = "提取已取消" if outcome.summary.was_cancelled else "提取完成"
+        self._show_message(message_title, summary_text, warning=has_warning)
 
     def _handle_failed(self, message: str) -> None:
         failure_message = message or "提取任务执行失败。"
@@ -182,6 +201,7 @@ class ExtractionController(QObject):
         self._active_parent = None
         self._active_item_ids = ()
         self._active_task_info = None
+        self.task_idle.emit()
 
     def _show_message(
         self,
@@ -196,6 +216,16 @@ class ExtractionController(QObject):
         else:
             QMessageBox.information(resolved_parent, title, message)
 
+    @staticmethod
+    def _build_item_detail(progress: ExtractionProgress) -> str:
+        item_progress = progress.item_progress
+        if item_progress is None:
+            return ""
+        detail = f"已写出 {item_progress.files_extracted} 个文件，{format_byte_size(item_progress.bytes_extracted)}"
+        if item_progress.current_entry:
+            detail += f"，{item_progress.current_entry}"
+        return detail
+
     @staticmethod
     def _build_started_message(task_info: ExtractionTaskInfo) -> str:
         if task_info.requested_count == 0:
@@ -204,4 +234,6 @@ class ExtractionController(QObject):
             return f"没有可执行的提取任务（共 {task_info.requested_count} 项）。"
         if task_info.executable_count == 1:
             return f"正在提取 1 项壁纸（共 {task_info.requested_count} 项）。"
+        if task_info.adaptive_workers:
+            return f"正在提取 {task_info.requested_count} 项壁纸（自适应并发，起始 {task_info.effective_workers} 线程）…"
         return f"正在提取 {task_info.requested_count} 项壁纸（并发 {task_info.effective_workers} 线程）…"
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
 import os
+import time
+from dataclasses import replace
 
 from PySide6.QtCore import QObject, QUrl, Signal
 from PySide6.QtGui import QDesktopServices
 
 from app_services import INFO_CSV_FILE, PROJECT_ROOT
 
+from repkg_gui import instrumentation
 from repkg_gui.app_context import AppContext
-from repkg_gui.domain.entities import CatalogSnapshot, FilterState, WallpaperRecord
+from repkg_gui.domain.entities import CatalogSnapshot, CatalogTimings, FilterState, WallpaperRecord, WorkshopChanges
 from repkg_gui.domain.enums import FilterField
 from repkg_gui.models.catalog_filter_proxy import CatalogFilterProxyModel
 from repkg_gui.models.catalog_table_model import CatalogTableModel
@@ -17,11 +20,14 @@ from repkg_gui.models.selection_model import (
     build_filter_status,
     build_loaded_status,
     build_selection_status,
+    build_workshop_changes_status,
     distinct_field_values,
     normalize_selection,
 )
 from repkg_gui.services.catalog_service import CatalogService
+from repkg_gui.services.catalog_snapshot_store import get_snapshot_path
 from repkg_gui.services.runtime_compat import RuntimeCompatService
+from repkg_gui.workers.workshop_watcher import WorkshopWatcher
 
 
 class LibraryController(QObject):
@@ -34,6 +40,8 @@ class LibraryController(QObject):
     view_mode_changed = Signal(str)
     single_extract_requested = Signal(str)
     batch_extract_requested = Signal(object)
+    auto_extract_requested = Signal(object)
+    timings_changed = Signal(object)
 
     def __init__(
         self,
@@ -51,12 +59,21 @@ class LibraryController(QObject):
         self.filter_proxy_model.setSourceModel(self.table_model)
         self._selection = CatalogSelection()
         self._snapshot = CatalogSnapshot(steam_path=context.state.steam_path, csv_path="", records=())
+        self._pending_auto_extract_ids: set[str] = set()
+        self._timings = CatalogTimings()
+        self.workshop_watcher = WorkshopWatcher(self.runtime, parent=self)
+        self.workshop_watcher.changes_detected.connect(self.apply_workshop_changes)
+        self.workshop_watcher.watch_failed.connect(self.context.set_status)
+        self.context.config_changed.connect(self.sync_workshop_watch)
+        self.context.steam_path_changed.connect(lambda _path: self.sync_workshop_watch())
 
     def initialize(self) -> None:
         self._emit_filter_options()
         self.filter_state_changed.emit(self.filter_proxy_model.filter_state())
         self.view_mode_changed.emit(self.context.state.view_mode)
         self._load_initial_catalog()
+        self.sync_workshop_watch()
+        instrumentation.mark("startup.library_ready")
 
     def current_record(self) -> WallpaperRecord | None:
         if self._selection.focused_id:
@@ -65,6 +82,10 @@ class LibraryController(QObject):
                 return record
         return self.filter_proxy_model.record_for_proxy_row(0)
 
+    @property
+    def timings(self) -> CatalogTimings:
+        return self._timings
+
     def total_count(self) -> int:
         return self.table_model.rowCount()
 
@@ -93,7 +114,9 @@ class LibraryController(QObject):
         self.context.set_status(status_message)
 
     def set_filter_state(self, filter_state: FilterState) -> None:
+        started_at = time.perf_counter()
         self.filter_proxy_model.set_filter_state(filter_state)
+        self._update_timings(filter_seconds=time.perf_counter() - started_at, filtered_count=self.total_count())
         self.filter_state_changed.emit(self.filter_proxy_model.filter_state())
         self._reset_selection_after_filter()
         self.context.set_status(
@@ -116,14 +139,89 @@ class LibraryController(QObject):
 
         self.context.set_task_state("scanning")
         try:
+            started_at = time.perf_counter()
             snapshot = self.catalog_service.scan_catalog(self.context.state.steam_path)
+            scanned_at = time.perf_counter()
         except (FileNotFoundError, ValueError, OSError) as exc:
             self.context.set_status(f"刷新壁纸数据失败：{exc}")
         else:
             self._apply_snapshot(snapshot, refreshed=True)
+            self._update_timings(
+                scan_seconds=scanned_at - started_at,
+                scanned_count=snapshot.total_count,
+                load_seconds=time.perf_counter() - scanned_at,
+                loaded_count=snapshot.total_count,
+            )
+            self.workshop_watcher.rebaseline()
         finally:
             self.context.set_task_state("idle")
 
+    def sync_workshop_watch(self) -> None:
+        should_watch = self.context.state.watch_workshop and self.context.has_valid_steam_path()
+        if not should_watch:
+            if self.workshop_watcher.is_active:
+                self.workshop_watcher.stop()
+            self._pending_auto_extract_ids.clear()
+            return
+
+        watched_directories = tuple(
+            directory
+            for directory in self.runtime.get_workshop_directories(self.context.state.steam_path)
+            if os.path.isdir(directory)
+        )
+        if self.workshop_watcher.watched_directories != watched_directories:
+            self.workshop_watcher.start(self.context.state.steam_path)
+
+    def apply_workshop_changes(self, changes: WorkshopChanges) -> None:
+        if changes.is_empty or self.context.state.task_state == "scanning":
+            return
+        if not self._snapshot.csv_path:
+            self.refresh_catalog()
+            return
+
+        try:
+            snapshot = self.catalog_service.apply_workshop_changes(
+                self._snapshot,
+                changes,
+                steam_path=self.context.state.steam_path,
+            )
+        except (FileNotFoundError, ValueError, OSError) as exc:
+            self.context.set_status(f"增量更新壁纸数据失败：{exc}")
+            return
+
+        self._apply_snapshot(snapshot, preserve_selection=True)
+        self.context.set_status(build_workshop_changes_status(changes, snapshot.total_count))
+        if self.context.state.auto_extract_new_items:
+            self._pending_auto_extract_ids.update(changes.added)
+        self._pending_auto_extract_ids.difference_update(changes.removed)
+        self.flush_auto_extract()
+
+    def defer_auto_extract(self, item_ids: tuple[str, ...] | list[str]) -> None:
+        self._pending_auto_extract_ids.update(item_ids)
+
+    def flush_auto_extract(self) -> tuple[str, ...]:
+        if not self._pending_auto_extract_ids or not self.context.state.auto_extract_new_items:
+            return ()
+
+        ready_ids = []
+        for item_id in sorted(self._pending_auto_extract_ids):
+            record = self.record_by_id(item_id)
+            if record is None:
+                self._pending_auto_extract_ids.discard(item_id)
+                continue
+            scene_pkg_path = self.runtime.get_scene_pkg_path(self.context.state.steam_path, item_id)
+            if os.path.exists(scene_pkg_path):
+                ready_ids.append(item_id)
+            elif record.type and record.type.lower() != "scene":
+                self._pending_auto_extract_ids.discard(item_id)
+
+        if not ready_ids:
+            return ()
+        self._pending_auto_extract_ids.difference_update(ready_ids)
+        ready = tuple(ready_ids)
+        self.auto_extract_requested.emit(ready)
+        return ready
+
     def select_all_visible(self) -> None:
         visible_ids = self.filter_proxy_model.visible_item_ids()
         if not visible_ids:
@@ -190,9 +288,10 @@ class LibraryController(QObject):
         self.context.set_status(f"已触发 {len(selected_ids)} 项壁纸的批量提取请求。")
 
     def _load_initial_catalog(self) -> None:
-        if os.path.exists(INFO_CSV_FILE):
+        if os.path.exists(INFO_CSV_FILE) or os.path.exists(get_snapshot_path(INFO_CSV_FILE)):
+            started_at = time.perf_counter()
             try:
-                snapshot = self.catalog_service.load_snapshot_from_csv(
+                snapshot = self.catalog_service.load_cached_snapshot(
                     INFO_CSV_FILE,
                     steam_path=self.context.state.steam_path,
                 )
@@ -200,6 +299,7 @@ class LibraryController(QObject):
                 self.context.set_status(f"读取壁纸缓存失败：{exc}")
             else:
                 self._apply_snapshot(snapshot)
+                self._update_timings(load_seconds=time.perf_counter() - started_at, loaded_count=snapshot.total_count)
                 return
 
         if self.context.has_valid_steam_path():
@@ -213,17 +313,31 @@ class LibraryController(QObject):
         self._emit_footer_text()
         self.context.set_status("尚未加载壁纸数据。请先设置 steam.exe 路径或点击刷新。")
 
-    def _apply_snapshot(self, snapshot: CatalogSnapshot, refreshed: bool = False) -> None:
+    @instrumentation.timed("library.apply_snapshot")
+    def _apply_snapshot(
+        self,
+        snapshot: CatalogSnapshot,
+        refreshed: bool = False,
+        preserve_selection: bool = False,
+    ) -> None:
+        previous_selection = self._selection
         self._snapshot = snapshot
         self.table_model.set_records(snapshot.records)
         self.context.set_catalog_records(snapshot.records)
         self.context.state.last_scan_summary = build_loaded_status(snapshot.total_count, refreshed=refreshed)
         self._emit_filter_options()
-        self._reset_selection_after_filter()
+        if preserve_selection:
+            self._update_selection(previous_selection.selected_ids, previous_selection.focused_id, announce=False)
+        else:
+            self._reset_selection_after_filter()
         self._emit_footer_text()
         self.context.session_changed.emit()
         self.context.set_status(self.context.state.last_scan_summary)
 
+    def _update_timings(self, **changes: float | int) -> None:
+        self._timings = replace(self._timings, **changes)
+        self.timings_changed.emit(self._timings)
+
     def _emit_filter_options(self) -> None:
         options_by_field = {
             field.value: distinct_field_values(self.table_model.all_records(), field)
@@ -56,6 +56,16 @@ class SettingsContext(Protocol):
 
     def set_batch_extract_workers(self, workers: int) -> None: ...
 
+    def set_adaptive_batch_extract_workers(self, enabled: bool) -> None: ...
+
+    def set_watch_workshop(self, enabled: bool) -> None: ...
+
+    def set_auto_extract_new_items(self, enabled: bool) -> None: ...
+
+    def set_extract_timeout_seconds(self, seconds: int) -> None: ...
+
+    def set_extract_timeout_seconds_per_gb(self, seconds: int) -> None: ...
+
     def set_option(self, option_name: str, value: bool) -> None: ...
 
     def set_output_mode(self, output_mode: str) -> None: ...
@@ -99,11 +109,35 @@ class SettingsController:
 
     def batch_workers_description(self, configured_workers: int | None = None) -> str:
         workers = self.context.state.batch_extract_workers if configured_workers is None else configured_workers
-        return get_batch_extract_workers_description(workers)
+        return get_batch_extract_workers_description(workers, self.context.state.adaptive_batch_extract_workers)
 
     def set_batch_extract_workers(self, workers: int) -> None:
         self.context.set_batch_extract_workers(workers)
 
+    def set_adaptive_batch_extract_workers(self, enabled: bool) -> None:
+        self.context.set_adaptive_batch_extract_workers(enabled)
+
+    def set_watch_workshop(self, enabled: bool) -> None:
+        self.context.set_watch_workshop(enabled)
+
+    def set_auto_extract_new_items(self, enabled: bool) -> None:
+        self.context.set_auto_extract_new_items(enabled)
+
+    def watch_description(self) -> str:
+        return get_watch_description(self.context.state.watch_workshop, self.context.state.auto_extract_new_items)
+
+    def extract_timeout_description(self) -> str:
+        return get_extract_timeout_description(
+            self.context.state.extract_timeout_seconds,
+            self.context.state.extract_timeout_seconds_per_gb,
+        )
+
+    def set_extract_timeout_seconds(self, seconds: int) -> None:
+        self.context.set_extract_timeout_seconds(seconds)
+
+    def set_extract_timeout_seconds_per_gb(self, seconds: int) -> None:
+        self.context.set_extract_timeout_seconds_per_gb(seconds)
+
     def set_option(self, option_name: str, value: bool, label: str | None = None) -> None:
         self.context.set_option(option_name, value)
         if label:
@@ -145,20 +179,50 @@ def get_output_mode_description(mode: str) -> str:
     return descriptions.get(mode, "当前输出模式暂时没有说明。")
 
 
-def format_batch_extract_workers_display(configured_workers: int) -> str:
+def format_batch_extract_workers_display(configured_workers: int, adaptive: bool = False) -> str:
     resolved_workers = resolve_batch_extract_workers(configured_workers)
+    if adaptive:
+        return f"自适应（上限 {resolved_workers} 线程）"
     if configured_workers <= 0:
         return f"自动（当前 {resolved_workers} 线程）"
     return f"{resolved_workers} 线程"
 
 
-def get_batch_extract_workers_description(configured_workers: int) -> str:
+def get_batch_extract_workers_description(configured_workers: int, adaptive: bool = False) -> str:
     resolved_workers = resolve_batch_extract_workers(configured_workers)
+    if adaptive:
+        return (
+            f"当前为自适应模式，会从 2 线程起步，按实际提取吞吐在 1～{resolved_workers} 线程之间自动增减，"
+            "适合机械硬盘、U 盘或网络共享目录。"
+        )
     if configured_workers <= 0:
         return f"当前为自动模式，会按 CPU 核心数决定并发数，当前实际使用 {resolved_workers} 线程。"
     return f"当前手动设置为 {resolved_workers} 线程。填 0 可切回自动模式。"
 
 
+def format_extract_timeout_display(base_seconds: int, seconds_per_gb: int) -> str:
+    if base_seconds <= 0:
+        return "不限制"
+    return f"{base_seconds} 秒 + 每 GB {seconds_per_gb} 秒"
+
+
+def get_extract_timeout_description(base_seconds: int, seconds_per_gb: int) -> str:
+    if base_seconds <= 0:
+        return "当前不限制单项提取时间。卡住的 RePKG 进程会一直占用一个并发槽位。"
+    return (
+        f"每项最多运行 {base_seconds} 秒，scene.pkg 每 1 GB 再追加 {seconds_per_gb} 秒；"
+        "超时后会结束整个 RePKG 进程树并记为超时失败。填 0 表示不限制。"
+    )
+
+
+def get_watch_description(watch_workshop: bool, auto_extract_new_items: bool) -> str:
+    if not watch_workshop:
+        return "当前不监视创意工坊目录，新订阅需要手动点击“刷新数据”。"
+    if auto_extract_new_items:
+        return "正在监视创意工坊目录：新增、更新或移除的壁纸会增量写入索引，新订阅下载完成后自动按当前设置提取。"
+    return "正在监视创意工坊目录：新增、更新或移除的壁纸会增量写入索引，无需完整重新扫描。"
+
+
 def build_settings_summary(state: SessionState) -> str:
     steam_display = state.steam_path or "还没设置"
     output_display = state.output_path or DEFAULT_OUTPUT_PATH
@@ -167,12 +231,14 @@ def build_settings_summary(state: SessionState) -> str:
             f"steam.exe：{steam_display}",
             f"输出模式：{state.output_mode}",
             f"输出目录：{output_display}",
-            f"批量提取并发：{format_batch_extract_workers_display(state.batch_extract_workers)}",
+            f"批量提取并发：{format_batch_extract_workers_display(state.batch_extract_workers, state.adaptive_batch_extract_workers)}",
+            f"单项提取超时：{format_extract_timeout_display(state.extract_timeout_seconds, state.extract_timeout_seconds_per_gb)}",
+            f"创意工坊监视：{'开启' if state.watch_workshop else '关闭'}（自动提取新订阅：{'是' if state.auto_extract_new_items else '否'}）",
             f"主题预设：{THEME_PRESET_LABELS.get(state.config.theme_preset, state.config.theme_preset)}",
             f"主题配色：背景 {state.config.theme_background} / 面板 {state.config.theme_surface} / 强调 {state.config.theme_accent} / 文本 {state.config.theme_text}",
             f"配置文件：{CONFIG_DISPLAY_PATH}",
             f"壁纸索引：{INFO_DISPLAY_PATH}",
-            "持久化设置：steam.exe / 输出目录 / 批量提取并发 / 主题预设 / 主题配色",
+            "持久化设置：steam.exe / 输出目录 / 批量提取并发 / 自适应并发 / 提取超时 / 创意工坊监视 / 主题预设 / 主题配色",
             "当前会话选项：",
             f"- 不转换 TEX：{'是' if state.not_convert_tex_to_image else '否'}",
             f"- 用壁纸名建子目录：{'是' if state.use_wallpaper_name_as_subdir else '否'}",
@@ -198,9 +264,10 @@ def build_help_sections() -> tuple[HelpSection, ...]:
             title="常见操作",
             lines=(
                 "1. 顶部“刷新数据”会重新扫一遍本地 Workshop，不用重启。",
-                "2. 列表区支持筛选、重置筛选、全选和批量提取。",
-                "3. 列表区会显示类型、可见性这些必要信息；右键列表项可以看大图。",
-                "4. 批量提取会在后台并发执行，窗口底部状态栏会显示提取状态。",
+                "2. 在设置页开启“监视创意工坊目录”后，新订阅、更新和取消订阅会自动增量同步到列表。",
+                "3. 列表区支持筛选、重置筛选、全选和批量提取。",
+                "4. 列表区会显示类型、可见性这些必要信息；右键列表项可以看大图。",
+                "5. 批量提取会在后台并发执行，窗口底部状态栏会显示提取状态。",
             ),
         ),
         HelpSection(
@@ -209,8 +276,9 @@ def build_help_sections() -> tuple[HelpSection, ...]:
                 "1. steam.exe 路径会决定从哪里找本地 Workshop 文件。",
                 f"2. “{LOCAL_OUTPUT_MODE}”适合就地导出；“{SHARED_OUTPUT_MODE}”适合集中整理；“{SEPARATE_OUTPUT_MODE}”适合批量分项目保存。",
                 "3. 批量提取并发数填 0 表示自动，默认会按 CPU 核心数决定，当前自动值会落在保守范围内。",
-                "4. 自定义选项会影响下一次提取，比如是否转换 TEX、复制附带文件、覆盖旧文件。",
-                "5. 页面下方的摘要会显示当前路径、输出模式、并发数和配置文件位置。",
+                "4. 勾选“自适应并发”后，并发数会作为上限，程序会按实际磁盘吞吐自动增减线程。",
+                "5. 自定义选项会影响下一次提取，比如是否转换 TEX、复制附带文件、覆盖旧文件。",
+                "6. 页面下方的摘要会显示当前路径、输出模式、并发数和配置文件位置。",
             ),
         ),
         HelpSection(
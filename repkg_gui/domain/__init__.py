@@ -1,10 +1,14 @@
+from repkg_gui.domain.catalog_store import CatalogRecord, CatalogStore
 from repkg_gui.domain.entities import (
     CatalogSnapshot,
+    ExtractionItemProgress,
+    ExtractionJob,
     ExtractionItemResult,
     ExtractionOutcome,
     ExtractionPlan,
     ExtractionProgress,
     ExtractionRequest,
+    ExtractionRunStats,
     ExtractionSummary,
     ExtractionTaskInfo,
     FilterState,
@@ -12,20 +16,27 @@ from repkg_gui.domain.entities import (
     SkippedItem,
     TaskSummary,
     WallpaperRecord,
+    WorkshopChanges,
 )
-from repkg_gui.domain.enums import FilterField, OutputMode, TaskState, ViewMode
+from repkg_gui.domain.enums import FilterField, JobState, OutputMode, TaskState, ViewMode
 
 __all__ = [
+    "CatalogRecord",
     "CatalogSnapshot",
+    "CatalogStore",
+    "ExtractionItemProgress",
+    "ExtractionJob",
     "ExtractionItemResult",
     "ExtractionOutcome",
     "ExtractionPlan",
     "ExtractionProgress",
     "ExtractionRequest",
+    "ExtractionRunStats",
     "ExtractionSummary",
     "ExtractionTaskInfo",
     "FilterField",
     "FilterState",
+    "JobState",
     "OutputMode",
     "SessionSettings",
     "SkippedItem",
@@ -33,4 +44,5 @@ __all__ = [
     "TaskSummary",
     "ViewMode",
     "WallpaperRecord",
+    "WorkshopChanges",
 ]
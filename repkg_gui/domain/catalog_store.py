@@ -0,0 +1,464 @@
+from __future__ import annotations
+
+import sys
+import threading
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any, overload
+
+from repkg_gui.domain.entities import WallpaperRecord
+from repkg_gui.domain.enums import FilterField
+
+RECORD_FIELDS = ("id", "title", "tags", "type", "visibility", "file", "preview_path", "library")
+_OFFSET_TYPECODE = "I"
+_ID_TYPECODE = "I"
+_TEXT_ENCODING = "utf-8"
+_TEXT_ERRORS = "surrogatepass"
+
+
+class StringColumn:
+    __slots__ = ("_data", "_offsets")
+
+    def __init__(self, data: bytes = b"", offsets: array | None = None) -> None:
+        self._data = data
+        self._offsets = offsets if offsets is not None else array(_OFFSET_TYPECODE, (0,))
+
+    @classmethod
+    def from_values(cls, values: Iterable[str]) -> "StringColumn":
+        parts = []
+        offsets = array(_OFFSET_TYPECODE, (0,))
+        position = 0
+        for value in values:
+            encoded = value.encode(_TEXT_ENCODING, _TEXT_ERRORS)
+            parts.append(encoded)
+            position += len(encoded)
+            offsets.append(position)
+        return cls(b"".join(parts), offsets)
+
+    @property
+    def nbytes(self) -> int:
+        return sys.getsizeof(self._data) + sys.getsizeof(self._offsets)
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, row: int) -> str:
+        return self._data[self._offsets[row] : self._offsets[row + 1]].decode(_TEXT_ENCODING, _TEXT_ERRORS)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, StringColumn):
+            return NotImplemented
+        return self._data == other._data and self._offsets == other._offsets
+
+    def to_state(self) -> tuple[bytes, bytes]:
+        return self._data, self._offsets.tobytes()
+
+    @classmethod
+    def from_state(cls, state: tuple[bytes, bytes]) -> "StringColumn":
+        data, offsets_bytes = state
+        if not isinstance(data, bytes):
+            raise ValueError("字符串列数据无效")
+        offsets = array(_OFFSET_TYPECODE)
+        offsets.frombytes(offsets_bytes)
+        if not offsets or offsets[0] != 0 or offsets[-1] != len(data):
+            raise ValueError("字符串列偏移量无效")
+        return cls(data, offsets)
+
+
+class ValueTable:
+    __slots__ = ("values", "_ids", "_lock")
+
+    def __init__(self, values: Sequence[str] = ()) -> None:
+        self.values: list[str] = list(values)
+        self._ids: dict[str, int] = {value: index for index, value in enumerate(self.values)}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __contains__(self, value: object) -> bool:
+        return value in self._ids
+
+    def intern(self, value: str) -> int:
+        value_id = self._ids.get(value)
+        if value_id is None:
+            with self._lock:
+                value_id = self._ids.get(value)
+                if value_id is None:
+                    value_id = len(self.values)
+                    self.values.append(value)
+                    self._ids[value] = value_id
+        return value_id
+
+    def canonical(self, value: str) -> str:
+        return self.values[self.intern(value)]
+
+    def id_of(self, value: str) -> int | None:
+        return self._ids.get(value)
+
+    @property
+    def nbytes(self) -> int:
+        return sys.getsizeof(self.values) + sum(sys.getsizeof(value) for value in self.values)
+
+
+class CatalogVocabulary:
+    __slots__ = ("tags", "types", "_options")
+
+    def __init__(self, tags: Sequence[str] = (), types: Sequence[str] = ()) -> None:
+        self.tags = ValueTable(tags)
+        self.types = ValueTable(types)
+        self._options: dict[FilterField, tuple[int, tuple[str, ...]]] = {}
+
+    def intern_tag(self, tag: str) -> str:
+        return self.tags.canonical(tag)
+
+    def intern_tags(self, tags: Iterable[str]) -> tuple[str, ...]:
+        canonical = self.tags.canonical
+        return tuple(canonical(tag) for tag in tags)
+
+    def intern_type(self, value: str) -> str:
+        return self.types.canonical(value)
+
+    def options(self, field: FilterField) -> tuple[str, ...]:
+        if field is FilterField.TAGS:
+            table = self.tags
+        elif field is FilterField.TYPE:
+            table = self.types
+        else:
+            return ()
+        cached = self._options.get(field)
+        if cached is not None and cached[0] == len(table):
+            return cached[1]
+        values = tuple(sorted((value for value in table.values if value), key=str.casefold))
+        self._options[field] = (len(table), values)
+        return values
+
+
+class CatalogRecord:
+    __slots__ = ("_store", "_row")
+
+    def __init__(self, store: CatalogStore, row: int) -> None:
+        self._store = store
+        self._row = row
+
+    @property
+    def row(self) -> int:
+        return self._row
+
+    @property
+    def id(self) -> str:
+        return self._store._ids[self._row]
+
+    @property
+    def title(self) -> str:
+        return self._store._titles[self._row]
+
+    @property
+    def tags(self) -> tuple[str, ...]:
+        return self._store.tags_at(self._row)
+
+    @property
+    def type(self) -> str:
+        return self._store.vocabulary.types.values[self._store._type_ids[self._row]]
+
+    @property
+    def visibility(self) -> str:
+        return self._store.visibilities.values[self._store._visibility_ids[self._row]]
+
+    @property
+    def file(self) -> str:
+        return self._store._files[self._row]
+
+    @property
+    def preview_path(self) -> str:
+        return self._store._preview_paths[self._row]
+
+    @property
+    def library(self) -> str:
+        return self._store.libraries.values[self._store._library_ids[self._row]]
+
+    @property
+    def display_title(self) -> str:
+        return self.title or self.id
+
+    @property
+    def tags_text(self) -> str:
+        return ", ".join(self.tags)
+
+    @property
+    def has_preview(self) -> bool:
+        return bool(self.preview_path)
+
+    def as_tuple(self) -> tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in RECORD_FIELDS)
+
+    def to_record(self) -> WallpaperRecord:
+        return WallpaperRecord(*self.as_tuple())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CatalogRecord):
+            return self.as_tuple() == other.as_tuple()
+        if isinstance(other, WallpaperRecord):
+            return self.as_tuple() == tuple(getattr(other, name) for name in RECORD_FIELDS)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.as_tuple())
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in RECORD_FIELDS)
+        return f"CatalogRecord({fields})"
+
+
+class CatalogStore(Sequence[CatalogRecord]):
+    __slots__ = (
+        "_ids",
+        "_titles",
+        "_files",
+        "_preview_paths",
+        "_type_ids",
+        "_visibility_ids",
+        "_library_ids",
+        "_tag_offsets",
+        "_tag_ids",
+        "_row_tags",
+        "vocabulary",
+        "visibilities",
+        "libraries",
+    )
+
+    def __init__(
+        self,
+        ids: StringColumn,
+        titles: StringColumn,
+        files: StringColumn,
+        preview_paths: StringColumn,
+        type_ids: array,
+        visibility_ids: array,
+        library_ids: array,
+        tag_offsets: array,
+        tag_ids: array,
+        vocabulary: CatalogVocabulary,
+        visibilities: ValueTable,
+        libraries: ValueTable,
+    ) -> None:
+        self._ids = ids
+        self._titles = titles
+        self._files = files
+        self._preview_paths = preview_paths
+        self._type_ids = type_ids
+        self._visibility_ids = visibility_ids
+        self._library_ids = library_ids
+        self._tag_offsets = tag_offsets
+        self._tag_ids = tag_ids
+        self._row_tags: list[tuple[str, ...] | None] = [None] * len(ids)
+        self.vocabulary = vocabulary
+        self.visibilities = visibilities
+        self.libraries = libraries
+
+    @classmethod
+    def empty(cls) -> "CatalogStore":
+        return cls.from_records(())
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Iterable[WallpaperRecord | CatalogRecord],
+        vocabulary: CatalogVocabulary | None = None,
+    ) -> "CatalogStore":
+        ids, titles, files, preview_paths = [], [], [], []
+        type_ids = array(_ID_TYPECODE)
+        visibility_ids = array(_ID_TYPECODE)
+        library_ids = array(_ID_TYPECODE)
+        tag_offsets = array(_OFFSET_TYPECODE, (0,))
+        tag_ids = array(_ID_TYPECODE)
+        vocabulary = vocabulary if vocabulary is not None else CatalogVocabulary()
+        types, tags = vocabulary.types, vocabulary.tags
+        visibilities, libraries = ValueTable(), ValueTable()
+        for record in records:
+            ids.append(record.id)
+            titles.append(record.title)
+            files.append(record.file)
+            preview_paths.append(record.preview_path)
+            type_ids.append(types.intern(record.type))
+            visibility_ids.append(visibilities.intern(record.visibility))
+            library_ids.append(libraries.intern(record.library))
+            tag_ids.extend(tags.intern(tag) for tag in record.tags)
+            tag_offsets.append(len(tag_ids))
+        return cls(
+            StringColumn.from_values(ids),
+            StringColumn.from_values(titles),
+            StringColumn.from_values(files),
+            StringColumn.from_values(preview_paths),
+            type_ids,
+            visibility_ids,
+            library_ids,
+            tag_offsets,
+            tag_ids,
+            vocabulary,
+            visibilities,
+            libraries,
+        )
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @overload
+    def __getitem__(self, index: int) -> CatalogRecord: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> tuple[CatalogRecord, ...]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(CatalogRecord(self, row) for row in range(*index.indices(len(self))))
+        row_count = len(self)
+        if index < 0:
+            index += row_count
+        if not 0 <= index < row_count:
+            raise IndexError("目录行号超出范围")
+        return CatalogRecord(self, index)
+
+    def __iter__(self) -> Iterator[CatalogRecord]:
+        for row in range(len(self)):
+            yield CatalogRecord(self, row)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CatalogStore):
+            return len(self) == len(other) and all(left == right for left, right in zip(self, other))
+        if isinstance(other, (tuple, list)):
+            return len(self) == len(other) and all(left == right for left, right in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    @property
+    def tags(self) -> ValueTable:
+        return self.vocabulary.tags
+
+    @property
+    def types(self) -> ValueTable:
+        return self.vocabulary.types
+
+    def __repr__(self) -> str:
+        return f"CatalogStore({len(self)} 项, {len(self.tags)} 个标签, {len(self.types)} 种类型)"
+
+    def tags_at(self, row: int) -> tuple[str, ...]:
+        tags = self._row_tags[row]
+        if tags is None:
+            tag_values = self.tags.values
+            tags = tuple(tag_values[tag_id] for tag_id in self.tag_ids_at(row))
+            self._row_tags[row] = tags
+        return tags
+
+    def tag_ids_at(self, row: int) -> array:
+        return self._tag_ids[self._tag_offsets[row] : self._tag_offsets[row + 1]]
+
+    def id_at(self, row: int) -> str:
+        return self._ids[row]
+
+    def title_at(self, row: int) -> str:
+        return self._titles[row]
+
+    def type_id_at(self, row: int) -> int:
+        return self._type_ids[row]
+
+    def item_ids(self) -> tuple[str, ...]:
+        return tuple(self._ids[row] for row in range(len(self)))
+
+    def to_records(self) -> tuple[WallpaperRecord, ...]:
+        return tuple(record.to_record() for record in self)
+
+    @property
+    def nbytes(self) -> int:
+        arrays = (
+            self._type_ids,
+            self._visibility_ids,
+            self._library_ids,
+            self._tag_offsets,
+            self._tag_ids,
+        )
+        return (
+            sum(column.nbytes for column in (self._ids, self._titles, self._files, self._preview_paths))
+            + sum(sys.getsizeof(values) for values in arrays)
+            + sys.getsizeof(self._row_tags)
+            + sum(table.nbytes for table in (self.types, self.visibilities, self.libraries, self.tags))
+        )
+
+    def to_state(self) -> tuple[Any, ...]:
+        return (
+            self._ids.to_state(),
+            self._titles.to_state(),
+            self._files.to_state(),
+            self._preview_paths.to_state(),
+            self._type_ids.tobytes(),
+            self._visibility_ids.tobytes(),
+            self._library_ids.tobytes(),
+            self._tag_offsets.tobytes(),
+            self._tag_ids.tobytes(),
+            tuple(self.types.values),
+            tuple(self.visibilities.values),
+            tuple(self.libraries.values),
+            tuple(self.tags.values),
+        )
+
+    @classmethod
+    def from_state(cls, state: Sequence[Any]) -> "CatalogStore":
+        (
+            ids_state,
+            titles_state,
+            files_state,
+            preview_paths_state,
+            type_ids_bytes,
+            visibility_ids_bytes,
+            library_ids_bytes,
+            tag_offsets_bytes,
+            tag_ids_bytes,
+            type_values,
+            visibility_values,
+            library_values,
+            tag_values,
+        ) = state
+        ids = StringColumn.from_state(ids_state)
+        row_count = len(ids)
+        columns = tuple(
+            StringColumn.from_state(column_state) for column_state in (titles_state, files_state, preview_paths_state)
+        )
+        vocabulary = CatalogVocabulary(tag_values, type_values)
+        visibilities = ValueTable(visibility_values)
+        libraries = ValueTable(library_values)
+        id_arrays = []
+        for data, table in (
+            (type_ids_bytes, vocabulary.types),
+            (visibility_ids_bytes, visibilities),
+            (library_ids_bytes, libraries),
+        ):
+            values = _array_from_bytes(_ID_TYPECODE, data)
+            if len(values) != row_count or (values and max(values) >= len(table)):
+                raise ValueError("目录列引用无效")
+            id_arrays.append(values)
+        tag_offsets = _array_from_bytes(_OFFSET_TYPECODE, tag_offsets_bytes)
+        tag_ids = _array_from_bytes(_ID_TYPECODE, tag_ids_bytes)
+        if any(len(column) != row_count for column in columns) or len(tag_offsets) != row_count + 1:
+            raise ValueError("目录列长度不一致")
+        if tag_offsets[0] != 0 or tag_offsets[-1] != len(tag_ids) or (tag_ids and max(tag_ids) >= len(vocabulary.tags)):
+            raise ValueError("标签列引用无效")
+        return cls(ids, *columns, *id_arrays, tag_offsets, tag_ids, vocabulary, visibilities, libraries)
+
+
+def _array_from_bytes(typecode: str, data: bytes) -> array:
+    values = array(typecode)
+    values.frombytes(data)
+    return values
+
+
+def freeze_records(records: Iterable[WallpaperRecord | CatalogRecord]) -> Sequence[WallpaperRecord | CatalogRecord]:
+    if isinstance(records, CatalogStore):
+        return records
+    return tuple(records)
+
+
+def as_catalog_store(records: Iterable[WallpaperRecord | CatalogRecord]) -> CatalogStore:
+    if isinstance(records, CatalogStore):
+        return records
+    return CatalogStore.from_records(records)
@@ -2,9 +2,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import Iterable, Mapping
+from typing import TYPE_CHECKING, Iterable, Mapping, Sequence
 
-from repkg_gui.domain.enums import FilterField, OutputMode, TaskState
+from repkg_gui.domain.enums import FilterField, JobState, OutputMode, TaskState
+
+if TYPE_CHECKING:
+    from repkg_gui.domain.catalog_store import CatalogVocabulary
 
 
 def _normalize_tags(tags: object) -> tuple[str, ...]:
@@ -35,17 +38,28 @@ class WallpaperRecord:
     visibility: str = ""
     file: str = ""
     preview_path: str = ""
+    library: str = ""
 
     @classmethod
-    def from_mapping(cls, data: Mapping[str, object]) -> "WallpaperRecord":
+    def from_mapping(
+        cls,
+        data: Mapping[str, object],
+        vocabulary: CatalogVocabulary | None = None,
+    ) -> "WallpaperRecord":
+        tags = _normalize_tags(data.get("tags", ()))
+        wallpaper_type = str(data.get("type", "")).strip()
+        if vocabulary is not None:
+            tags = vocabulary.intern_tags(tags)
+            wallpaper_type = vocabulary.intern_type(wallpaper_type)
         return cls(
             id=str(data.get("id", "")).strip(),
             title=str(data.get("title", "")).strip(),
-            tags=_normalize_tags(data.get("tags", ())),
-            type=str(data.get("type", "")).strip(),
+            tags=tags,
+            type=wallpaper_type,
             visibility=str(data.get("visibility", "")).strip(),
             file=str(data.get("file", "")).strip(),
             preview_path=str(data.get("preview", data.get("preview_path", ""))).strip(),
+            library=str(data.get("library", "") or "").strip(),
         )
 
     @property
@@ -76,6 +90,9 @@ class SessionSettings:
     steam_path: str = ""
     output_path: str = "./output"
     batch_extract_workers: int = 0
+    adaptive_batch_extract_workers: bool = False
+    extract_timeout_seconds: int = 300
+    extract_timeout_seconds_per_gb: int = 600
     output_mode: OutputMode = OutputMode.SEPARATE
     not_convert_tex_to_image: bool = False
     use_wallpaper_name_as_subdir: bool = True
@@ -95,7 +112,7 @@ class TaskSummary:
 class CatalogSnapshot:
     steam_path: str
     csv_path: str
-    records: tuple[WallpaperRecord, ...] = field(default_factory=tuple)
+    records: Sequence[WallpaperRecord] = field(default_factory=tuple)
     scanned_at: datetime = field(default_factory=lambda: datetime.now(UTC))
 
     @property
@@ -106,12 +123,28 @@ class CatalogSnapshot:
         return {record.id: record for record in self.records if record.id}
 
 
+@dataclass(frozen=True, slots=True)
+class WorkshopChanges:
+    added: tuple[str, ...] = field(default_factory=tuple)
+    changed: tuple[str, ...] = field(default_factory=tuple)
+    removed: tuple[str, ...] = field(default_factory=tuple)
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.added or self.changed or self.removed)
+
+    @property
+    def refreshed_ids(self) -> tuple[str, ...]:
+        return self.added + self.changed
+
+
 @dataclass(frozen=True, slots=True)
 class ExtractionRequest:
     item_id: str
     title: str
     scene_pkg_path: str
     item_directory: str
+    pkg_bytes: int = 0
 
 
 @dataclass(frozen=True, slots=True)
@@ -140,6 +173,9 @@ class ExtractionItemResult:
     stdout: str = ""
     stderr: str = ""
     returncode: int = 0
+    cancelled: bool = False
+    timed_out: bool = False
+    duration_seconds: float = 0.0
 
 
 @dataclass(frozen=True, slots=True)
@@ -149,6 +185,7 @@ class ExtractionSummary:
     failed: tuple[ExtractionItemResult, ...] = field(default_factory=tuple)
     skipped: tuple[SkippedItem, ...] = field(default_factory=tuple)
     effective_workers: int = 0
+    cancelled: tuple[ExtractionItemResult, ...] = field(default_factory=tuple)
 
     @property
     def success_ids(self) -> tuple[str, ...]:
@@ -158,9 +195,21 @@ class ExtractionSummary:
     def failed_ids(self) -> tuple[str, ...]:
         return tuple(result.item_id for result in self.failed)
 
+    @property
+    def timed_out_ids(self) -> tuple[str, ...]:
+        return tuple(result.item_id for result in self.failed if result.timed_out)
+
+    @property
+    def cancelled_ids(self) -> tuple[str, ...]:
+        return tuple(result.item_id for result in self.cancelled)
+
+    @property
+    def was_cancelled(self) -> bool:
+        return bool(self.cancelled)
+
     @property
     def has_warnings(self) -> bool:
-        return bool(self.failed or self.skipped)
+        return bool(self.failed or self.skipped or self.cancelled)
 
     @property
     def missing_scene_pkg_ids(self) -> tuple[str, ...]:
@@ -185,22 +234,60 @@ class ExtractionSummary:
         if self.failure_details:
             failure_summary = ", ".join(f"{item_id}({reason})" for item_id, reason in self.failure_details)
             summary_lines.append(f"执行失败: {failure_summary}")
+        if self.cancelled:
+            summary_lines.append(f"已取消 {len(self.cancelled)} 项")
 
-        status_parts = [f"提取完成：成功 {success_count} 项"]
+        status_prefix = "提取已取消" if self.cancelled else "提取完成"
+        status_parts = [f"{status_prefix}：成功 {success_count} 项"]
         if self.missing_scene_pkg_ids:
             status_parts.append(f"缺少资源 {len(self.missing_scene_pkg_ids)} 项")
         if self.failure_details:
             status_parts.append(f"失败 {len(self.failure_details)} 项")
+        if self.timed_out_ids:
+            status_parts.append(f"超时 {len(self.timed_out_ids)} 项")
+        if self.cancelled:
+            status_parts.append(f"取消 {len(self.cancelled)} 项")
 
         return "\n".join(summary_lines), "，".join(status_parts), self.has_warnings
 
 
+@dataclass(frozen=True, slots=True)
+class ExtractionRunStats:
+    run_id: str
+    started_at: float
+    item_count: int
+    succeeded_count: int
+    failed_count: int
+    cancelled_count: int
+    timed_out_count: int
+    total_bytes: int
+    wall_seconds: float
+    bytes_per_second: float
+    failure_rate: float
+    mean_duration_seconds: float
+    p95_duration_seconds: float
+    mean_queue_wait_seconds: float
+    worker_count: int
+
+
 @dataclass(frozen=True, slots=True)
 class ExtractionTaskInfo:
     requested_count: int
     executable_count: int
     skipped_count: int
     effective_workers: int
+    estimated_seconds: float | None = None
+    adaptive_workers: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class ExtractionItemProgress:
+    item_id: str
+    files_extracted: int = 0
+    bytes_extracted: int = 0
+    current_entry: str = ""
+    pkg_bytes: int = 0
+    worker: str = ""
 
 
 @dataclass(frozen=True, slots=True)
@@ -209,9 +296,87 @@ class ExtractionProgress:
     total: int
     current_item_id: str = ""
     message: str = ""
+    eta_seconds: float | None = None
+    effective_workers: int = 0
+    item_progress: ExtractionItemProgress | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class ExtractionJob:
+    job_id: str
+    state: JobState = JobState.QUEUED
+    item_ids: tuple[str, ...] = field(default_factory=tuple)
+    options: Mapping[str, object] = field(default_factory=dict)
+    created_at: float = 0.0
+    started_at: float | None = None
+    finished_at: float | None = None
+    completed: int = 0
+    total: int = 0
+    error: str = ""
+    summary: Mapping[str, object] | None = None
+    current_item_id: str = ""
+    item_progress: ExtractionItemProgress | None = None
 
 
 @dataclass(frozen=True, slots=True)
 class ExtractionOutcome:
     plan: ExtractionPlan
     summary: ExtractionSummary
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogTimings:
+    scan_seconds: float | None = None
+    scanned_count: int = 0
+    load_seconds: float | None = None
+    loaded_count: int = 0
+    filter_seconds: float | None = None
+    filtered_count: int = 0
+
+    @property
+    def folders_per_second(self) -> float:
+        return self.scanned_count / self.scan_seconds if self.scan_seconds else 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class WorkerActivity:
+    worker: str
+    item_id: str = ""
+    files_extracted: int = 0
+    bytes_extracted: int = 0
+    current_entry: str = ""
+    updated_at: float = 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class DiagnosticsSnapshot:
+    captured_at: float
+    catalog: CatalogTimings = field(default_factory=CatalogTimings)
+    catalog_count: int = 0
+    visible_count: int = 0
+    thumbnail_cached_count: int = 0
+    thumbnail_cached_bytes: int = 0
+    thumbnail_hits: int = 0
+    thumbnail_misses: int = 0
+    pending_decodes: int = 0
+    active_decode_threads: int = 0
+    extraction_running: bool = False
+    extraction_completed: int = 0
+    extraction_total: int = 0
+    extraction_seconds: float = 0.0
+    extraction_bytes: int = 0
+    workers: tuple[WorkerActivity, ...] = field(default_factory=tuple)
+    spans: Mapping[str, Mapping[str, float]] = field(default_factory=dict)
+
+    @property
+    def thumbnail_hit_rate(self) -> float:
+        lookups = self.thumbnail_hits + self.thumbnail_misses
+        return self.thumbnail_hits / lookups if lookups else 0.0
+
+    @property
+    def extraction_items_per_second(self) -> float:
+        return self.extraction_completed / self.extraction_seconds if self.extraction_seconds > 0 else 0.0
+
+    @property
+    def extraction_bytes_per_second(self) -> float:
+        return self.extraction_bytes / self.extraction_seconds if self.extraction_seconds > 0 else 0.0
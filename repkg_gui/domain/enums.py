@@ -18,6 +18,19 @@ class TaskState(StrEnum):
     EXTRACTING = "extracting"
 
 
+class JobState(StrEnum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+    INTERRUPTED = "interrupted"
+
+    @property
+    def is_finished(self) -> bool:
+        return self not in (JobState.QUEUED, JobState.RUNNING)
+
+
 class OutputMode(StrEnum):
     LOCAL = "local"
     SHARED = "shared"
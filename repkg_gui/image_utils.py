@@ -1,10 +1,18 @@
 from __future__ import annotations
 
-from PIL import Image, ImageSequence, UnidentifiedImageError
+from typing import TYPE_CHECKING
+
 from PySide6.QtGui import QImage, QPixmap
 
+from repkg_gui import instrumentation
+
+if TYPE_CHECKING:
+    from PIL import Image
+
 
 def _select_representative_frame(pil_image: Image.Image) -> Image.Image:
+    from PIL import ImageSequence
+
     if not getattr(pil_image, "is_animated", False):
         return pil_image.convert("RGBA")
 
@@ -36,6 +44,9 @@ def load_static_qimage(path: str) -> QImage:
         if not image.isNull():
             return image
 
+    with instrumentation.import_span("PIL.Image"):
+        from PIL import Image, UnidentifiedImageError
+
     try:
         with Image.open(path) as pil_image:
             frame = _select_representative_frame(pil_image)
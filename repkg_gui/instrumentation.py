@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import atexit
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from typing import Any, Callable, ContextManager, TextIO, TypeVar
+
+import app_services
+
+INSTRUMENTATION_ENV = "REPKG_GUI_INSTRUMENT"
+INSTRUMENTATION_OUTPUT_ENV = "REPKG_GUI_INSTRUMENT_OUTPUT"
+INSTRUMENTATION_FILENAME = "instrumentation.json"
+_ENABLED_VALUES = ("1", "true", "yes", "on")
+_NULL_SPAN = nullcontext()
+_PROCESS_STARTED_AT = time.perf_counter()
+_Function = TypeVar("_Function", bound=Callable[..., Any])
+
+
+@dataclass(slots=True)
+class SpanStats:
+    count: int = 0
+    total_seconds: float = 0.0
+    min_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def add(self, seconds: float) -> None:
+        if self.count == 0 or seconds < self.min_seconds:
+            self.min_seconds = seconds
+        if seconds > self.max_seconds:
+            self.max_seconds = seconds
+        self.count += 1
+        self.total_seconds += seconds
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "total_seconds": round(self.total_seconds, 6),
+            "mean_seconds": round(self.total_seconds / self.count, 6) if self.count else 0.0,
+            "min_seconds": round(self.min_seconds, 6),
+            "max_seconds": round(self.max_seconds, 6),
+        }
+
+
+class Instrumentation:
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self.output_path = ""
+        self._lock = threading.Lock()
+        self._spans: dict[str, SpanStats] = {}
+        self._counters: dict[str, int] = {}
+        self._started_at = time.time()
+        self._exit_hook_registered = False
+
+    def span(self, name: str) -> ContextManager[None]:
+        if not self.enabled:
+            return _NULL_SPAN
+        return self._timed_span(name)
+
+    @contextmanager
+    def _timed_span(self, name: str) -> Iterator[None]:
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started_at)
+
+    def record(self, name: str, seconds: float) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            stats = self._spans.get(name)
+            if stats is None:
+                stats = self._spans[name] = SpanStats()
+            stats.add(seconds)
+
+    def count(self, name: str, value: int = 1) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def enable(self, output_path: str = "", dump_on_exit: bool = True) -> None:
+        self.enabled = True
+        self.output_path = output_path
+        if dump_on_exit and not self._exit_hook_registered:
+            atexit.register(self.dump)
+            self._exit_hook_registered = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def reset(self) -> None:
+        with self._lock:
+            self._spans.clear()
+            self._counters.clear()
+            self._started_at = time.time()
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            spans = {name: stats.to_json() for name, stats in sorted(self._spans.items())}
+            counters = dict(sorted(self._counters.items()))
+            started_at = self._started_at
+        return {
+            "started_at": round(started_at, 3),
+            "duration_seconds": round(time.time() - started_at, 3),
+            "pid": os.getpid(),
+            "spans": spans,
+            "counters": counters,
+        }
+
+    def format_summary(self, snapshot: dict[str, Any] | None = None) -> str:
+        data = snapshot or self.snapshot()
+        lines = [f"[instrumentation] {data['duration_seconds']:.1f}s"]
+        for name, stats in sorted(data["spans"].items(), key=lambda item: item[1]["total_seconds"], reverse=True):
+            lines.append(
+                f"  {name}: {stats['count']} 次，共 {stats['total_seconds'] * 1000:.1f} ms，"
+                f"平均 {stats['mean_seconds'] * 1000:.2f} ms，最长 {stats['max_seconds'] * 1000:.2f} ms"
+            )
+        for name, value in data["counters"].items():
+            lines.append(f"  {name} = {value}")
+        return "\n".join(lines)
+
+    def resolve_output_path(self) -> str:
+        if self.output_path:
+            return self.output_path
+        return os.path.join(app_services.RUNTIME_DIR, INSTRUMENTATION_FILENAME)
+
+    def write_json(self, path: str | None = None, snapshot: dict[str, Any] | None = None) -> str:
+        target_path = path or self.resolve_output_path()
+        parent_dir = os.path.dirname(target_path)
+        if parent_dir:
+            os.makedirs(parent_dir, exist_ok=True)
+        with open(target_path, "w", encoding="utf-8") as file:
+            json.dump(snapshot or self.snapshot(), file, ensure_ascii=False, indent=2)
+        return target_path
+
+    def dump(self, stream: TextIO | None = None) -> str:
+        snapshot = self.snapshot()
+        if not snapshot["spans"] and not snapshot["counters"]:
+            return ""
+        try:
+            target_path = self.write_json(snapshot=snapshot)
+        except OSError as exc:
+            target_path = ""
+            print(f"[instrumentation] 写入结果失败: {exc}", file=stream or sys.stderr)
+        print(self.format_summary(snapshot), file=stream or sys.stderr)
+        return target_path
+
+
+_INSTRUMENTATION = Instrumentation()
+
+
+def get_instrumentation() -> Instrumentation:
+    return _INSTRUMENTATION
+
+
+def is_enabled() -> bool:
+    return _INSTRUMENTATION.enabled
+
+
+def span(name: str) -> ContextManager[None]:
+    if not _INSTRUMENTATION.enabled:
+        return _NULL_SPAN
+    return _INSTRUMENTATION._timed_span(name)
+
+
+def import_span(module_name: str) -> ContextManager[None]:
+    if not _INSTRUMENTATION.enabled or module_name in sys.modules:
+        return _NULL_SPAN
+    return _INSTRUMENTATION._timed_span(f"import.{module_name}")
+
+
+def mark(name: str) -> None:
+    if _INSTRUMENTATION.enabled:
+        _INSTRUMENTATION.record(name, time.perf_counter() - _PROCESS_STARTED_AT)
+
+
+def record(name: str, seconds: float) -> None:
+    if _INSTRUMENTATION.enabled:
+        _INSTRUMENTATION.record(name, seconds)
+
+
+def count(name: str, value: int = 1) -> None:
+    if _INSTRUMENTATION.enabled:
+        _INSTRUMENTATION.count(name, value)
+
+
+def timed(name: str) -> Callable[[_Function], _Function]:
+    def decorator(function: _Function) -> _Function:
+        @functools.wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _INSTRUMENTATION.enabled:
+                return function(*args, **kwargs)
+            started_at = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                _INSTRUMENTATION.record(name, time.perf_counter() - started_at)
+
+        return wrapper
+
+    return decorator
+
+
+def configure_from_environment(environ: dict[str, str] | None = None) -> bool:
+    values = os.environ if environ is None else environ
+    if values.get(INSTRUMENTATION_ENV, "").strip().lower() not in _ENABLED_VALUES:
+        return False
+    _INSTRUMENTATION.enable(values.get(INSTRUMENTATION_OUTPUT_ENV, "").strip())
+    return True
+
+
+configure_from_environment()
@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+import ipaddress
+import json
+import os
+import threading
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import replace
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+import app_services
+from repkg_gui.domain.entities import ExtractionJob, FilterState, SessionSettings, WallpaperRecord
+from repkg_gui.domain.enums import FilterField
+from repkg_gui.models.selection_model import filter_records
+from repkg_gui.services.catalog_service import CatalogService
+from repkg_gui.services.extraction_concurrency import SharedWorkerBudget
+from repkg_gui.services.extraction_jobs import (
+    DEFAULT_MAX_CONCURRENT_JOBS,
+    JOB_LIST_LIMIT,
+    ExtractionJobQueue,
+    ExtractionJobStore,
+)
+from repkg_gui.services.extraction_service import ExtractionService
+from repkg_gui.services.runtime_compat import RuntimeCompatService
+
+DEFAULT_JOB_SERVER_HOST = "127.0.0.1"
+DEFAULT_JOB_SERVER_PORT = 8765
+MAX_REQUEST_BODY_BYTES = 1024 * 1024
+JSON_CONTENT_TYPE = "application/json"
+
+
+class JobServerError(Exception):
+    def __init__(self, status: HTTPStatus, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+def is_loopback_host(host: str) -> bool:
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def job_to_json(job: ExtractionJob) -> dict[str, Any]:
+    payload: dict[str, Any] = {
+        "job_id": job.job_id,
+        "state": job.state.value,
+        "item_ids": list(job.item_ids),
+        "options": dict(job.options),
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "finished_at": job.finished_at,
+        "completed": job.completed,
+        "total": job.total,
+        "error": job.error,
+        "summary": dict(job.summary) if job.summary is not None else None,
+        "current_item_id": job.current_item_id,
+    }
+    if job.item_progress is not None:
+        payload["item_progress"] = {
+            "item_id": job.item_progress.item_id,
+            "files_extracted": job.item_progress.files_extracted,
+            "bytes_extracted": job.item_progress.bytes_extracted,
+            "current_entry": job.item_progress.current_entry,
+            "pkg_bytes": job.item_progress.pkg_bytes,
+            "worker": job.item_progress.worker,
+        }
+    return payload
+
+
+def resolve_job_item_ids(payload: Mapping[str, Any], records: Sequence[WallpaperRecord]) -> tuple[str, ...]:
+    raw_ids = payload.get("ids") or ()
+    if isinstance(raw_ids, str) or not isinstance(raw_ids, (list, tuple)):
+        raise JobServerError(HTTPStatus.BAD_REQUEST, "ids 必须是数组")
+
+    filter_states = tuple(
+        FilterState(field=filter_field, value=str(payload[key]))
+        for key, filter_field in (("tag", FilterField.TAGS), ("type", FilterField.TYPE), ("title", FilterField.TITLE))
+        if payload.get(key)
+    )
+    requested_ids = tuple(str(item_id).strip() for item_id in raw_ids if str(item_id).strip())
+    if requested_ids:
+        if not filter_states:
+            return requested_ids
+        allowed_ids = {record.id for record in filter_records(records, filter_states)}
+        return tuple(item_id for item_id in requested_ids if item_id in allowed_ids)
+    if not payload.get("all") and not filter_states:
+        raise JobServerError(HTTPStatus.BAD_REQUEST, "请指定 ids、筛选条件或 all")
+    return tuple(record.id for record in filter_records(records, filter_states) if record.id)
+
+
+class CatalogRecordsProvider:
+    def __init__(self, catalog_service: CatalogService, steam_path_provider: Callable[[], str]) -> None:
+        self._catalog_service = catalog_service
+        self._steam_path_provider = steam_path_provider
+        self._lock = threading.Lock()
+        self._signature: tuple[str, int, int] | None = None
+        self._records: Sequence[WallpaperRecord] = ()
+
+    def __call__(self) -> Sequence[WallpaperRecord]:
+        csv_path = app_services.INFO_CSV_FILE
+        with self._lock:
+            try:
+                stat_result = os.stat(csv_path)
+            except FileNotFoundError:
+                steam_path = self._steam_path_provider()
+                if not self._catalog_service.runtime.has_valid_steam_path(steam_path):
+                    raise ValueError("steam.exe 路径无效，无法扫描 Workshop") from None
+                self._records = self._catalog_service.scan_catalog(steam_path).records
+                stat_result = os.stat(csv_path)
+                self._signature = (csv_path, stat_result.st_mtime_ns, stat_result.st_size)
+                return self._records
+
+            signature = (csv_path, stat_result.st_mtime_ns, stat_result.st_size)
+            if signature != self._signature:
+                snapshot = self._catalog_service.load_cached_snapshot(csv_path, steam_path=self._steam_path_provider())
+                self._records = snapshot.records
+                self._signature = signature
+            return self._records
+
+
+class ExtractionJobServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], queue: ExtractionJobQueue, records_provider: CatalogRecordsProvider) -> None:
+        if not is_loopback_host(address[0]):
+            raise ValueError(f"任务服务只能绑定到本机回环地址: {address[0]}")
+        super().__init__(address, _JobRequestHandler)
+        self.queue = queue
+        self.records_provider = records_provider
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def allowed_hosts(self) -> frozenset[str]:
+        host, port = self.server_address[:2]
+        bound_host = f"[{host}]" if ":" in host else host
+        return frozenset({f"{bound_host}:{port}".lower(), f"localhost:{port}"})
+
+    def close(self) -> None:
+        self.shutdown()
+        self.server_close()
+        self.queue.shutdown()
+        self.queue.store.close()
+
+
+class _JobRequestHandler(BaseHTTPRequestHandler):
+    server: ExtractionJobServer
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+    def do_DELETE(self) -> None:
+        self._dispatch("DELETE")
+
+    def log_message(self, format: str, *args: Any) -> None:
+        return
+
+    def _dispatch(self, method: str) -> None:
+        try:
+            self._check_request(method)
+            status, payload = self._route(method)
+        except JobServerError as exc:
+            if exc.status in (HTTPStatus.FORBIDDEN, HTTPStatus.UNSUPPORTED_MEDIA_TYPE):
+                self.close_connection = True
+            status, payload = exc.status, {"error": str(exc)}
+        except (OSError, ValueError) as exc:
+            status, payload = HTTPStatus.BAD_REQUEST, {"error": str(exc)}
+        except RuntimeError as exc:
+            status, payload = HTTPStatus.SERVICE_UNAVAILABLE, {"error": str(exc)}
+        except Exception as exc:
+            app_services.log_error(f"任务服务处理 {method} {self.path} 失败: {exc}")
+            status, payload = HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(exc)}
+        self._send_json(status, payload)
+
+    def _check_request(self, method: str) -> None:
+        if self.headers.get("Origin") is not None:
+            raise JobServerError(HTTPStatus.FORBIDDEN, "任务服务不接受来自浏览器页面的跨源请求")
+        host = (self.headers.get("Host") or "").strip().lower()
+        if host not in self.server.allowed_hosts:
+            raise JobServerError(HTTPStatus.FORBIDDEN, f"Host 请求头无效: {host or '缺失'}")
+        if method == "POST":
+            content_type = (self.headers.get("Content-Type") or "").split(";", 1)[0].strip().lower()
+            if content_type != JSON_CONTENT_TYPE:
+                raise JobServerError(HTTPStatus.UNSUPPORTED_MEDIA_TYPE, f"Content-Type 必须是 {JSON_CONTENT_TYPE}")
+
+    def _route(self, method: str) -> tuple[HTTPStatus, dict[str, Any]]:
+        url = urlsplit(self.path)
+        parts = [part for part in url.path.split("/") if part]
+        queue = self.server.queue
+
+        if parts == ["health"] and method == "GET":
+            budget = queue.worker_budget
+            return HTTPStatus.OK, {"status": "ok", "workers": budget.max_workers, "active_workers": budget.active}
+        if parts == ["jobs"] and method == "GET":
+            limit = int(parse_qs(url.query).get("limit", [JOB_LIST_LIMIT])[0])
+            return HTTPStatus.OK, {"jobs": [job_to_json(job) for job in queue.list(limit)]}
+        if parts == ["jobs"] and method == "POST":
+            payload = self._read_json()
+            item_ids = resolve_job_item_ids(payload, self.server.records_provider())
+            if not item_ids:
+                raise JobServerError(HTTPStatus.UNPROCESSABLE_ENTITY, "没有匹配的壁纸")
+            job = queue.submit(item_ids, payload.get("options"))
+            return HTTPStatus.ACCEPTED, {"job": job_to_json(job)}
+        if len(parts) == 2 and parts[0] == "jobs" and method == "GET":
+            job = queue.get(parts[1])
+            if job is None:
+                raise JobServerError(HTTPStatus.NOT_FOUND, "任务不存在")
+            return HTTPStatus.OK, {"job": job_to_json(job)}
+        if (len(parts) == 3 and parts[0] == "jobs" and parts[2] == "cancel" and method == "POST") or (
+            len(parts) == 2 and parts[0] == "jobs" and method == "DELETE"
+        ):
+            job = queue.cancel(parts[1])
+            if job is None:
+                raise JobServerError(HTTPStatus.NOT_FOUND, "任务不存在")
+            return HTTPStatus.OK, {"job": job_to_json(job)}
+        raise JobServerError(HTTPStatus.NOT_FOUND, "接口不存在")
+
+    def _read_json(self) -> dict[str, Any]:
+        raw_length = self.headers.get("Content-Length") or "0"
+        try:
+            length = int(raw_length)
+        except ValueError:
+            length = -1
+        if length < 0:
+            self.close_connection = True
+            raise JobServerError(HTTPStatus.BAD_REQUEST, f"Content-Length 无效: {raw_length}")
+        if length > MAX_REQUEST_BODY_BYTES:
+            self.close_connection = True
+            raise JobServerError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "请求体过大")
+        body = self.rfile.read(length) if length else b"{}"
+        try:
+            payload = json.loads(body.decode("utf-8"))
+        except (UnicodeDecodeError, ValueError) as exc:
+            raise JobServerError(HTTPStatus.BAD_REQUEST, f"请求体不是有效的 JSON: {exc}") from exc
+        if not isinstance(payload, dict):
+            raise JobServerError(HTTPStatus.BAD_REQUEST, "请求体必须是 JSON 对象")
+        return payload
+
+    def _send_json(self, status: HTTPStatus, payload: Mapping[str, Any]) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def create_job_server(
+    host: str = DEFAULT_JOB_SERVER_HOST,
+    port: int = DEFAULT_JOB_SERVER_PORT,
+    steam_path: str = "",
+    workers: int | None = None,
+    max_concurrent_jobs: int = DEFAULT_MAX_CONCURRENT_JOBS,
+    runtime: RuntimeCompatService | None = None,
+    store_path: str | None = None,
+) -> ExtractionJobServer:
+    runtime = runtime or RuntimeCompatService()
+    catalog_service = CatalogService(runtime=runtime)
+    extraction_service = ExtractionService(runtime=runtime)
+
+    def resolve_steam_path() -> str:
+        configured = steam_path or runtime.load_config().steam_path
+        return os.path.normpath(configured) if configured else ""
+
+    def settings_provider() -> SessionSettings:
+        return replace(runtime.session_settings_from_config(), steam_path=resolve_steam_path())
+
+    budget_size = runtime.resolve_batch_extract_workers(
+        workers if workers is not None else runtime.load_config().batch_extract_workers
+    )
+    records_provider = CatalogRecordsProvider(catalog_service, resolve_steam_path)
+    queue = ExtractionJobQueue(
+        extraction_service,
+        records_provider,
+        settings_provider,
+        ExtractionJobStore(store_path),
+        SharedWorkerBudget(budget_size),
+        max_concurrent_jobs=max_concurrent_jobs,
+    )
+    try:
+        server = ExtractionJobServer((host, port), queue, records_provider)
+    except BaseException:
+        queue.shutdown()
+        queue.store.close()
+        raise
+    queue.resume_pending()
+    return server
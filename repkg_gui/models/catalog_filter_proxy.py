@@ -2,15 +2,19 @@ from __future__ import annotations
 
 from PySide6.QtCore import QModelIndex, QSortFilterProxyModel, Qt
 
+from repkg_gui import instrumentation
+from repkg_gui.domain.catalog_store import CatalogRecord
 from repkg_gui.domain.entities import FilterState, WallpaperRecord
-from repkg_gui.domain.enums import FilterField
 from repkg_gui.models.catalog_table_model import CatalogTableModel
+from repkg_gui.models.selection_model import build_row_matcher
 
 
 class CatalogFilterProxyModel(QSortFilterProxyModel):
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
         self._filter_state = FilterState()
+        self._row_matcher = None
+        self._matcher_records = None
         self.setDynamicSortFilter(True)
         self.setSortCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
         self.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
@@ -27,25 +31,26 @@ class CatalogFilterProxyModel(QSortFilterProxyModel):
         normalized_state = FilterState(field=filter_state.field, value=filter_state.value.strip())
         if normalized_state == self._filter_state:
             return
-        self.beginFilterChange()
-        self._filter_state = normalized_state
-        self.endFilterChange(QSortFilterProxyModel.Direction.Rows)
+        with instrumentation.span("filter.apply"):
+            self.beginFilterChange()
+            self._filter_state = normalized_state
+            self._matcher_records = None
+            self.endFilterChange(QSortFilterProxyModel.Direction.Rows)
+        source_model = self.sourceModel()
+        instrumentation.count("filter.rows_evaluated", source_model.rowCount() if source_model is not None else 0)
 
     def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
         source_model = self.sourceModel()
         if not isinstance(source_model, CatalogTableModel):
             return True
 
-        record = source_model.record_at(source_row)
-        if record is None or not self._filter_state.is_active:
-            return record is not None
-
-        keyword = self._filter_state.value.casefold()
-        if self._filter_state.field is FilterField.TITLE:
-            return keyword in record.display_title.casefold()
-        if self._filter_state.field is FilterField.TAGS:
-            return any(keyword in tag.casefold() for tag in record.tags)
-        return keyword in record.type.casefold()
+        records = source_model.all_records()
+        if self._matcher_records is not records:
+            self._row_matcher = build_row_matcher(records, self._filter_state)
+            self._matcher_records = records
+        if not 0 <= source_row < len(records):
+            return False
+        return self._row_matcher is None or self._row_matcher(source_row)
 
     def lessThan(self, left: QModelIndex, right: QModelIndex) -> bool:
         if left.column() in (CatalogTableModel.COLUMN_INDEX, CatalogTableModel.COLUMN_ID):
@@ -76,7 +81,7 @@ class CatalogFilterProxyModel(QSortFilterProxyModel):
         if row < 0 or row >= self.rowCount():
             return None
         record = self.index(row, CatalogTableModel.COLUMN_TITLE).data(CatalogTableModel.RECORD_ROLE)
-        if isinstance(record, WallpaperRecord):
+        if isinstance(record, (WallpaperRecord, CatalogRecord)):
             return record
         return None
 
@@ -4,6 +4,7 @@ from collections.abc import Sequence
 
 from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
 
+from repkg_gui.domain.catalog_store import CatalogRecord, freeze_records
 from repkg_gui.domain.entities import WallpaperRecord
 from repkg_gui.models.selection_model import format_visibility
 
@@ -27,17 +28,17 @@ class CatalogTableModel(QAbstractTableModel):
 
     def __init__(self, records: Sequence[WallpaperRecord] | None = None, parent=None) -> None:
         super().__init__(parent)
-        self._records: tuple[WallpaperRecord, ...] = tuple(records or ())
+        self._records: Sequence[WallpaperRecord | CatalogRecord] = freeze_records(records or ())
 
     def set_records(self, records: Sequence[WallpaperRecord]) -> None:
         self.beginResetModel()
-        self._records = tuple(records)
+        self._records = freeze_records(records)
         self.endResetModel()
 
-    def all_records(self) -> tuple[WallpaperRecord, ...]:
+    def all_records(self) -> Sequence[WallpaperRecord | CatalogRecord]:
         return self._records
 
-    def record_at(self, row: int) -> WallpaperRecord | None:
+    def record_at(self, row: int) -> WallpaperRecord | CatalogRecord | None:
         if 0 <= row < len(self._records):
             return self._records[row]
         return None
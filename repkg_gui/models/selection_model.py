@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from typing import Iterable
 
-from repkg_gui.domain.entities import WallpaperRecord
+from repkg_gui.domain.catalog_store import CatalogStore
+from repkg_gui.domain.entities import FilterState, WallpaperRecord, WorkshopChanges
 from repkg_gui.domain.enums import FilterField
 
 VISIBILITY_LABELS = {
@@ -60,6 +62,17 @@ def build_loaded_status(total_count: int, refreshed: bool = False) -> str:
     return f"{prefix} {total_count} 项壁纸数据。"
 
 
+def build_workshop_changes_status(changes: WorkshopChanges, total_count: int) -> str:
+    parts = []
+    if changes.added:
+        parts.append(f"新增 {len(changes.added)} 项")
+    if changes.changed:
+        parts.append(f"更新 {len(changes.changed)} 项")
+    if changes.removed:
+        parts.append(f"移除 {len(changes.removed)} 项")
+    return f"检测到创意工坊变化：{'，'.join(parts) or '无变化'}，当前共 {total_count} 项壁纸。"
+
+
 def build_filter_status(field: FilterField, keyword: str, visible_count: int, total_count: int) -> str:
     normalized_keyword = keyword.strip()
     if not normalized_keyword:
@@ -80,7 +93,7 @@ def metadata_lines(record: WallpaperRecord) -> tuple[str, ...]:
     tags_display = record.tags_text or "未标注"
     type_display = record.type or "未标注"
     project_file = record.file or "未标注"
-    return (
+    lines = (
         f"ID：{record.id or '未标注'}",
         f"标签：{tags_display}",
         f"类型：{type_display}",
@@ -88,9 +101,14 @@ def metadata_lines(record: WallpaperRecord) -> tuple[str, ...]:
         f"项目文件：{project_file}",
         f"预览文件：{preview_display}",
     )
+    if record.library:
+        return (*lines, f"Steam 库：{record.library}")
+    return lines
 
 
 def distinct_field_values(records: Iterable[WallpaperRecord], field: FilterField) -> tuple[str, ...]:
+    if isinstance(records, CatalogStore):
+        return records.vocabulary.options(field)
     if field is FilterField.TAGS:
         values = {tag for record in records for tag in record.tags if tag}
     elif field is FilterField.TYPE:
@@ -98,3 +116,45 @@ def distinct_field_values(records: Iterable[WallpaperRecord], field: FilterField
     else:
         values = set()
     return tuple(sorted(values, key=str.casefold))
+
+
+def record_matches_filter(record: WallpaperRecord, filter_state: FilterState) -> bool:
+    if not filter_state.is_active:
+        return True
+
+    keyword = filter_state.value.strip().casefold()
+    if filter_state.field is FilterField.TITLE:
+        return keyword in record.display_title.casefold()
+    if filter_state.field is FilterField.TAGS:
+        return any(keyword in tag.casefold() for tag in record.tags)
+    return keyword in record.type.casefold()
+
+
+def build_row_matcher(
+    records: Sequence[WallpaperRecord],
+    filter_state: FilterState,
+) -> Callable[[int], bool] | None:
+    if not filter_state.is_active:
+        return None
+
+    if not isinstance(records, CatalogStore):
+        return lambda row: record_matches_filter(records[row], filter_state)
+
+    keyword = filter_state.value.strip().casefold()
+    if filter_state.field is FilterField.TITLE:
+        return lambda row: keyword in (records.title_at(row) or records.id_at(row)).casefold()
+    if filter_state.field is FilterField.TAGS:
+        tag_ids = frozenset(tag_id for tag_id, tag in enumerate(records.tags.values) if keyword in tag.casefold())
+        return lambda row: not tag_ids.isdisjoint(records.tag_ids_at(row))
+    type_ids = frozenset(type_id for type_id, value in enumerate(records.types.values) if keyword in value.casefold())
+    return lambda row: records.type_id_at(row) in type_ids
+
+
+def filter_records(
+    records: Iterable[WallpaperRecord],
+    filter_states: Iterable[FilterState],
+) -> tuple[WallpaperRecord, ...]:
+    active_states = tuple(state for state in filter_states if state.is_active)
+    return tuple(
+        record for record in records if all(record_matches_filter(record, state) for state in active_states)
+    )
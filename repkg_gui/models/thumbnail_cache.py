@@ -11,13 +11,41 @@ class ThumbnailCache:
     _pixmaps: dict[str, QPixmap] = field(default_factory=dict)
     _pending: set[str] = field(default_factory=set)
     _placeholders: dict[str, QPixmap] = field(default_factory=dict)
+    hit_count: int = 0
+    miss_count: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hit_count + self.miss_count
+        return self.hit_count / lookups if lookups else 0.0
+
+    @property
+    def cached_count(self) -> int:
+        return len(self._pixmaps)
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    @property
+    def cached_bytes(self) -> int:
+        return sum(pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8 for pixmap in self._pixmaps.values())
+
+    def reset_stats(self) -> None:
+        self.hit_count = 0
+        self.miss_count = 0
 
     @staticmethod
     def build_key(path: str, size: QSize) -> str:
         return f"{path}|{size.width()}x{size.height()}"
 
     def get(self, key: str) -> QPixmap | None:
-        return self._pixmaps.get(key)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is None:
+            self.miss_count += 1
+        else:
+            self.hit_count += 1
+        return pixmap
 
     def store(self, key: str, pixmap: QPixmap) -> None:
         self._pixmaps[key] = pixmap
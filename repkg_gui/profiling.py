@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import cProfile
+import marshal
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime
+from types import FrameType
+
+import app_services
+
+PROFILES_DIRNAME = "profiles"
+PROFILE_MODES = ("both", "cprofile", "sample")
+DEFAULT_PROFILE_MODE = "both"
+DEFAULT_PROFILE_SECONDS = 30.0
+MAX_PROFILE_SECONDS = 600.0
+DEFAULT_SAMPLE_INTERVAL_SECONDS = 0.005
+MAX_STACK_DEPTH = 128
+_ACTIVE_SESSION_LOCK = threading.Lock()
+_active_session: "ProfileSession | None" = None
+
+
+@dataclass(frozen=True, slots=True)
+class ProfileResult:
+    mode: str
+    started_at: float
+    duration_seconds: float
+    sample_count: int = 0
+    pstats_path: str = ""
+    collapsed_path: str = ""
+
+    @property
+    def output_paths(self) -> tuple[str, ...]:
+        return tuple(path for path in (self.pstats_path, self.collapsed_path) if path)
+
+
+def resolve_profiles_dir() -> str:
+    return os.path.join(app_services.RUNTIME_DIR, PROFILES_DIRNAME)
+
+
+def normalize_profile_seconds(value: float | str | None) -> float:
+    try:
+        seconds = float(value) if value is not None else DEFAULT_PROFILE_SECONDS
+    except (TypeError, ValueError):
+        raise ValueError(f"性能剖析时长必须是数字: {value}") from None
+    if seconds <= 0:
+        raise ValueError("性能剖析时长必须大于 0 秒")
+    return min(seconds, MAX_PROFILE_SECONDS)
+
+
+def format_frame(frame: FrameType) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def collapse_stack(frame: FrameType | None, max_depth: int = MAX_STACK_DEPTH) -> tuple[str, ...]:
+    frames = []
+    while frame is not None and len(frames) < max_depth:
+        frames.append(format_frame(frame))
+        frame = frame.f_back
+    return tuple(reversed(frames))
+
+
+def format_collapsed_stacks(counts: Counter[tuple[str, ...]]) -> str:
+    lines = [
+        f"{';'.join(part.replace(';', ':') for part in stack)} {count}"
+        for stack, count in sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+    ]
+    return "\n".join(lines) + ("\n" if lines else "")
+
+
+def get_active_session() -> "ProfileSession | None":
+    return _active_session
+
+
+class StackSampler:
+    def __init__(self, duration_seconds: float, interval_seconds: float = DEFAULT_SAMPLE_INTERVAL_SECONDS) -> None:
+        self.duration_seconds = duration_seconds
+        self.interval_seconds = max(interval_seconds, 0.001)
+        self.sample_count = 0
+        self._counts: Counter[tuple[str, ...]] = Counter()
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="repkg-profile-sampler", daemon=True)
+
+    @property
+    def counts(self) -> Counter[tuple[str, ...]]:
+        with self._lock:
+            return Counter(self._counts)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def sample_once(self) -> None:
+        own_ident = threading.get_ident()
+        thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+        stacks = []
+        for ident, frame in sys._current_frames().items():
+            if ident == own_ident:
+                continue
+            thread_name = thread_names.get(ident, f"thread-{ident}")
+            stacks.append((thread_name, *collapse_stack(frame)))
+        with self._lock:
+            self._counts.update(stacks)
+            self.sample_count += 1
+
+    def _run(self) -> None:
+        deadline = time.monotonic() + self.duration_seconds
+        while not self._stop_event.is_set() and time.monotonic() < deadline:
+            self.sample_once()
+            self._stop_event.wait(self.interval_seconds)
+
+
+class ProfileSession:
+    def __init__(
+        self,
+        duration_seconds: float = DEFAULT_PROFILE_SECONDS,
+        mode: str = DEFAULT_PROFILE_MODE,
+        output_dir: str | None = None,
+        sample_interval_seconds: float = DEFAULT_SAMPLE_INTERVAL_SECONDS,
+    ) -> None:
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"未知的性能剖析模式: {mode}")
+        self.duration_seconds = normalize_profile_seconds(duration_seconds)
+        self.mode = mode
+        self.output_dir = output_dir
+        self._sample_interval_seconds = sample_interval_seconds
+        self._profiler: cProfile.Profile | None = None
+        self._profiler_thread_id = 0
+        self._sampler: StackSampler | None = None
+        self._started_at = 0.0
+        self._started_monotonic = 0.0
+        self._result: ProfileResult | None = None
+        self._stop_lock = threading.Lock()
+
+    @property
+    def is_active(self) -> bool:
+        return _active_session is self
+
+    @property
+    def remaining_seconds(self) -> float:
+        if not self.is_active:
+            return 0.0
+        return max(self.duration_seconds - (time.monotonic() - self._started_monotonic), 0.0)
+
+    def start(self) -> "ProfileSession":
+        global _active_session
+        with _ACTIVE_SESSION_LOCK:
+            if _active_session is not None:
+                raise RuntimeError("已有性能剖析正在进行")
+            _active_session = self
+        self._started_at = time.time()
+        self._started_monotonic = time.monotonic()
+        if self.mode in ("both", "sample"):
+            self._sampler = StackSampler(self.duration_seconds, self._sample_interval_seconds)
+            self._sampler.start()
+        if self.mode in ("both", "cprofile"):
+            self._profiler = cProfile.Profile()
+            self._profiler_thread_id = threading.get_ident()
+            self._profiler.enable()
+        return self
+
+    def stop(self) -> ProfileResult:
+        global _active_session
+        with self._stop_lock:
+            self._disable_profiler()
+            if self._result is not None:
+                return self._result
+            if self._sampler is not None:
+                self._sampler.stop()
+            duration_seconds = min(time.monotonic() - self._started_monotonic, self.duration_seconds)
+            try:
+                self._result = self._write_outputs(duration_seconds)
+            finally:
+                with _ACTIVE_SESSION_LOCK:
+                    if _active_session is self:
+                        _active_session = None
+            return self._result
+
+    def _disable_profiler(self) -> None:
+        if self._profiler is None or not self._profiler_thread_id:
+            return
+        if threading.get_ident() == self._profiler_thread_id or sys.version_info >= (3, 12):
+            self._profiler.disable()
+            self._profiler_thread_id = 0
+
+    def _write_outputs(self, duration_seconds: float) -> ProfileResult:
+        output_dir = self.output_dir or resolve_profiles_dir()
+        os.makedirs(output_dir, exist_ok=True)
+        stem = os.path.join(output_dir, f"profile-{datetime.fromtimestamp(self._started_at).strftime('%Y%m%d-%H%M%S')}")
+        pstats_path = ""
+        collapsed_path = ""
+        if self._profiler is not None:
+            pstats_path = f"{stem}.pstats"
+            self._profiler.snapshot_stats()
+            with open(pstats_path, "wb") as file:
+                marshal.dump(self._profiler.stats, file)
+        if self._sampler is not None:
+            collapsed_path = f"{stem}.collapsed"
+            with open(collapsed_path, "w", encoding="utf-8") as file:
+                file.write(format_collapsed_stacks(self._sampler.counts))
+        return ProfileResult(
+            mode=self.mode,
+            started_at=self._started_at,
+            duration_seconds=round(duration_seconds, 3),
+            sample_count=self._sampler.sample_count if self._sampler is not None else 0,
+            pstats_path=pstats_path,
+            collapsed_path=collapsed_path,
+        )
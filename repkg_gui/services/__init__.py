@@ -1,10 +1,22 @@
 from repkg_gui.services.catalog_service import CatalogService
-from repkg_gui.services.extraction_service import ExtractionService, ExtractionValidationError
+from repkg_gui.services.extraction_events import ExtractionEventLog
+from repkg_gui.services.extraction_jobs import ExtractionJobQueue, ExtractionJobStore
+from repkg_gui.services.extraction_scheduler import ExtractionScheduler
+from repkg_gui.services.extraction_service import (
+    ExtractionCancelToken,
+    ExtractionService,
+    ExtractionValidationError,
+)
 from repkg_gui.services.runtime_compat import RuntimeCompatService
 from repkg_gui.services.steam_locator_service import SteamLocatorService
 
 __all__ = [
     "CatalogService",
+    "ExtractionCancelToken",
+    "ExtractionEventLog",
+    "ExtractionJobQueue",
+    "ExtractionJobStore",
+    "ExtractionScheduler",
     "ExtractionService",
     "ExtractionValidationError",
     "RuntimeCompatService",
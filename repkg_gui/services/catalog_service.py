@@ -1,13 +1,23 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Mapping
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Mapping
 
-import pandas as pd
-
-from repkg_gui.domain.entities import CatalogSnapshot, WallpaperRecord
+import app_services
+from repkg_gui import instrumentation
+from repkg_gui.domain.catalog_store import CatalogStore, CatalogVocabulary
+from repkg_gui.domain.entities import CatalogSnapshot, WallpaperRecord, WorkshopChanges
+from repkg_gui.services.catalog_snapshot_store import (
+    CatalogSnapshotError,
+    get_snapshot_path,
+    read_catalog_snapshot,
+    write_catalog_snapshot,
+)
 from repkg_gui.services.runtime_compat import RuntimeCompatService
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 @dataclass(slots=True)
 class CatalogService:
@@ -18,23 +28,96 @@ class CatalogService:
         if not self.runtime.has_valid_steam_path(effective_steam_path):
             raise ValueError("steam_path 未找到或无效")
 
-        csv_path = self.runtime.extract_info_to_csv(steam_path=effective_steam_path)
-        return self.load_snapshot_from_csv(csv_path, steam_path=effective_steam_path)
+        vocabulary = CatalogVocabulary()
+        snapshot = CatalogSnapshot(
+            steam_path=effective_steam_path,
+            csv_path=self.runtime.info_csv_path,
+            records=CatalogStore.from_records(
+                self.runtime.collect_workshop_records(effective_steam_path, vocabulary),
+                vocabulary,
+            ),
+        )
+        self.save_snapshot(snapshot)
+        self.runtime.write_catalog_csv(snapshot.records, snapshot.csv_path)
+        return snapshot
+
+    @instrumentation.timed("catalog.load_cached_snapshot")
+    def load_cached_snapshot(self, csv_path: str, steam_path: str = "") -> CatalogSnapshot:
+        snapshot_path = get_snapshot_path(csv_path)
+        try:
+            snapshot = read_catalog_snapshot(snapshot_path, steam_path)
+        except FileNotFoundError:
+            pass
+        except (CatalogSnapshotError, OSError) as exc:
+            app_services.log_error(f"读取目录快照 {snapshot_path} 失败，改为读取 CSV: {exc}")
+        else:
+            return replace(snapshot, steam_path=steam_path or snapshot.steam_path, csv_path=csv_path)
+
+        snapshot = self.load_snapshot_from_csv(csv_path, steam_path=steam_path)
+        self.save_snapshot(snapshot)
+        return snapshot
+
+    def save_snapshot(self, snapshot: CatalogSnapshot) -> str:
+        if not snapshot.csv_path:
+            return ""
+        try:
+            return write_catalog_snapshot(snapshot)
+        except OSError as exc:
+            app_services.log_error(f"写入目录快照失败: {exc}")
+            return ""
 
     def load_snapshot_from_csv(self, csv_path: str, steam_path: str = "") -> CatalogSnapshot:
-        dataframe = self.runtime.read_info_csv(csv_path)
+        vocabulary = CatalogVocabulary()
+        dataframe = self.runtime.read_info_csv(csv_path, vocabulary)
         if dataframe is None:
             raise FileNotFoundError(f"无法读取 CSV 文件: {csv_path}")
 
         return CatalogSnapshot(
             steam_path=steam_path,
             csv_path=csv_path,
-            records=self.records_from_dataframe(dataframe),
+            records=self.records_from_dataframe(dataframe, vocabulary),
         )
 
+    def apply_workshop_changes(
+        self,
+        snapshot: CatalogSnapshot,
+        changes: WorkshopChanges,
+        steam_path: str | None = None,
+        csv_path: str | None = None,
+    ) -> CatalogSnapshot:
+        effective_steam_path = steam_path or snapshot.steam_path
+        if not self.runtime.has_valid_steam_path(effective_steam_path):
+            raise ValueError("steam_path 未找到或无效")
+
+        vocabulary = CatalogVocabulary()
+        refreshed = {
+            record.id: record
+            for record in self.runtime.collect_workshop_items(effective_steam_path, changes.refreshed_ids, vocabulary)
+        }
+        dropped_ids = set(changes.removed) | (set(changes.refreshed_ids) - refreshed.keys())
+        records = [
+            refreshed.pop(record.id, record)
+            for record in snapshot.records
+            if record.id not in dropped_ids
+        ]
+        records.extend(refreshed[item_id] for item_id in changes.refreshed_ids if item_id in refreshed)
+
+        target_csv_path = self.runtime.write_catalog_csv(records, csv_path or snapshot.csv_path or None)
+        updated = CatalogSnapshot(
+            steam_path=effective_steam_path,
+            csv_path=target_csv_path,
+            records=CatalogStore.from_records(records, vocabulary),
+        )
+        self.save_snapshot(updated)
+        return updated
+
     @staticmethod
-    def records_from_dataframe(dataframe: pd.DataFrame) -> tuple[WallpaperRecord, ...]:
-        return tuple(WallpaperRecord.from_mapping(row) for row in dataframe.to_dict(orient="records"))
+    def records_from_dataframe(dataframe: pd.DataFrame, vocabulary: CatalogVocabulary | None = None) -> CatalogStore:
+        vocabulary = vocabulary if vocabulary is not None else CatalogVocabulary()
+        return CatalogStore.from_records(
+            (WallpaperRecord.from_mapping(row, vocabulary) for row in dataframe.to_dict(orient="records")),
+            vocabulary,
+        )
 
     @staticmethod
     def record_from_mapping(data: Mapping[str, object]) -> WallpaperRecord:
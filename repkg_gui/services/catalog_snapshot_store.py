@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import marshal
+import os
+import struct
+import zlib
+from datetime import UTC, datetime
+
+import app_services
+from repkg_gui.domain.catalog_store import CatalogStore, as_catalog_store
+from repkg_gui.domain.entities import CatalogSnapshot
+
+CATALOG_SNAPSHOT_FILENAME = "catalog.bin"
+SNAPSHOT_MAGIC = b"RPKGCAT\x00"
+SNAPSHOT_FORMAT_VERSION = 4
+_HEADER = struct.Struct("<8sHHIQ")
+
+
+class CatalogSnapshotError(ValueError):
+    pass
+
+
+def get_snapshot_path(csv_path: str) -> str:
+    return os.path.join(os.path.dirname(csv_path), CATALOG_SNAPSHOT_FILENAME)
+
+
+def _path_key(path: str) -> str:
+    return os.path.normcase(os.path.normpath(path))
+
+
+def encode_catalog_snapshot(snapshot: CatalogSnapshot) -> bytes:
+    payload = marshal.dumps(
+        (
+            snapshot.steam_path,
+            snapshot.csv_path,
+            snapshot.scanned_at.timestamp(),
+            as_catalog_store(snapshot.records).to_state(),
+        )
+    )
+    header = _HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_FORMAT_VERSION, marshal.version, zlib.crc32(payload), len(payload))
+    return header + payload
+
+
+def decode_catalog_snapshot(data: bytes) -> CatalogSnapshot:
+    if len(data) < _HEADER.size:
+        raise CatalogSnapshotError("目录快照文件不完整")
+    magic, format_version, marshal_version, checksum, payload_length = _HEADER.unpack_from(data)
+    if magic != SNAPSHOT_MAGIC:
+        raise CatalogSnapshotError("不是有效的目录快照文件")
+    if format_version != SNAPSHOT_FORMAT_VERSION or marshal_version != marshal.version:
+        raise CatalogSnapshotError(f"目录快照版本不兼容: {format_version}/{marshal_version}")
+    payload = memoryview(data)[_HEADER.size :]
+    if len(payload) != payload_length or zlib.crc32(payload) != checksum:
+        raise CatalogSnapshotError("目录快照校验失败")
+
+    try:
+        steam_path, csv_path, scanned_at, store_state = marshal.loads(payload)
+        records = CatalogStore.from_state(store_state)
+    except (EOFError, TypeError, ValueError) as exc:
+        raise CatalogSnapshotError(f"目录快照内容无效: {exc}") from exc
+    return CatalogSnapshot(
+        steam_path=steam_path,
+        csv_path=csv_path,
+        records=records,
+        scanned_at=datetime.fromtimestamp(scanned_at, UTC),
+    )
+
+
+def write_catalog_snapshot(snapshot: CatalogSnapshot, path: str | None = None) -> str:
+    target_path = path or get_snapshot_path(snapshot.csv_path)
+    data = encode_catalog_snapshot(snapshot)
+    app_services._write_bytes_file(target_path, data)
+    return target_path
+
+
+def read_catalog_snapshot(path: str, steam_path: str | None = None) -> CatalogSnapshot:
+    with open(path, "rb") as file:
+        data = file.read()
+    snapshot = decode_catalog_snapshot(data)
+    if steam_path and snapshot.steam_path and _path_key(steam_path) != _path_key(snapshot.steam_path):
+        raise CatalogSnapshotError("目录快照属于其他 Steam 路径")
+    return snapshot
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import threading
+import time
+
+ADAPTIVE_INITIAL_WORKERS = 2
+ADAPTIVE_MIN_WINDOW_SECONDS = 1.0
+ADAPTIVE_THROUGHPUT_TOLERANCE = 0.05
+ADAPTIVE_WAIT_INTERVAL_SECONDS = 0.2
+
+
+class AdaptiveConcurrencyLimiter:
+    def __init__(
+        self,
+        max_workers: int,
+        initial_workers: int = ADAPTIVE_INITIAL_WORKERS,
+        min_workers: int = 1,
+        min_window_seconds: float = ADAPTIVE_MIN_WINDOW_SECONDS,
+    ) -> None:
+        self._condition = threading.Condition()
+        self._max_workers = max(max_workers, 1)
+        self._min_workers = min(max(min_workers, 1), self._max_workers)
+        self._limit = min(max(initial_workers, self._min_workers), self._max_workers)
+        self._peak = self._limit
+        self._min_window_seconds = max(min_window_seconds, 0.0)
+        self._active = 0
+        self._direction = 1
+        self._previous_rate: float | None = None
+        self._window_started_at = time.monotonic()
+        self._window_bytes = 0
+        self._window_items = 0
+        self._history: list[tuple[int, float]] = []
+
+    @property
+    def limit(self) -> int:
+        with self._condition:
+            return self._limit
+
+    @property
+    def peak(self) -> int:
+        with self._condition:
+            return self._peak
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    @property
+    def history(self) -> tuple[tuple[int, float], ...]:
+        with self._condition:
+            return tuple(self._history)
+
+    def acquire(self, cancel_event: threading.Event | None = None, blocking: bool = True) -> bool:
+        with self._condition:
+            while self._active >= self._limit:
+                if not blocking or (cancel_event is not None and cancel_event.is_set()):
+                    return False
+                self._condition.wait(ADAPTIVE_WAIT_INTERVAL_SECONDS)
+            if cancel_event is not None and cancel_event.is_set():
+                return False
+            self._active += 1
+            return True
+
+    def release(self, pkg_bytes: int = 0, measured: bool = True) -> int:
+        with self._condition:
+            self._active = max(self._active - 1, 0)
+            if measured:
+                self._window_bytes += max(pkg_bytes, 0)
+                self._window_items += 1
+                self._maybe_adjust_locked()
+            self._condition.notify_all()
+            return self._limit
+
+    def _maybe_adjust_locked(self) -> None:
+        elapsed = time.monotonic() - self._window_started_at
+        if self._window_items < self._limit or elapsed < self._min_window_seconds:
+            return
+
+        rate = self._window_bytes / max(elapsed, 1e-6)
+        self._history.append((self._limit, rate))
+        previous_rate = self._previous_rate
+        self._previous_rate = rate
+        step = self._direction
+        if previous_rate is not None:
+            improved = rate > previous_rate * (1 + ADAPTIVE_THROUGHPUT_TOLERANCE)
+            degraded = rate < previous_rate * (1 - ADAPTIVE_THROUGHPUT_TOLERANCE)
+            if self._direction and not improved:
+                self._limit -= self._direction
+                self._direction = 0
+                self._previous_rate = None
+                step = 0
+            elif not self._direction and (improved or degraded):
+                self._direction = 1 if improved else -1
+                step = self._direction
+
+        next_limit = self._limit + step
+        if next_limit > self._max_workers or next_limit < self._min_workers:
+            self._direction = 0
+            next_limit = self._limit
+        self._limit = next_limit
+        self._peak = max(self._peak, self._limit)
+        self._window_started_at = time.monotonic()
+        self._window_bytes = 0
+        self._window_items = 0
+
+
+class SharedWorkerBudget:
+    def __init__(self, max_workers: int) -> None:
+        self._condition = threading.Condition()
+        self._max_workers = max(max_workers, 1)
+        self._active = 0
+        self._peak = 0
+
+    @property
+    def limit(self) -> int:
+        return self._max_workers
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    @property
+    def active(self) -> int:
+        with self._condition:
+            return self._active
+
+    @property
+    def peak(self) -> int:
+        with self._condition:
+            return self._peak
+
+    def acquire(self, cancel_event: threading.Event | None = None, blocking: bool = True) -> bool:
+        with self._condition:
+            while self._active >= self._max_workers:
+                if not blocking or (cancel_event is not None and cancel_event.is_set()):
+                    return False
+                self._condition.wait(ADAPTIVE_WAIT_INTERVAL_SECONDS)
+            if cancel_event is not None and cancel_event.is_set():
+                return False
+            self._active += 1
+            self._peak = max(self._peak, self._active)
+            return True
+
+    def release(self, pkg_bytes: int = 0, measured: bool = True) -> int:
+        with self._condition:
+            self._active = max(self._active - 1, 0)
+            self._condition.notify_all()
+            return self._max_workers
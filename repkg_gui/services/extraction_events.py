@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import json
+import math
+import os
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+import app_services
+from repkg_gui.domain.entities import (
+    ExtractionItemResult,
+    ExtractionRequest,
+    ExtractionRunStats,
+    ExtractionSummary,
+)
+
+EXTRACTION_EVENTS_FILENAME = "extraction_events.jsonl"
+ITEM_EVENT = "item"
+RUN_EVENT = "run"
+
+
+def get_extraction_events_path() -> str:
+    return os.path.join(app_services.RUNTIME_DIR, EXTRACTION_EVENTS_FILENAME)
+
+
+@dataclass(slots=True)
+class ExtractionEventLog:
+    path: str | None = None
+    enabled: bool = True
+
+    def resolve_path(self) -> str:
+        return self.path or get_extraction_events_path()
+
+    def record_item(
+        self,
+        run_id: str,
+        request: ExtractionRequest,
+        result: ExtractionItemResult,
+        queue_wait_seconds: float,
+    ) -> None:
+        self._emit(
+            {
+                "event": ITEM_EVENT,
+                "run_id": run_id,
+                "ts": round(time.time(), 3),
+                "item_id": request.item_id,
+                "pkg_bytes": request.pkg_bytes,
+                "duration_seconds": round(result.duration_seconds, 4),
+                "queue_wait_seconds": round(max(queue_wait_seconds, 0.0), 4),
+                "returncode": result.returncode,
+                "success": result.success,
+                "cancelled": result.cancelled,
+                "timed_out": result.timed_out,
+                "worker": threading.current_thread().name,
+            }
+        )
+
+    def record_run(self, run_id: str, summary: ExtractionSummary, wall_seconds: float) -> None:
+        self._emit(
+            {
+                "event": RUN_EVENT,
+                "run_id": run_id,
+                "ts": round(time.time(), 3),
+                "requested_count": summary.requested_count,
+                "succeeded_count": len(summary.succeeded),
+                "failed_count": len(summary.failed),
+                "cancelled_count": len(summary.cancelled),
+                "skipped_count": len(summary.skipped),
+                "effective_workers": summary.effective_workers,
+                "wall_seconds": round(max(wall_seconds, 0.0), 4),
+            }
+        )
+
+    def read_events(self) -> Iterator[dict[str, Any]]:
+        return read_extraction_events(self.resolve_path())
+
+    def summarize(self) -> tuple[ExtractionRunStats, ...]:
+        return summarize_extraction_runs(self.read_events())
+
+    def _emit(self, event: dict[str, Any]) -> None:
+        if not self.enabled:
+            return
+        app_services.append_jsonl_record(self.resolve_path(), event)
+
+
+def _iter_event_files(path: str) -> list[str]:
+    backups = []
+    index = 1
+    while os.path.exists(f"{path}.{index}"):
+        backups.append(f"{path}.{index}")
+        index += 1
+    return [*reversed(backups), path]
+
+
+def read_extraction_events(path: str | None = None) -> Iterator[dict[str, Any]]:
+    events_path = path or get_extraction_events_path()
+    for file_path in _iter_event_files(events_path):
+        try:
+            with open(file_path, "r", encoding="utf-8") as file:
+                for line in file:
+                    stripped = line.strip()
+                    if not stripped:
+                        continue
+                    try:
+                        event = json.loads(stripped)
+                    except ValueError:
+                        continue
+                    if isinstance(event, dict) and event.get("run_id"):
+                        yield event
+        except FileNotFoundError:
+            continue
+        except OSError as exc:
+            app_services.log_error(f"读取提取事件日志 {file_path} 失败: {exc}")
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(max(math.ceil(fraction * len(ordered)) - 1, 0), len(ordered) - 1)
+    return ordered[index]
+
+
+def summarize_extraction_runs(events: Iterable[dict[str, Any]]) -> tuple[ExtractionRunStats, ...]:
+    items_by_run: dict[str, list[dict[str, Any]]] = {}
+    runs: dict[str, dict[str, Any]] = {}
+    order: list[str] = []
+    for event in events:
+        run_id = str(event["run_id"])
+        if run_id not in items_by_run:
+            items_by_run[run_id] = []
+            order.append(run_id)
+        if event.get("event") == RUN_EVENT:
+            runs[run_id] = event
+        elif event.get("event") == ITEM_EVENT:
+            items_by_run[run_id].append(event)
+
+    stats = []
+    for run_id in order:
+        items = items_by_run[run_id]
+        run_event = runs.get(run_id, {})
+        durations = [float(item.get("duration_seconds", 0.0)) for item in items]
+        queue_waits = [float(item.get("queue_wait_seconds", 0.0)) for item in items]
+        succeeded = [item for item in items if item.get("success")]
+        cancelled_count = sum(1 for item in items if item.get("cancelled"))
+        attempted_count = len(items) - cancelled_count
+        failed_count = attempted_count - len(succeeded)
+        succeeded_bytes = sum(int(item.get("pkg_bytes", 0)) for item in succeeded)
+        timestamps = [float(item.get("ts", 0.0)) for item in items]
+        wall_seconds = float(run_event.get("wall_seconds", 0.0))
+        if not wall_seconds and timestamps:
+            wall_seconds = max(timestamps) - min(
+                timestamp - duration for timestamp, duration in zip(timestamps, durations)
+            )
+        stats.append(
+            ExtractionRunStats(
+                run_id=run_id,
+                started_at=min(
+                    (timestamp - duration - wait for timestamp, duration, wait in zip(timestamps, durations, queue_waits)),
+                    default=float(run_event.get("ts", 0.0)),
+                ),
+                item_count=len(items),
+                succeeded_count=len(succeeded),
+                failed_count=failed_count,
+                cancelled_count=cancelled_count,
+                timed_out_count=sum(1 for item in items if item.get("timed_out")),
+                total_bytes=sum(int(item.get("pkg_bytes", 0)) for item in items),
+                wall_seconds=wall_seconds,
+                bytes_per_second=succeeded_bytes / wall_seconds if wall_seconds > 0 else 0.0,
+                failure_rate=failed_count / attempted_count if attempted_count else 0.0,
+                mean_duration_seconds=sum(durations) / len(durations) if durations else 0.0,
+                p95_duration_seconds=_percentile(durations, 0.95),
+                mean_queue_wait_seconds=sum(queue_waits) / len(queue_waits) if queue_waits else 0.0,
+                worker_count=int(run_event.get("effective_workers", 0))
+                or len({item.get("worker") for item in items if item.get("worker")}),
+            )
+        )
+    return tuple(stats)
@@ -0,0 +1,443 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from typing import Any
+
+import app_services
+from repkg_gui.domain.entities import (
+    ExtractionItemProgress,
+    ExtractionItemResult,
+    ExtractionJob,
+    ExtractionSummary,
+    SessionSettings,
+    WallpaperRecord,
+)
+from repkg_gui.domain.enums import JobState, OutputMode
+from repkg_gui.services.extraction_concurrency import SharedWorkerBudget
+from repkg_gui.services.extraction_service import (
+    ExtractionCancelToken,
+    ExtractionService,
+    ExtractionValidationError,
+)
+
+EXTRACTION_JOBS_FILENAME = "extraction_jobs.sqlite3"
+DEFAULT_MAX_CONCURRENT_JOBS = 4
+JOB_LIST_LIMIT = 100
+JOB_INTERRUPTED_MESSAGE = "服务在任务运行时退出"
+JOB_OPTION_KEYS = (
+    "output",
+    "output_mode",
+    "workers",
+    "timeout",
+    "no_tex_convert",
+    "id_subdir",
+    "copy_extras",
+    "overwrite",
+)
+_JOB_COLUMNS = (
+    "job_id",
+    "state",
+    "item_ids",
+    "options",
+    "created_at",
+    "started_at",
+    "finished_at",
+    "completed",
+    "total",
+    "error",
+    "summary",
+)
+
+
+def get_extraction_jobs_path() -> str:
+    return os.path.join(app_services.RUNTIME_DIR, EXTRACTION_JOBS_FILENAME)
+
+
+def normalize_job_options(options: Mapping[str, Any] | None) -> dict[str, Any]:
+    if not options:
+        return {}
+
+    normalized: dict[str, Any] = {}
+    for key in JOB_OPTION_KEYS:
+        value = options.get(key)
+        if value is None:
+            continue
+        if key == "output":
+            if not isinstance(value, str):
+                raise ValueError("output 必须是字符串")
+            normalized[key] = value
+        elif key == "output_mode":
+            normalized[key] = OutputMode(str(value)).value
+        elif key in ("workers", "timeout"):
+            if isinstance(value, bool) or not isinstance(value, int):
+                raise ValueError(f"{key} 必须是整数")
+            normalized[key] = max(value, 0)
+        else:
+            if not isinstance(value, bool):
+                raise ValueError(f"{key} 必须是布尔值")
+            normalized[key] = value
+    return normalized
+
+
+def build_job_settings(base: SessionSettings, options: Mapping[str, Any]) -> SessionSettings:
+    settings = replace(base)
+    if "output" in options:
+        settings = replace(settings, output_path=str(options["output"]))
+    if "output_mode" in options:
+        settings = replace(settings, output_mode=OutputMode(str(options["output_mode"])))
+    if "workers" in options:
+        settings = replace(settings, batch_extract_workers=int(options["workers"]))
+    if "timeout" in options:
+        settings = replace(settings, extract_timeout_seconds=int(options["timeout"]))
+    if "no_tex_convert" in options:
+        settings = replace(settings, not_convert_tex_to_image=bool(options["no_tex_convert"]))
+    if "id_subdir" in options:
+        settings = replace(settings, use_wallpaper_name_as_subdir=not options["id_subdir"])
+    if "copy_extras" in options:
+        settings = replace(settings, copy_project_json_and_preview=bool(options["copy_extras"]))
+    if "overwrite" in options:
+        settings = replace(settings, overwrite_files=bool(options["overwrite"]))
+    return replace(settings, adaptive_batch_extract_workers=False)
+
+
+def summarize_job_result(summary: ExtractionSummary) -> dict[str, Any]:
+    return {
+        "requested": summary.requested_count,
+        "succeeded": list(summary.success_ids),
+        "failed": [{"item_id": item_id, "error": error} for item_id, error in summary.failure_details],
+        "timed_out": list(summary.timed_out_ids),
+        "cancelled": list(summary.cancelled_ids),
+        "missing_scene_pkg": list(summary.missing_scene_pkg_ids),
+        "effective_workers": summary.effective_workers,
+    }
+
+
+def resolve_job_state(summary: ExtractionSummary) -> JobState:
+    if summary.was_cancelled:
+        return JobState.CANCELLED
+    if summary.failed or summary.skipped:
+        return JobState.FAILED
+    return JobState.SUCCEEDED
+
+
+class ExtractionJobStore:
+    def __init__(self, path: str | None = None) -> None:
+        self._path = path or get_extraction_jobs_path()
+        self._lock = threading.Lock()
+        directory = os.path.dirname(self._path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connection = sqlite3.connect(self._path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS extraction_jobs ("
+            "job_id TEXT PRIMARY KEY, state TEXT NOT NULL, item_ids TEXT NOT NULL, options TEXT NOT NULL, "
+            "created_at REAL NOT NULL, started_at REAL, finished_at REAL, completed INTEGER NOT NULL DEFAULT 0, "
+            "total INTEGER NOT NULL DEFAULT 0, error TEXT NOT NULL DEFAULT '', summary TEXT)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS extraction_jobs_state ON extraction_jobs (state, created_at)"
+        )
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def insert(self, job: ExtractionJob) -> None:
+        with self._lock:
+            self._connection.execute(
+                f"INSERT INTO extraction_jobs ({', '.join(_JOB_COLUMNS)}) VALUES ({', '.join('?' * len(_JOB_COLUMNS))})",
+                self._to_row(job),
+            )
+
+    def update(self, job_id: str, **values: Any) -> None:
+        if not values:
+            return
+        columns = [column for column in values if column in _JOB_COLUMNS and column != "job_id"]
+        parameters = [self._encode_value(column, values[column]) for column in columns]
+        with self._lock:
+            self._connection.execute(
+                f"UPDATE extraction_jobs SET {', '.join(f'{column} = ?' for column in columns)} WHERE job_id = ?",
+                (*parameters, job_id),
+            )
+
+    def get(self, job_id: str) -> ExtractionJob | None:
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT {', '.join(_JOB_COLUMNS)} FROM extraction_jobs WHERE job_id = ?",
+                (job_id,),
+            ).fetchone()
+        return self._from_row(row) if row is not None else None
+
+    def list(self, limit: int = JOB_LIST_LIMIT, states: Iterable[JobState] = ()) -> tuple[ExtractionJob, ...]:
+        state_values = [state.value for state in states]
+        query = f"SELECT {', '.join(_JOB_COLUMNS)} FROM extraction_jobs"
+        if state_values:
+            query += f" WHERE state IN ({', '.join('?' * len(state_values))})"
+        query += " ORDER BY created_at DESC LIMIT ?"
+        with self._lock:
+            rows = self._connection.execute(query, (*state_values, max(limit, 1))).fetchall()
+        return tuple(self._from_row(row) for row in rows)
+
+    def recover(self) -> tuple[ExtractionJob, ...]:
+        with self._lock:
+            self._connection.execute(
+                "UPDATE extraction_jobs SET state = ?, finished_at = ?, error = ? WHERE state = ?",
+                (JobState.INTERRUPTED.value, time.time(), JOB_INTERRUPTED_MESSAGE, JobState.RUNNING.value),
+            )
+            rows = self._connection.execute(
+                f"SELECT {', '.join(_JOB_COLUMNS)} FROM extraction_jobs WHERE state = ? ORDER BY created_at",
+                (JobState.QUEUED.value,),
+            ).fetchall()
+        return tuple(self._from_row(row) for row in rows)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    @classmethod
+    def _to_row(cls, job: ExtractionJob) -> tuple[Any, ...]:
+        return tuple(cls._encode_value(column, getattr(job, column)) for column in _JOB_COLUMNS)
+
+    @staticmethod
+    def _encode_value(column: str, value: Any) -> Any:
+        if column == "state":
+            return JobState(value).value
+        if column == "item_ids":
+            return json.dumps(list(value), ensure_ascii=False)
+        if column in ("options", "summary"):
+            return json.dumps(dict(value), ensure_ascii=False) if value is not None else None
+        return value
+
+    @staticmethod
+    def _from_row(row: Sequence[Any]) -> ExtractionJob:
+        values = dict(zip(_JOB_COLUMNS, row))
+        return ExtractionJob(
+            job_id=values["job_id"],
+            state=JobState(values["state"]),
+            item_ids=tuple(json.loads(values["item_ids"])),
+            options=json.loads(values["options"]),
+            created_at=float(values["created_at"]),
+            started_at=values["started_at"],
+            finished_at=values["finished_at"],
+            completed=int(values["completed"]),
+            total=int(values["total"]),
+            error=values["error"] or "",
+            summary=json.loads(values["summary"]) if values["summary"] else None,
+        )
+
+
+class _ActiveJob:
+    __slots__ = ("cancel_token", "interrupted", "completed", "total", "current_item_id", "item_progress")
+
+    def __init__(self) -> None:
+        self.cancel_token = ExtractionCancelToken()
+        self.interrupted = False
+        self.completed = 0
+        self.total = 0
+        self.current_item_id = ""
+        self.item_progress: ExtractionItemProgress | None = None
+
+
+class ExtractionJobQueue:
+    def __init__(
+        self,
+        extraction_service: ExtractionService,
+        records_provider: Callable[[], Sequence[WallpaperRecord]],
+        settings_provider: Callable[[], SessionSettings],
+        store: ExtractionJobStore,
+        worker_budget: SharedWorkerBudget,
+        max_concurrent_jobs: int = DEFAULT_MAX_CONCURRENT_JOBS,
+    ) -> None:
+        self._service = extraction_service
+        self._records_provider = records_provider
+        self._settings_provider = settings_provider
+        self._store = store
+        self._budget = worker_budget
+        self._lock = threading.Lock()
+        self._active: dict[str, _ActiveJob] = {}
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(max_concurrent_jobs, 1),
+            thread_name_prefix="repkg-job",
+        )
+        self._closed = False
+        self._cancelling = False
+
+    @property
+    def worker_budget(self) -> SharedWorkerBudget:
+        return self._budget
+
+    @property
+    def store(self) -> ExtractionJobStore:
+        return self._store
+
+    def resume_pending(self) -> tuple[ExtractionJob, ...]:
+        jobs = self._store.recover()
+        for job in jobs:
+            self._schedule(job.job_id)
+        if jobs:
+            app_services.log_success(f"已恢复 {len(jobs)} 个排队中的提取任务")
+        return jobs
+
+    def submit(self, item_ids: Iterable[str], options: Mapping[str, Any] | None = None) -> ExtractionJob:
+        normalized_ids = tuple(
+            dict.fromkeys(
+                app_services.normalize_wallpaper_id(item_id)
+                for item_id in item_ids
+                if app_services.normalize_wallpaper_id(item_id)
+            )
+        )
+        if not normalized_ids:
+            raise ValueError("没有要提取的壁纸 ID")
+
+        job = ExtractionJob(
+            job_id=uuid.uuid4().hex,
+            item_ids=normalized_ids,
+            options=normalize_job_options(options),
+            created_at=time.time(),
+            total=len(normalized_ids),
+        )
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("任务队列已关闭")
+            self._store.insert(job)
+            self._schedule(job.job_id)
+        app_services.log_success(f"已排队提取任务 {job.job_id}，共 {job.total} 项")
+        return job
+
+    def get(self, job_id: str) -> ExtractionJob | None:
+        job = self._store.get(job_id)
+        if job is None:
+            return None
+        return self._merge_live_state(job)
+
+    def list(self, limit: int = JOB_LIST_LIMIT) -> tuple[ExtractionJob, ...]:
+        return tuple(self._merge_live_state(job) for job in self._store.list(limit))
+
+    def cancel(self, job_id: str) -> ExtractionJob | None:
+        with self._lock:
+            job = self._store.get(job_id)
+            if job is None:
+                return None
+            active = self._active.get(job_id)
+            if active is not None:
+                active.cancel_token.cancel()
+            elif job.state == JobState.QUEUED:
+                self._store.update(job_id, state=JobState.CANCELLED, finished_at=time.time(), error="已取消")
+        return self.get(job_id)
+
+    def shutdown(self, cancel_running: bool = True) -> None:
+        with self._lock:
+            self._closed = True
+            self._cancelling = cancel_running
+            active_jobs = list(self._active.values())
+            if cancel_running:
+                for active in active_jobs:
+                    active.interrupted = active.interrupted or not active.cancel_token.is_cancelled
+        if cancel_running:
+            for active in active_jobs:
+                active.cancel_token.cancel()
+        self._executor.shutdown(wait=True, cancel_futures=cancel_running)
+
+    def _schedule(self, job_id: str) -> None:
+        self._executor.submit(self._run_job, job_id)
+
+    def _merge_live_state(self, job: ExtractionJob) -> ExtractionJob:
+        with self._lock:
+            active = self._active.get(job.job_id)
+            if active is None or job.state != JobState.RUNNING:
+                return job
+            return replace(
+                job,
+                completed=active.completed,
+                total=active.total or job.total,
+                current_item_id=active.current_item_id,
+                item_progress=active.item_progress,
+            )
+
+    def _run_job(self, job_id: str) -> None:
+        with self._lock:
+            job = self._store.get(job_id)
+            if job is None or job.state != JobState.QUEUED or self._cancelling:
+                return
+            active = _ActiveJob()
+            self._active[job_id] = active
+            self._store.update(job_id, state=JobState.RUNNING, started_at=time.time())
+
+        try:
+            summary = self._execute_job(job, active)
+        except (ExtractionValidationError, OSError, ValueError) as exc:
+            app_services.log_error(f"提取任务 {job_id} 失败: {exc}")
+            self._finish_job(job_id, JobState.FAILED, active.completed, str(exc), None)
+        except Exception as exc:
+            app_services.log_error(f"提取任务 {job_id} 发生未处理错误: {exc}")
+            self._finish_job(job_id, JobState.FAILED, active.completed, str(exc), None)
+        else:
+            interrupted = active.interrupted and summary.was_cancelled
+            self._finish_job(
+                job_id,
+                JobState.INTERRUPTED if interrupted else resolve_job_state(summary),
+                active.completed,
+                JOB_INTERRUPTED_MESSAGE if interrupted else "",
+                summarize_job_result(summary),
+            )
+
+    def _execute_job(self, job: ExtractionJob, active: _ActiveJob) -> ExtractionSummary:
+        settings = build_job_settings(self._settings_provider(), job.options)
+        self._service.validate_environment(settings)
+        plan = self._service.prepare_requests(self._records_provider(), job.item_ids, settings.steam_path)
+        with self._lock:
+            active.total = plan.total_count
+            active.completed = len(plan.skipped)
+        self._store.update(job.job_id, total=plan.total_count, completed=len(plan.skipped))
+
+        def on_result(result: ExtractionItemResult) -> None:
+            with self._lock:
+                active.completed += 1
+                active.current_item_id = result.item_id
+                if active.item_progress is not None and active.item_progress.item_id == result.item_id:
+                    active.item_progress = None
+                completed = active.completed
+            self._store.update(job.job_id, completed=completed)
+
+        def on_item_progress(progress: ExtractionItemProgress) -> None:
+            with self._lock:
+                active.current_item_id = progress.item_id
+                active.item_progress = progress
+
+        return self._service.execute_requests(
+            plan,
+            settings,
+            on_result=on_result,
+            cancel_token=active.cancel_token,
+            concurrency_limiter=self._budget,
+            on_item_progress=on_item_progress,
+        )
+
+    def _finish_job(
+        self,
+        job_id: str,
+        state: JobState,
+        completed: int,
+        error: str,
+        summary: Mapping[str, Any] | None,
+    ) -> None:
+        with self._lock:
+            self._active.pop(job_id, None)
+            self._store.update(
+                job_id,
+                state=state,
+                finished_at=time.time(),
+                completed=completed,
+                error=error,
+                summary=summary,
+            )
+        app_services.log_success(f"提取任务 {job_id} 结束，状态: {state.value}")
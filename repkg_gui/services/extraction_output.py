@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import os
+import re
+import threading
+import time
+from typing import Callable, Sequence
+
+from repkg_gui.domain.entities import ExtractionItemProgress, ExtractionRequest
+
+ITEM_PROGRESS_MIN_INTERVAL_SECONDS = 0.25
+CONVERTED_OUTPUT_EXTENSIONS = (".png", ".jpg", ".gif", ".mp4", ".webm")
+_ENTRY_LINE_PATTERN = re.compile(r"^\s*\*?\s*(?:extracting|writing)\s*:?\s+(?P<entry>.+?)\s*$", re.IGNORECASE)
+_PACKAGE_LINE_PATTERN = re.compile(r"^\s*\*?\s*extracting\s+package\b", re.IGNORECASE)
+
+
+def parse_repkg_entry_line(line: str) -> str | None:
+    if not line or _PACKAGE_LINE_PATTERN.match(line):
+        return None
+    match = _ENTRY_LINE_PATTERN.match(line)
+    if match is None:
+        return None
+    entry = match.group("entry").strip().strip('"')
+    return entry or None
+
+
+def resolve_command_output_directory(command: Sequence[str]) -> str:
+    try:
+        return str(command[list(command).index("-o") + 1])
+    except (ValueError, IndexError):
+        return ""
+
+
+class ExtractionOutputMonitor:
+    def __init__(
+        self,
+        request: ExtractionRequest,
+        output_directory: str,
+        on_progress: Callable[[ExtractionItemProgress], None],
+        min_interval: float = ITEM_PROGRESS_MIN_INTERVAL_SECONDS,
+    ) -> None:
+        self._lock = threading.Lock()
+        self._request = request
+        self._output_directory = output_directory
+        self._on_progress = on_progress
+        self._min_interval = max(min_interval, 0.0)
+        self._files_extracted = 0
+        self._bytes_extracted = 0
+        self._current_entry = ""
+        self._last_emitted_at: float | None = None
+        self._worker = threading.current_thread().name
+
+    @property
+    def files_extracted(self) -> int:
+        with self._lock:
+            return self._files_extracted
+
+    @property
+    def bytes_extracted(self) -> int:
+        with self._lock:
+            return self._bytes_extracted
+
+    def feed(self, stream_name: str, line: str) -> None:
+        if stream_name != "stdout":
+            return
+        entry = parse_repkg_entry_line(line)
+        if entry is None:
+            return
+
+        with self._lock:
+            self._account_current_entry_locked()
+            self._current_entry = entry
+            self._files_extracted += 1
+            now = time.monotonic()
+            if self._last_emitted_at is not None and now - self._last_emitted_at < self._min_interval:
+                return
+            self._last_emitted_at = now
+            progress = self._snapshot_locked()
+        self._on_progress(progress)
+
+    def finish(self) -> ExtractionItemProgress:
+        with self._lock:
+            self._account_current_entry_locked()
+            self._current_entry = ""
+            progress = self._snapshot_locked()
+        if progress.files_extracted:
+            self._on_progress(progress)
+        return progress
+
+    def _account_current_entry_locked(self) -> None:
+        if not self._current_entry or not self._output_directory:
+            return
+        self._bytes_extracted += self._measure_entry_bytes(self._current_entry)
+        self._current_entry = ""
+
+    def _measure_entry_bytes(self, entry: str) -> int:
+        entry_path = os.path.normpath(os.path.join(self._output_directory, entry.replace("/", os.sep)))
+        stem, _extension = os.path.splitext(entry_path)
+        for candidate in (entry_path, *(stem + extension for extension in CONVERTED_OUTPUT_EXTENSIONS)):
+            try:
+                return os.path.getsize(candidate)
+            except OSError:
+                continue
+        return 0
+
+    def _snapshot_locked(self) -> ExtractionItemProgress:
+        return ExtractionItemProgress(
+            item_id=self._request.item_id,
+            files_extracted=self._files_extracted,
+            bytes_extracted=self._bytes_extracted,
+            current_entry=self._current_entry,
+            pkg_bytes=self._request.pkg_bytes,
+            worker=self._worker,
+        )
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import heapq
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Iterable
+
+import app_services
+from repkg_gui.domain.entities import ExtractionPlan, ExtractionRequest
+
+THROUGHPUT_HISTORY_FILENAME = "extract_throughput.json"
+DEFAULT_BYTES_PER_SECOND = 32 * 1024 * 1024
+DEFAULT_ITEM_OVERHEAD_SECONDS = 0.5
+HISTORY_SMOOTHING = 0.3
+HISTORY_WEIGHT_IN_ITEMS = 3
+MIN_MEASURED_SECONDS = 0.05
+_HISTORY_LOCK = threading.Lock()
+
+
+def get_throughput_history_path() -> str:
+    return os.path.join(app_services.RUNTIME_DIR, THROUGHPUT_HISTORY_FILENAME)
+
+
+def estimate_makespan(item_seconds: Iterable[float], workers: int, busy_until: Iterable[float] = ()) -> float:
+    worker_count = max(workers, 1)
+    finish_times = sorted(max(value, 0.0) for value in busy_until)[:worker_count]
+    finish_times.extend([0.0] * (worker_count - len(finish_times)))
+    heapq.heapify(finish_times)
+    for seconds in sorted(item_seconds, reverse=True):
+        heapq.heappush(finish_times, heapq.heappop(finish_times) + seconds)
+    return max(finish_times) if finish_times else 0.0
+
+
+@dataclass(slots=True)
+class ThroughputHistory:
+    bytes_per_second: float = 0.0
+    sample_count: int = 0
+
+    @property
+    def effective_bytes_per_second(self) -> float:
+        return self.bytes_per_second if self.bytes_per_second > 0 else DEFAULT_BYTES_PER_SECOND
+
+    def blend(self, measured_bytes_per_second: float) -> None:
+        if measured_bytes_per_second <= 0:
+            return
+        if self.bytes_per_second <= 0:
+            self.bytes_per_second = measured_bytes_per_second
+        else:
+            self.bytes_per_second += HISTORY_SMOOTHING * (measured_bytes_per_second - self.bytes_per_second)
+        self.sample_count += 1
+
+    @classmethod
+    def load(cls, path: str | None = None) -> "ThroughputHistory":
+        history_path = path or get_throughput_history_path()
+        try:
+            with open(history_path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except FileNotFoundError:
+            return cls()
+        except (OSError, ValueError) as exc:
+            app_services.log_error(f"读取提取吞吐历史 {history_path} 失败: {exc}")
+            return cls()
+
+        if not isinstance(data, dict):
+            return cls()
+        try:
+            return cls(
+                bytes_per_second=max(float(data.get("bytes_per_second", 0.0)), 0.0),
+                sample_count=max(int(data.get("sample_count", 0)), 0),
+            )
+        except (TypeError, ValueError):
+            return cls()
+
+    def save(self, path: str | None = None) -> None:
+        history_path = path or get_throughput_history_path()
+        app_services._write_json_file(
+            history_path,
+            {
+                "bytes_per_second": round(self.bytes_per_second, 3),
+                "sample_count": self.sample_count,
+                "updated_at": datetime.now(UTC).isoformat(timespec="seconds"),
+            },
+        )
+
+
+class ExtractionEtaTracker:
+    def __init__(self, requests: Iterable[ExtractionRequest], workers: int, history: ThroughputHistory) -> None:
+        self._lock = threading.Lock()
+        self._workers = max(workers, 1)
+        self._history = history
+        self._pending: dict[str, int] = {request.item_id: request.pkg_bytes for request in requests}
+        self._running: dict[str, tuple[int, float]] = {}
+        self._completed_count = 0
+        self._completed_bytes = 0
+        self._completed_seconds = 0.0
+
+    @property
+    def workers(self) -> int:
+        return self._workers
+
+    def set_workers(self, workers: int) -> None:
+        with self._lock:
+            self._workers = max(workers, 1)
+
+    def mark_started(self, request: ExtractionRequest) -> None:
+        with self._lock:
+            pkg_bytes = self._pending.pop(request.item_id, request.pkg_bytes)
+            self._running[request.item_id] = (pkg_bytes, time.monotonic())
+
+    def mark_finished(self, request: ExtractionRequest, duration_seconds: float, measured: bool = True) -> None:
+        with self._lock:
+            self._pending.pop(request.item_id, None)
+            pkg_bytes, _started_at = self._running.pop(request.item_id, (request.pkg_bytes, 0.0))
+            if measured and duration_seconds > 0:
+                self._completed_count += 1
+                self._completed_bytes += pkg_bytes
+                self._completed_seconds += duration_seconds
+
+    def measured_bytes_per_second(self) -> float:
+        with self._lock:
+            return self._measured_bytes_per_second_locked()
+
+    def bytes_per_second(self) -> float:
+        with self._lock:
+            return self._blended_bytes_per_second_locked()
+
+    def estimate_item_seconds(self, pkg_bytes: int, bytes_per_second: float | None = None) -> float:
+        rate = bytes_per_second if bytes_per_second is not None else self.bytes_per_second()
+        return DEFAULT_ITEM_OVERHEAD_SECONDS + max(pkg_bytes, 0) / max(rate, 1.0)
+
+    def remaining_seconds(self) -> float | None:
+        with self._lock:
+            if not self._pending and not self._running:
+                return 0.0
+            rate = self._blended_bytes_per_second_locked()
+            now = time.monotonic()
+            busy_until = [
+                max(self.estimate_item_seconds(pkg_bytes, rate) - (now - started_at), 0.0)
+                for pkg_bytes, started_at in self._running.values()
+            ]
+            pending_seconds = [self.estimate_item_seconds(pkg_bytes, rate) for pkg_bytes in self._pending.values()]
+            return estimate_makespan(pending_seconds, self._workers, busy_until)
+
+    def _measured_bytes_per_second_locked(self) -> float:
+        if self._completed_seconds < MIN_MEASURED_SECONDS or self._completed_bytes <= 0:
+            return 0.0
+        overhead = DEFAULT_ITEM_OVERHEAD_SECONDS * self._completed_count
+        transfer_seconds = max(self._completed_seconds - overhead, self._completed_seconds * 0.5)
+        return self._completed_bytes / transfer_seconds
+
+    def _blended_bytes_per_second_locked(self) -> float:
+        historical = self._history.effective_bytes_per_second
+        measured = self._measured_bytes_per_second_locked()
+        if measured <= 0:
+            return historical
+        history_weight = HISTORY_WEIGHT_IN_ITEMS if self._history.sample_count else 0
+        return (historical * history_weight + measured * self._completed_count) / (
+            history_weight + self._completed_count
+        )
+
+
+@dataclass(slots=True)
+class ExtractionScheduler:
+    history_path: str | None = None
+
+    @staticmethod
+    def order_requests(requests: Iterable[ExtractionRequest]) -> tuple[ExtractionRequest, ...]:
+        return tuple(sorted(requests, key=lambda request: request.pkg_bytes, reverse=True))
+
+    def order_plan(self, plan: ExtractionPlan) -> ExtractionPlan:
+        return ExtractionPlan(requests=self.order_requests(plan.requests), skipped=plan.skipped)
+
+    def load_history(self) -> ThroughputHistory:
+        return ThroughputHistory.load(self.history_path)
+
+    def create_tracker(self, plan: ExtractionPlan, workers: int) -> ExtractionEtaTracker:
+        return ExtractionEtaTracker(plan.requests, workers, self.load_history())
+
+    def estimate_plan_seconds(self, plan: ExtractionPlan, workers: int) -> float | None:
+        if not plan.requests:
+            return None
+        tracker = self.create_tracker(plan, workers)
+        return tracker.remaining_seconds()
+
+    def record_run(self, tracker: ExtractionEtaTracker) -> None:
+        measured = tracker.measured_bytes_per_second()
+        if measured <= 0:
+            return
+
+        with _HISTORY_LOCK:
+            history = self.load_history()
+            history.blend(measured)
+            try:
+                history.save(self.history_path)
+            except OSError as exc:
+                app_services.log_error(f"保存提取吞吐历史失败: {exc}")
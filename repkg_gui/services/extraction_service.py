@@ -1,12 +1,19 @@
 from __future__ import annotations
 
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass, field
-from typing import Callable, Iterable
+import subprocess
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field, replace
+from typing import Callable, Iterable, Iterator
 
 import app_services
+from repkg_gui import instrumentation
 from repkg_gui.domain.entities import (
+    ExtractionItemProgress,
     ExtractionItemResult,
     ExtractionPlan,
     ExtractionRequest,
@@ -16,6 +23,14 @@ from repkg_gui.domain.entities import (
     WallpaperRecord,
 )
 from repkg_gui.domain.enums import OutputMode
+from repkg_gui.services.extraction_concurrency import (
+    ADAPTIVE_WAIT_INTERVAL_SECONDS,
+    AdaptiveConcurrencyLimiter,
+    SharedWorkerBudget,
+)
+from repkg_gui.services.extraction_events import ExtractionEventLog
+from repkg_gui.services.extraction_output import ExtractionOutputMonitor, resolve_command_output_directory
+from repkg_gui.services.extraction_scheduler import ExtractionEtaTracker, ExtractionScheduler
 from repkg_gui.services.runtime_compat import RuntimeCompatService
 
 
@@ -23,9 +38,48 @@ class ExtractionValidationError(ValueError):
     pass
 
 
+def _coerce_output_text(value: str | bytes | None) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bytes):
+        return value.decode("utf-8", errors="replace")
+    return value
+
+
+class ExtractionCancelToken:
+    __slots__ = ("_event",)
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._event.is_set()
+
+    @property
+    def event(self) -> threading.Event:
+        return self._event
+
+
+@dataclass(slots=True)
+class _ExtractionRun:
+    run_id: str
+    settings: SessionSettings
+    tracker: ExtractionEtaTracker
+    submitted_at: float
+    cancel_token: ExtractionCancelToken | None = None
+    limiter: AdaptiveConcurrencyLimiter | SharedWorkerBudget | None = None
+    on_item_progress: Callable[[ExtractionItemProgress], None] | None = None
+
+
 @dataclass(slots=True)
 class ExtractionService:
     runtime: RuntimeCompatService = field(default_factory=RuntimeCompatService)
+    scheduler: ExtractionScheduler = field(default_factory=ExtractionScheduler)
+    events: ExtractionEventLog = field(default_factory=ExtractionEventLog)
 
     def validate_environment(self, settings: SessionSettings) -> None:
         errors = []
@@ -61,12 +115,18 @@ class ExtractionService:
                 skipped.append(SkippedItem(item_id=normalized_item_id, reason="缺少 scene.pkg"))
                 continue
 
+            try:
+                pkg_bytes = os.path.getsize(scene_pkg_path)
+            except OSError:
+                pkg_bytes = 0
+
             requests.append(
                 ExtractionRequest(
                     item_id=normalized_item_id,
                     title=record.display_title,
                     scene_pkg_path=scene_pkg_path,
                     item_directory=self.runtime.get_item_directory(steam_path, normalized_item_id),
+                    pkg_bytes=pkg_bytes,
                 )
             )
 
@@ -77,6 +137,10 @@ class ExtractionService:
         plan: ExtractionPlan,
         settings: SessionSettings,
         on_result: Callable[[ExtractionItemResult], None] | None = None,
+        cancel_token: ExtractionCancelToken | None = None,
+        eta_tracker: ExtractionEtaTracker | None = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | SharedWorkerBudget | None = None,
+        on_item_progress: Callable[[ExtractionItemProgress], None] | None = None,
     ) -> ExtractionSummary:
         self.validate_environment(settings)
         if not plan.requests:
@@ -87,33 +151,54 @@ class ExtractionService:
             )
 
         effective_workers = self.resolve_effective_workers(plan, settings)
+        limiter = concurrency_limiter
+        if limiter is None and len(plan.requests) > 1:
+            limiter = self.create_concurrency_limiter(plan, settings)
+        tracker = eta_tracker or self.scheduler.create_tracker(
+            plan,
+            limiter.limit if limiter is not None else effective_workers,
+        )
+        request_indexes = {id(request): index for index, request in enumerate(plan.requests)}
+        run = _ExtractionRun(
+            run_id=uuid.uuid4().hex,
+            settings=settings,
+            tracker=tracker,
+            submitted_at=time.perf_counter(),
+            cancel_token=cancel_token,
+            limiter=limiter,
+            on_item_progress=on_item_progress,
+        )
 
         ordered_results: list[ExtractionItemResult | None] = [None] * len(plan.requests)
         if len(plan.requests) == 1:
-            result = self._execute_request(plan.requests[0], settings)
+            request = plan.requests[0]
+            if self._acquire_slot(run, blocking=True):
+                result = self._execute_tracked_request(request, run)
+            else:
+                result = self._record_cancelled_request(request, run)
             ordered_results[0] = result
             if on_result is not None:
                 on_result(result)
         else:
-            with ThreadPoolExecutor(max_workers=effective_workers) as executor:
-                futures = {
-                    executor.submit(self._execute_request, request, settings): index
-                    for index, request in enumerate(plan.requests)
-                }
-                for future in as_completed(futures):
-                    result = future.result()
-                    ordered_results[futures[future]] = result
+            with ThreadPoolExecutor(max_workers=effective_workers, thread_name_prefix="repkg-extract") as executor:
+                ordered_requests = self.scheduler.order_requests(plan.requests)
+                for request, result in self._dispatch_requests(executor, ordered_requests, run, effective_workers):
+                    ordered_results[request_indexes[id(request)]] = result
                     if on_result is not None:
                         on_result(result)
 
+        self.scheduler.record_run(tracker)
         results = tuple(result for result in ordered_results if result is not None)
-        return ExtractionSummary(
+        summary = ExtractionSummary(
             requested_count=plan.total_count,
             succeeded=tuple(result for result in results if result.success),
-            failed=tuple(result for result in results if not result.success),
+            failed=tuple(result for result in results if not result.success and not result.cancelled),
             skipped=plan.skipped,
-            effective_workers=effective_workers,
+            effective_workers=limiter.limit if limiter is not None else effective_workers,
+            cancelled=tuple(result for result in results if result.cancelled),
         )
+        self.events.record_run(run.run_id, summary, time.perf_counter() - run.submitted_at)
+        return summary
 
     def extract(
         self,
@@ -121,9 +206,36 @@ class ExtractionService:
         item_ids: Iterable[str],
         settings: SessionSettings,
         on_result: Callable[[ExtractionItemResult], None] | None = None,
+        cancel_token: ExtractionCancelToken | None = None,
     ) -> tuple[ExtractionPlan, ExtractionSummary]:
         plan = self.prepare_requests(records, item_ids, settings.steam_path)
-        return plan, self.execute_requests(plan, settings, on_result=on_result)
+        return plan, self.execute_requests(plan, settings, on_result=on_result, cancel_token=cancel_token)
+
+    def create_eta_tracker(
+        self,
+        plan: ExtractionPlan,
+        settings: SessionSettings,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+    ) -> ExtractionEtaTracker:
+        workers = (
+            concurrency_limiter.limit
+            if concurrency_limiter is not None
+            else self.resolve_effective_workers(plan, settings)
+        )
+        return self.scheduler.create_tracker(plan, workers)
+
+    def create_concurrency_limiter(
+        self,
+        plan: ExtractionPlan,
+        settings: SessionSettings,
+    ) -> AdaptiveConcurrencyLimiter | None:
+        if not settings.adaptive_batch_extract_workers:
+            return None
+
+        max_workers = self.resolve_effective_workers(plan, settings)
+        if max_workers <= 1:
+            return None
+        return AdaptiveConcurrencyLimiter(max_workers)
 
     def resolve_effective_workers(self, plan: ExtractionPlan, settings: SessionSettings) -> int:
         if not plan.requests:
@@ -134,10 +246,105 @@ class ExtractionService:
             max(len(plan.requests), 1),
         )
 
-    def _execute_request(self, request: ExtractionRequest, settings: SessionSettings) -> ExtractionItemResult:
+    def _dispatch_requests(
+        self,
+        executor: ThreadPoolExecutor,
+        ordered_requests: Iterable[ExtractionRequest],
+        run: _ExtractionRun,
+        max_pending: int,
+    ) -> Iterator[tuple[ExtractionRequest, ExtractionItemResult]]:
+        queued = deque(ordered_requests)
+        pending: dict[Future[ExtractionItemResult], ExtractionRequest] = {}
+        while queued or pending:
+            if run.cancel_token is not None and run.cancel_token.is_cancelled:
+                while queued:
+                    request = queued.popleft()
+                    yield request, self._record_cancelled_request(request, run)
+            while queued and len(pending) < max_pending and self._acquire_slot(run, blocking=not pending):
+                request = queued.popleft()
+                pending[executor.submit(self._execute_tracked_request, request, run)] = request
+            if not pending:
+                continue
+            done, _ = wait(
+                pending,
+                timeout=ADAPTIVE_WAIT_INTERVAL_SECONDS if queued else None,
+                return_when=FIRST_COMPLETED,
+            )
+            for future in done:
+                yield pending.pop(future), future.result()
+
+    def _acquire_slot(self, run: _ExtractionRun, blocking: bool) -> bool:
+        if run.limiter is None:
+            return True
+        cancel_event = run.cancel_token.event if run.cancel_token is not None else None
+        return run.limiter.acquire(cancel_event, blocking=blocking)
+
+    def _record_cancelled_request(self, request: ExtractionRequest, run: _ExtractionRun) -> ExtractionItemResult:
+        result = self._build_cancelled_result(request)
+        self.events.record_item(run.run_id, request, result, time.perf_counter() - run.submitted_at)
+        return result
+
+    def _execute_tracked_request(self, request: ExtractionRequest, run: _ExtractionRun) -> ExtractionItemResult:
+        started_at = time.perf_counter()
+        run.tracker.mark_started(request)
+        result: ExtractionItemResult | None = None
+        try:
+            result = self._execute_request(request, run.settings, run.cancel_token, run.on_item_progress)
+        finally:
+            duration_seconds = time.perf_counter() - started_at
+            measured = result is not None and result.success
+            run.tracker.mark_finished(request, duration_seconds, measured=measured)
+            if run.limiter is not None:
+                run.tracker.set_workers(run.limiter.release(request.pkg_bytes, measured=measured))
+        result = replace(result, duration_seconds=duration_seconds)
+        instrumentation.count("extraction.succeeded" if result.success else "extraction.failed")
+        self.events.record_item(run.run_id, request, result, started_at - run.submitted_at)
+        return result
+
+    @instrumentation.timed("extraction.execute_request")
+    def _execute_request(
+        self,
+        request: ExtractionRequest,
+        settings: SessionSettings,
+        cancel_token: ExtractionCancelToken | None = None,
+        on_item_progress: Callable[[ExtractionItemProgress], None] | None = None,
+    ) -> ExtractionItemResult:
+        if cancel_token is not None and cancel_token.is_cancelled:
+            return self._build_cancelled_result(request)
+
+        timeout = self.runtime.resolve_extract_timeout(settings, request.pkg_bytes)
+        command: tuple[str, ...] = ()
+        monitor: ExtractionOutputMonitor | None = None
         try:
             command = tuple(self.runtime.build_extract_command(settings, request.item_id, request.title))
-            result = self.runtime.run_extract_command(list(command))
+            if on_item_progress is not None:
+                monitor = ExtractionOutputMonitor(
+                    request,
+                    resolve_command_output_directory(command),
+                    on_item_progress,
+                )
+            result = self.runtime.run_extract_command(
+                list(command),
+                cancel_event=cancel_token.event if cancel_token is not None else None,
+                timeout=timeout,
+                on_output=monitor.feed if monitor is not None else None,
+            )
+            if monitor is not None:
+                monitor.finish()
+        except subprocess.TimeoutExpired as exc:
+            error_message = f"提取超时（超过 {int(exc.timeout)} 秒），已终止 RePKG 进程"
+            app_services.log_error(f"提取壁纸ID {request.item_id} 超时: {error_message}")
+            return ExtractionItemResult(
+                item_id=request.item_id,
+                title=request.title,
+                success=False,
+                command=command,
+                error=error_message,
+                stdout=_coerce_output_text(exc.output),
+                stderr=_coerce_output_text(exc.stderr),
+                returncode=-1,
+                timed_out=True,
+            )
         except ValueError as exc:
             app_services.log_error(str(exc))
             return ExtractionItemResult(
@@ -171,6 +378,10 @@ class ExtractionService:
                 returncode=result.returncode,
             )
 
+        if cancel_token is not None and cancel_token.is_cancelled:
+            app_services.log_error(f"提取壁纸ID {request.item_id} 已被取消")
+            return self._build_cancelled_result(request, command)
+
         error_message = result.stderr.strip() or result.stdout.strip() or "未知错误"
         app_services.log_error(f"提取壁纸ID {request.item_id} 失败: {error_message}")
         return ExtractionItemResult(
@@ -183,3 +394,18 @@ class ExtractionService:
             stderr=result.stderr,
             returncode=result.returncode,
         )
+
+    @staticmethod
+    def _build_cancelled_result(
+        request: ExtractionRequest,
+        command: tuple[str, ...] = (),
+    ) -> ExtractionItemResult:
+        return ExtractionItemResult(
+            item_id=request.item_id,
+            title=request.title,
+            success=False,
+            command=command,
+            error="已取消",
+            returncode=-1,
+            cancelled=True,
+        )
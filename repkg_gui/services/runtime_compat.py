@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any
+import threading
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Iterable
 
 import app_services
-from repkg_gui.domain.entities import SessionSettings
+from repkg_gui import instrumentation
+from repkg_gui.domain.catalog_store import CatalogVocabulary
+from repkg_gui.domain.entities import SessionSettings, WallpaperRecord
 from repkg_gui.domain.enums import OutputMode
 
 RUNTIME_OUTPUT_MODE_BY_DOMAIN = {
@@ -44,13 +47,72 @@ class RuntimeCompatService:
             steam_path=loaded_config.steam_path,
             output_path=loaded_config.output_path,
             batch_extract_workers=loaded_config.batch_extract_workers,
+            adaptive_batch_extract_workers=loaded_config.adaptive_batch_extract_workers,
+            extract_timeout_seconds=loaded_config.extract_timeout_seconds,
+            extract_timeout_seconds_per_gb=loaded_config.extract_timeout_seconds_per_gb,
         )
 
     def extract_info_to_csv(self, steam_path: str | None = None, file_path: str | None = None) -> str:
-        return app_services.extract_info_to_csv(steam_path=steam_path, file_path=file_path)
-
-    def read_info_csv(self, file_path: str | None = None):
-        return app_services.read_info_csv(file_path or app_services.INFO_CSV_FILE)
+        effective_steam_path = steam_path or app_services.read_config_value("steam_path")
+        return app_services.write_info_csv(self._collect_workshop_info(effective_steam_path), file_path)
+
+    @instrumentation.timed("catalog.read_info_csv")
+    def read_info_csv(self, file_path: str | None = None, vocabulary: CatalogVocabulary | None = None):
+        with instrumentation.import_span("pandas"):
+            app_services._load_pandas()
+        return app_services.read_info_csv(file_path or app_services.INFO_CSV_FILE, vocabulary)
+
+    @instrumentation.timed("catalog.collect_workshop_info")
+    def _collect_workshop_info(
+        self,
+        steam_path: str,
+        vocabulary: CatalogVocabulary | None = None,
+    ) -> list[app_services.WallpaperInfo]:
+        extracted_info = app_services.collect_workshop_info(steam_path, vocabulary)
+        instrumentation.count("catalog.items_scanned", len(extracted_info))
+        return extracted_info
+
+    def collect_workshop_records(
+        self,
+        steam_path: str,
+        vocabulary: CatalogVocabulary | None = None,
+    ) -> list[WallpaperRecord]:
+        return [
+            WallpaperRecord.from_mapping(asdict(item_info), vocabulary)
+            for item_info in self._collect_workshop_info(steam_path, vocabulary)
+        ]
+
+    def collect_workshop_items(
+        self,
+        steam_path: str,
+        item_ids: Iterable[str],
+        vocabulary: CatalogVocabulary | None = None,
+    ) -> list[WallpaperRecord]:
+        return [
+            WallpaperRecord.from_mapping(asdict(item_info), vocabulary)
+            for item_info in app_services.collect_workshop_items(steam_path, item_ids, vocabulary)
+        ]
+
+    def scan_workshop_signatures(self, steam_path: str) -> dict[str, tuple[int, int, int]]:
+        return app_services.scan_workshop_signatures(steam_path)
+
+    def write_catalog_csv(self, records: Iterable[WallpaperRecord], file_path: str | None = None) -> str:
+        return app_services.write_info_csv(
+            [
+                app_services.WallpaperInfo(
+                    preview=record.preview_path,
+                    tags=list(record.tags),
+                    title=record.title,
+                    type=record.type,
+                    visibility=record.visibility,
+                    file=record.file,
+                    id=record.id,
+                    library=record.library,
+                )
+                for record in records
+            ],
+            file_path,
+        )
 
     def build_extraction_options(self, settings: SessionSettings) -> app_services.ExtractionOptions:
         output_mode = RUNTIME_OUTPUT_MODE_BY_DOMAIN[_coerce_output_mode(settings.output_mode)]
@@ -67,8 +129,26 @@ class RuntimeCompatService:
     def build_extract_command(self, settings: SessionSettings, item_id: str, title: str) -> list[str]:
         return app_services.build_extract_command(self.build_extraction_options(settings), item_id, title)
 
-    def run_extract_command(self, command: list[str]):
-        return app_services.run_extract_command(command)
+    def run_extract_command(
+        self,
+        command: list[str],
+        cancel_event: threading.Event | None = None,
+        timeout: float | None = None,
+        on_output: Callable[[str, str], None] | None = None,
+    ):
+        return app_services.run_extract_command(
+            command,
+            cancel_event=cancel_event,
+            timeout=timeout,
+            on_output=on_output,
+        )
+
+    def resolve_extract_timeout(self, settings: SessionSettings, pkg_bytes: int) -> float | None:
+        return app_services.resolve_extract_timeout(
+            pkg_bytes,
+            settings.extract_timeout_seconds,
+            settings.extract_timeout_seconds_per_gb,
+        )
 
     def resolve_batch_extract_workers(self, configured_workers: int) -> int:
         return app_services.resolve_batch_extract_workers(configured_workers)
@@ -76,12 +156,22 @@ class RuntimeCompatService:
     def get_workshop_directory(self, steam_path: str) -> str:
         return app_services.get_workshop_directory(steam_path)
 
+    def get_workshop_directories(self, steam_path: str) -> list[str]:
+        return app_services.get_workshop_directories(steam_path)
+
+    def get_steam_library_roots(self, steam_path: str) -> tuple[str, ...]:
+        return app_services.get_steam_library_roots(steam_path)
+
     def get_item_directory(self, steam_path: str, item_id: str) -> str:
         return app_services.get_item_directory(steam_path, item_id)
 
     def get_scene_pkg_path(self, steam_path: str, item_id: str) -> str:
         return app_services.get_scene_pkg_path(steam_path, item_id)
 
+    @property
+    def info_csv_path(self) -> str:
+        return app_services.INFO_CSV_FILE
+
     @property
     def repkg_executable(self) -> str:
-        return app_services.REPKG_EXECUTABLE
+        return app_services.get_repkg_executable()
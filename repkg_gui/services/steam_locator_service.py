@@ -2,7 +2,11 @@ from __future__ import annotations
 
 import ctypes
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import queue
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
 from dataclasses import dataclass, field
 
 from scandir import scandir
@@ -17,15 +21,72 @@ DEFAULT_COMMON_STEAM_PATHS = (
     r"E:\Program Files (x86)\Steam",
     r"E:\Program Files\Steam",
 )
+STEAM_LOCATIONS_FILENAME = "steam_locations.json"
+DEFAULT_DRIVE_PROBE_TIMEOUT_SECONDS = 5.0
+MAX_CACHED_STEAM_LOCATIONS = 8
+
+
+def get_steam_locations_path() -> str:
+    return os.path.join(app_services.RUNTIME_DIR, STEAM_LOCATIONS_FILENAME)
 
 
 @dataclass(slots=True)
 class SteamLocatorService:
     common_paths: tuple[str, ...] = field(default_factory=lambda: DEFAULT_COMMON_STEAM_PATHS)
+    cache_path: str | None = None
+    probe_timeout_seconds: float = DEFAULT_DRIVE_PROBE_TIMEOUT_SECONDS
 
     def is_valid_steam_path(self, path: str | None) -> bool:
         return app_services.is_existing_steam_path(path)
 
+    def resolve_cache_path(self) -> str:
+        return self.cache_path or get_steam_locations_path()
+
+    def load_cached_locations(self) -> list[dict[str, object]]:
+        try:
+            data = app_services.read_json_object(self.resolve_cache_path())
+        except FileNotFoundError:
+            return []
+        except (OSError, ValueError) as exc:
+            app_services.log_error(f"Error reading cached Steam locations: {exc}")
+            return []
+
+        locations = data.get("locations")
+        if not isinstance(locations, list):
+            return []
+        return [
+            location
+            for location in locations
+            if isinstance(location, dict) and isinstance(location.get("path"), str) and location["path"]
+        ]
+
+    def remember_location(self, steam_path: str) -> None:
+        normalized_key = os.path.normcase(os.path.normpath(steam_path))
+        locations = [
+            location
+            for location in self.load_cached_locations()
+            if os.path.normcase(os.path.normpath(str(location["path"]))) != normalized_key
+        ]
+        locations.insert(0, {"path": steam_path, "validated_at": round(time.time(), 3)})
+        try:
+            app_services._write_json_file(
+                self.resolve_cache_path(),
+                {"locations": locations[:MAX_CACHED_STEAM_LOCATIONS]},
+            )
+        except OSError as exc:
+            app_services.log_error(f"Error saving cached Steam locations: {exc}")
+
+    def find_in_cached_locations(self) -> str | None:
+        candidates = [str(location["path"]) for location in self.load_cached_locations()]
+        if not candidates:
+            return None
+        return self._probe_with_timeout(
+            candidates,
+            lambda candidate, _stop_event: candidate if self.is_valid_steam_path(candidate) else None,
+            "checking cached Steam location",
+            ordered=True,
+        )
+
     def find_in_common_locations(self) -> str | None:
         for path in self.common_paths:
             candidate = os.path.join(path, "steam.exe")
@@ -46,7 +107,7 @@ class SteamLocatorService:
                 drives.append(f"{chr(ord('A') + index)}:\\")
         return drives
 
-    def find_on_drive(self, drive: str) -> str | None:
+    def find_on_drive(self, drive: str, stop_event: threading.Event | None = None) -> str | None:
         if not os.path.exists(drive):
             return None
 
@@ -56,6 +117,8 @@ class SteamLocatorService:
 
         try:
             for entry in scandir(drive):
+                if stop_event is not None and stop_event.is_set():
+                    return None
                 if not entry.is_dir():
                     continue
 
@@ -68,26 +131,87 @@ class SteamLocatorService:
             app_services.log_error(f"Error scanning drive {drive}: {exc}")
         return None
 
-    def find_steam_path(self, include_all_drives: bool = True, max_workers: int | None = None) -> str | None:
-        common_path = self.find_in_common_locations()
-        if common_path or not include_all_drives:
-            return common_path
-
-        drives = self.get_available_drives()
-        if not drives:
+    def find_on_drives(self, drives: list[str], max_workers: int | None = None) -> str | None:
+        return self._probe_with_timeout(drives, self.find_on_drive, "searching drive", max_workers)
+
+    def _probe_with_timeout(
+        self,
+        targets: list[str],
+        probe: Callable[[str, threading.Event], str | None],
+        label: str,
+        max_workers: int | None = None,
+        ordered: bool = False,
+    ) -> str | None:
+        worker_count = max_workers or min(len(targets), 8) or 1
+        results: queue.Queue[tuple[str, str | None]] = queue.Queue()
+        stop_event = threading.Event()
+        pending = deque(targets)
+        deadlines: dict[str, float] = {}
+        outcomes: dict[str, str | None] = {}
+
+        def run_probe(target: str) -> None:
+            try:
+                steam_path = probe(target, stop_event)
+            except OSError as exc:
+                app_services.log_error(f"Error {label} {target}: {exc}")
+                steam_path = None
+            results.put((target, steam_path))
+
+        def launch_pending() -> None:
+            while pending and len(deadlines) < worker_count:
+                target = pending.popleft()
+                deadlines[target] = time.monotonic() + self.probe_timeout_seconds
+                threading.Thread(
+                    target=run_probe,
+                    args=(target,),
+                    name=f"repkg-steam-probe-{target[:1]}",
+                    daemon=True,
+                ).start()
+
+        def settled_result() -> str | None:
+            for target in targets:
+                if target not in outcomes:
+                    return None
+                if outcomes[target]:
+                    return outcomes[target]
             return None
 
-        worker_count = max_workers or min(len(drives), 8) or 1
-        with ThreadPoolExecutor(max_workers=worker_count) as executor:
-            futures = {executor.submit(self.find_on_drive, drive): drive for drive in drives}
-            for future in as_completed(futures):
+        try:
+            launch_pending()
+            while deadlines:
                 try:
-                    steam_path = future.result()
-                except OSError as exc:
-                    app_services.log_error(f"Error searching drive {futures[future]}: {exc}")
-                    continue
-
-                if steam_path:
-                    return steam_path
+                    target, steam_path = results.get(timeout=max(min(deadlines.values()) - time.monotonic(), 0.0))
+                except queue.Empty:
+                    now = time.monotonic()
+                    for target, deadline in list(deadlines.items()):
+                        if deadline <= now:
+                            app_services.log_error(f"Timed out {label} {target}")
+                            del deadlines[target]
+                            outcomes[target] = None
+                else:
+                    if deadlines.pop(target, None) is not None:
+                        outcomes[target] = steam_path
+                        if steam_path and not ordered:
+                            return steam_path
+                found = settled_result() if ordered else None
+                if found:
+                    return found
+                launch_pending()
+            return settled_result() if ordered else None
+        finally:
+            stop_event.set()
 
-        return None
+    def find_steam_path(self, include_all_drives: bool = True, max_workers: int | None = None) -> str | None:
+        cached_path = self.find_in_cached_locations()
+        if cached_path:
+            self.remember_location(cached_path)
+            return cached_path
+
+        steam_path = self.find_in_common_locations()
+        if not steam_path and include_all_drives:
+            drives = self.get_available_drives()
+            steam_path = self.find_on_drives(drives, max_workers) if drives else None
+
+        if steam_path:
+            self.remember_location(steam_path)
+        return steam_path
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+
+from repkg_gui.domain.entities import WorkshopChanges
+from repkg_gui.services.runtime_compat import RuntimeCompatService
+
+WorkshopSignatures = Mapping[str, tuple[int, int, int]]
+
+
+def diff_workshop_signatures(previous: WorkshopSignatures, current: WorkshopSignatures) -> WorkshopChanges:
+    return WorkshopChanges(
+        added=tuple(sorted(item_id for item_id in current if item_id not in previous)),
+        changed=tuple(
+            sorted(item_id for item_id, signature in current.items() if previous.get(item_id, signature) != signature)
+        ),
+        removed=tuple(sorted(item_id for item_id in previous if item_id not in current)),
+    )
+
+
+@dataclass(slots=True)
+class WorkshopChangeDetector:
+    runtime: RuntimeCompatService = field(default_factory=RuntimeCompatService)
+    steam_path: str = ""
+    _signatures: dict[str, tuple[int, int, int]] | None = None
+
+    @property
+    def is_primed(self) -> bool:
+        return self._signatures is not None
+
+    def reset(self, steam_path: str | None = None) -> None:
+        if steam_path is not None:
+            self.steam_path = steam_path
+        self._signatures = None
+
+    def prime(self) -> None:
+        self._signatures = self._scan()
+
+    def poll(self) -> WorkshopChanges:
+        current = self._scan()
+        previous = self._signatures
+        self._signatures = current
+        if previous is None:
+            return WorkshopChanges()
+        return diff_workshop_signatures(previous, current)
+
+    def _scan(self) -> dict[str, tuple[int, int, int]]:
+        if not self.steam_path:
+            return {}
+        return self.runtime.scan_workshop_signatures(self.steam_path)
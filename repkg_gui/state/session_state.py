@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 
 from app_services import AppConfig, SEPARATE_OUTPUT_MODE
@@ -18,7 +19,7 @@ class SessionState:
     status_message: str = "准备就绪。"
     task_state: str = "idle"
     catalog_count: int = 0
-    catalog_records: tuple[WallpaperRecord, ...] = field(default_factory=tuple)
+    catalog_records: Sequence[WallpaperRecord] = field(default_factory=tuple)
     selected_wallpaper_ids: set[str] = field(default_factory=set)
     focused_wallpaper_id: str | None = None
     last_scan_summary: str = ""
@@ -39,3 +40,23 @@ class SessionState:
     @property
     def batch_extract_workers(self) -> int:
         return self.config.batch_extract_workers
+
+    @property
+    def adaptive_batch_extract_workers(self) -> bool:
+        return self.config.adaptive_batch_extract_workers
+
+    @property
+    def watch_workshop(self) -> bool:
+        return self.config.watch_workshop
+
+    @property
+    def auto_extract_new_items(self) -> bool:
+        return self.config.auto_extract_new_items
+
+    @property
+    def extract_timeout_seconds(self) -> int:
+        return self.config.extract_timeout_seconds
+
+    @property
+    def extract_timeout_seconds_per_gb(self) -> int:
+        return self.config.extract_timeout_seconds_per_gb
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QCloseEvent
-from PySide6.QtWidgets import QDialog, QLabel, QProgressBar, QVBoxLayout
+from PySide6.QtWidgets import QDialog, QDialogButtonBox, QLabel, QProgressBar, QPushButton, QVBoxLayout
 
 
 class ProgressDialog(QDialog):
+    cancel_requested = Signal()
+
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
         self._running = False
+        self._cancel_pending = False
 
         self.setWindowTitle("提取进度")
         self.setWindowModality(Qt.WindowModality.WindowModal)
@@ -33,8 +36,24 @@ class ProgressDialog(QDialog):
         self.item_label.setWordWrap(True)
         layout.addWidget(self.item_label)
 
+        self.button_box = QDialogButtonBox()
+        self.cancel_button = QPushButton("取消提取")
+        self.button_box.addButton(self.cancel_button, QDialogButtonBox.ButtonRole.RejectRole)
+        self.cancel_button.clicked.connect(self.request_cancel)
+        layout.addWidget(self.button_box)
+
     def set_running(self, running: bool) -> None:
         self._running = running
+        self.cancel_button.setEnabled(running and not self._cancel_pending)
+
+    def request_cancel(self) -> None:
+        if not self._running or self._cancel_pending:
+            return
+        self._cancel_pending = True
+        self.cancel_button.setEnabled(False)
+        self.cancel_button.setText("正在取消…")
+        self.summary_label.setText("正在取消提取任务，已开始的项目会在宽限期后终止…")
+        self.cancel_requested.emit()
 
     def set_progress(
         self,
@@ -43,6 +62,9 @@ class ProgressDialog(QDialog):
         message: str,
         current_item_id: str = "",
         worker_count: int = 0,
+        eta_seconds: float | None = None,
+        adaptive_workers: bool = False,
+        item_detail: str = "",
     ) -> None:
         safe_total = max(total, 1)
         bounded_completed = min(max(completed, 0), safe_total)
@@ -51,17 +73,38 @@ class ProgressDialog(QDialog):
         self.summary_label.setText(message)
 
         detail_parts = [f"已处理 {min(completed, total) if total else completed}/{total} 项"]
-        if worker_count > 1:
+        if adaptive_workers and worker_count > 0:
+            detail_parts.append(f"自适应并发 {worker_count} 线程")
+        elif worker_count > 1:
             detail_parts.append(f"并发 {worker_count} 线程")
+        if eta_seconds is not None and completed < total:
+            detail_parts.append(f"预计剩余 {format_eta(eta_seconds)}")
         self.detail_label.setText("，".join(detail_parts))
 
-        if current_item_id:
+        if current_item_id and item_detail:
+            self.item_label.setText(f"当前项目：{current_item_id}（{item_detail}）")
+        elif current_item_id:
             self.item_label.setText(f"当前项目：{current_item_id}")
         else:
             self.item_label.setText("")
 
+    def reject(self) -> None:  # pragma: no cover - UI behavior
+        if self._running:
+            self.request_cancel()
+            return
+        super().reject()
+
     def closeEvent(self, event: QCloseEvent) -> None:  # pragma: no cover - UI behavior
         if self._running:
             event.ignore()
             return
         super().closeEvent(event)
+
+
+def format_eta(seconds: float) -> str:
+    total_seconds = max(int(round(seconds)), 0)
+    hours, remainder = divmod(total_seconds, 3600)
+    minutes, secs = divmod(remainder, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{secs:02d}"
+    return f"{minutes:02d}:{secs:02d}"
@@ -38,9 +38,10 @@ class SteamPathSearchWorker(QObject):
 
 
 class SteamPathDialog(QDialog):
-    def __init__(self, context: AppContext, parent=None):
+    def __init__(self, context: AppContext, parent=None, locator_service: SteamLocatorService | None = None):
         super().__init__(parent)
         self.context = context
+        self.locator_service = locator_service or SteamLocatorService()
         self._search_thread: QThread | None = None
         self._search_worker: SteamPathSearchWorker | None = None
 
@@ -92,7 +93,7 @@ class SteamPathDialog(QDialog):
         self.status_label.setText("正在搜索 steam.exe，请稍候…")
 
         self._search_thread = QThread(self)
-        self._search_worker = SteamPathSearchWorker()
+        self._search_worker = SteamPathSearchWorker(self.locator_service)
         self._search_worker.moveToThread(self._search_thread)
         self._search_thread.started.connect(self._search_worker.run)
         self._search_worker.finished.connect(self._handle_auto_locate_finished)
@@ -149,6 +150,7 @@ class SteamPathDialog(QDialog):
             return
 
         self.context.set_steam_path(selected_path)
+        self.locator_service.remember_location(selected_path)
         self.accept()
 
     def reject(self) -> None:
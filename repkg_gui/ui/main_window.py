@@ -4,16 +4,19 @@ from typing import TYPE_CHECKING
 
 from PySide6.QtWidgets import QMainWindow, QStatusBar, QTabWidget
 
+from .. import instrumentation
 from ..app_context import AppContext
-from .dialogs.steam_path_dialog import SteamPathDialog
-from .pages.about_page import AboutPage
-from .pages.help_page import HelpPage
+from ..controllers.diagnostics_controller import DiagnosticsController
 from .pages.library_page import LibraryPage
-from .pages.settings_page import SettingsPage
+from .widgets.lazy_page import LazyPage
 from .widgets.status_strip import StatusStrip
 
 if TYPE_CHECKING:
     from ..controllers.extraction_controller import ExtractionController
+    from .pages.about_page import AboutPage
+    from .pages.diagnostics_page import DiagnosticsPage
+    from .pages.help_page import HelpPage
+    from .pages.settings_page import SettingsPage
 
 
 class MainWindow(QMainWindow):
@@ -27,14 +30,21 @@ class MainWindow(QMainWindow):
 
         self.tabs = QTabWidget()
         self.library_page = LibraryPage(context)
-        self.settings_page = SettingsPage(context)
-        self.help_page = HelpPage()
-        self.about_page = AboutPage()
+        self.diagnostics_controller = DiagnosticsController(
+            self.library_page.controller,
+            thumbnail_view=self.library_page.thumbnail_view,
+            parent=self,
+        )
+        self.settings_tab = LazyPage(self._create_settings_page)
+        self.help_tab = LazyPage(self._create_help_page)
+        self.diagnostics_tab = LazyPage(self._create_diagnostics_page)
+        self.about_tab = LazyPage(self._create_about_page)
 
         self.tabs.addTab(self.library_page, "已安装壁纸")
-        self.tabs.addTab(self.settings_page, "设置")
-        self.tabs.addTab(self.help_page, "帮助")
-        self.tabs.addTab(self.about_page, "关于")
+        self.tabs.addTab(self.settings_tab, "设置")
+        self.tabs.addTab(self.help_tab, "帮助")
+        self.tabs.addTab(self.diagnostics_tab, "诊断")
+        self.tabs.addTab(self.about_tab, "关于")
         self.setCentralWidget(self.tabs)
 
         status_bar = QStatusBar(self)
@@ -43,15 +53,58 @@ class MainWindow(QMainWindow):
         self.status_strip = StatusStrip(context)
         status_bar.addPermanentWidget(self.status_strip, 1)
 
-        self.settings_page.change_steam_path_requested.connect(self.open_steam_path_dialog)
         self.tabs.currentChanged.connect(self._handle_tab_changed)
         if self.extraction_controller is not None:
             self.register_extraction_controller(self.extraction_controller)
 
+    @property
+    def settings_page(self) -> "SettingsPage":
+        return self.settings_tab.page()
+
+    @property
+    def help_page(self) -> "HelpPage":
+        return self.help_tab.page()
+
+    @property
+    def diagnostics_page(self) -> "DiagnosticsPage":
+        return self.diagnostics_tab.page()
+
+    @property
+    def about_page(self) -> "AboutPage":
+        return self.about_tab.page()
+
     def open_steam_path_dialog(self) -> None:
+        from .dialogs.steam_path_dialog import SteamPathDialog
+
         dialog = SteamPathDialog(self.context, parent=self)
         dialog.exec()
 
+    def _create_settings_page(self) -> "SettingsPage":
+        with instrumentation.import_span("repkg_gui.ui.pages.settings_page"):
+            from .pages.settings_page import SettingsPage
+
+        page = SettingsPage(self.context)
+        page.change_steam_path_requested.connect(self.open_steam_path_dialog)
+        return page
+
+    def _create_help_page(self) -> "HelpPage":
+        with instrumentation.import_span("repkg_gui.ui.pages.help_page"):
+            from .pages.help_page import HelpPage
+
+        return HelpPage()
+
+    def _create_diagnostics_page(self) -> "DiagnosticsPage":
+        with instrumentation.import_span("repkg_gui.ui.pages.diagnostics_page"):
+            from .pages.diagnostics_page import DiagnosticsPage
+
+        return DiagnosticsPage(self.context, self.diagnostics_controller)
+
+    def _create_about_page(self) -> "AboutPage":
+        with instrumentation.import_span("repkg_gui.ui.pages.about_page"):
+            from .pages.about_page import AboutPage
+
+        return AboutPage()
+
     def register_extraction_controller(self, controller: "ExtractionController") -> None:
         self.extraction_controller = controller
         self.library_page.single_extract_requested.connect(
@@ -60,6 +113,17 @@ class MainWindow(QMainWindow):
         self.library_page.batch_extract_requested.connect(
             lambda item_ids, records: controller.extract_batch(item_ids, records=records, parent=self)
         )
+        self.library_page.auto_extract_requested.connect(self._handle_auto_extract_requested)
+        controller.task_idle.connect(self.library_page.controller.flush_auto_extract)
+        self.diagnostics_controller.attach_extraction_controller(controller)
+
+    def _handle_auto_extract_requested(self, item_ids: tuple[str, ...], records: object) -> None:
+        if self.extraction_controller is None:
+            return
+        if self.extraction_controller.is_busy:
+            self.library_page.controller.defer_auto_extract(item_ids)
+            return
+        self.extraction_controller.extract_batch(item_ids, records=records, parent=self)
 
     def _handle_tab_changed(self, index: int) -> None:
         tab_text = self.tabs.tabText(index)
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QGroupBox,
+    QHBoxLayout,
+    QHeaderView,
+    QLabel,
+    QPushButton,
+    QScrollArea,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+    QWidget,
+)
+
+from ...app_context import AppContext
+from ...controllers.diagnostics_controller import DiagnosticsController, build_diagnostics_sections
+from ...domain.entities import DiagnosticsSnapshot
+from ...profiling import DEFAULT_PROFILE_SECONDS, ProfileResult, ProfileSession
+from ...workers.extraction_worker import format_byte_size
+
+WORKER_TABLE_HEADERS = ("线程", "壁纸 ID", "已写出文件", "已写出大小", "当前条目")
+
+
+class DiagnosticsPage(QWidget):
+    def __init__(self, context: AppContext, controller: DiagnosticsController):
+        super().__init__()
+        self.context = context
+        self.controller = controller
+
+        outer_layout = QVBoxLayout(self)
+        scroll_area = QScrollArea()
+        scroll_area.setWidgetResizable(True)
+        content = QWidget()
+        content_layout = QVBoxLayout(content)
+        content_layout.setContentsMargins(16, 16, 16, 16)
+        content_layout.setSpacing(12)
+
+        self._section_labels: list[list[QLabel]] = []
+        for section in build_diagnostics_sections(DiagnosticsSnapshot(captured_at=0.0)):
+            section_box = QGroupBox(section.title)
+            section_layout = QVBoxLayout(section_box)
+            labels = []
+            for line in section.lines:
+                label = QLabel(line)
+                label.setWordWrap(True)
+                section_layout.addWidget(label)
+                labels.append(label)
+            self._section_labels.append(labels)
+            content_layout.addWidget(section_box)
+
+        workers_box = QGroupBox("提取线程")
+        workers_layout = QVBoxLayout(workers_box)
+        self.worker_table = QTableWidget(0, len(WORKER_TABLE_HEADERS))
+        self.worker_table.setHorizontalHeaderLabels(WORKER_TABLE_HEADERS)
+        self.worker_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.worker_table.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.worker_table.verticalHeader().setVisible(False)
+        self.worker_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        self.worker_table.horizontalHeader().setStretchLastSection(True)
+        workers_layout.addWidget(self.worker_table)
+        content_layout.addWidget(workers_box)
+
+        profile_box = QGroupBox("性能剖析")
+        profile_layout = QHBoxLayout(profile_box)
+        self.profile_button = QPushButton(f"开始性能剖析（{DEFAULT_PROFILE_SECONDS:.0f} 秒）")
+        self.profile_status_label = QLabel("在卡顿前开始剖析，结果会写入 runtime\\profiles 目录，可离线分析。")
+        self.profile_status_label.setWordWrap(True)
+        profile_layout.addWidget(self.profile_button)
+        profile_layout.addWidget(self.profile_status_label, 1)
+        content_layout.addWidget(profile_box)
+
+        action_layout = QHBoxLayout()
+        self.export_button = QPushButton("导出诊断数据")
+        self.export_status_label = QLabel("导出的 JSON 文件保存在 runtime 目录中。")
+        self.export_status_label.setWordWrap(True)
+        action_layout.addWidget(self.export_button)
+        action_layout.addWidget(self.export_status_label, 1)
+        content_layout.addLayout(action_layout)
+
+        content_layout.addStretch(1)
+        scroll_area.setWidget(content)
+        outer_layout.addWidget(scroll_area)
+
+        self.export_button.clicked.connect(self.export_snapshot)
+        if self.controller.is_profiling:
+            self.profile_button.setText("停止性能剖析")
+        self.profile_button.clicked.connect(self.toggle_profiling)
+        self.controller.snapshot_changed.connect(self.update_snapshot)
+        self.controller.profiling_started.connect(self._handle_profiling_started)
+        self.controller.profiling_finished.connect(self._handle_profiling_finished)
+        self.controller.profiling_failed.connect(self._handle_profiling_failed)
+
+    def update_snapshot(self, snapshot: DiagnosticsSnapshot) -> None:
+        for labels, section in zip(self._section_labels, build_diagnostics_sections(snapshot)):
+            for label, line in zip(labels, section.lines):
+                label.setText(line)
+
+        self.worker_table.setRowCount(len(snapshot.workers))
+        for row, activity in enumerate(snapshot.workers):
+            values = (
+                activity.worker,
+                activity.item_id,
+                str(activity.files_extracted),
+                format_byte_size(activity.bytes_extracted),
+                activity.current_entry,
+            )
+            for column, value in enumerate(values):
+                self.worker_table.setItem(row, column, QTableWidgetItem(value))
+
+    def export_snapshot(self) -> str:
+        try:
+            export_path = self.controller.export_snapshot()
+        except OSError as exc:
+            self.export_status_label.setText(f"导出诊断数据失败：{exc}")
+            self.context.set_status(f"导出诊断数据失败：{exc}")
+            return ""
+        self.export_status_label.setText(f"已导出：{export_path}")
+        self.context.set_status(f"已导出诊断数据：{export_path}")
+        return export_path
+
+    def toggle_profiling(self) -> None:
+        if self.controller.is_profiling:
+            self.controller.stop_profiling()
+            return
+        self.controller.start_profiling()
+
+    def _handle_profiling_started(self, session: ProfileSession) -> None:
+        self.profile_button.setText("停止性能剖析")
+        message = f"正在进行性能剖析，最多 {session.duration_seconds:.0f} 秒…"
+        self.profile_status_label.setText(message)
+        self.context.set_status(message)
+
+    def _handle_profiling_finished(self, result: ProfileResult) -> None:
+        self.profile_button.setText(f"开始性能剖析（{DEFAULT_PROFILE_SECONDS:.0f} 秒）")
+        message = f"性能剖析已完成（{result.duration_seconds:.1f} 秒）：{'、'.join(result.output_paths)}"
+        self.profile_status_label.setText(message)
+        self.context.set_status(message)
+
+    def _handle_profiling_failed(self, message: str) -> None:
+        self.profile_button.setText(f"开始性能剖析（{DEFAULT_PROFILE_SECONDS:.0f} 秒）")
+        self.profile_status_label.setText(f"性能剖析失败：{message}")
+        self.context.set_status(f"性能剖析失败：{message}")
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        self.controller.start()
+
+    def hideEvent(self, event) -> None:
+        self.controller.stop()
+        super().hideEvent(event)
@@ -15,6 +15,7 @@ from ..widgets.thumbnail_view import ThumbnailView
 class LibraryPage(QWidget):
     single_extract_requested = Signal(str, object)
     batch_extract_requested = Signal(object, object)
+    auto_extract_requested = Signal(object, object)
 
     def __init__(self, context: AppContext):
         super().__init__()
@@ -85,6 +86,9 @@ class LibraryPage(QWidget):
         self.controller.batch_extract_requested.connect(
             lambda item_ids: self.batch_extract_requested.emit(item_ids, self.controller.table_model.all_records())
         )
+        self.controller.auto_extract_requested.connect(
+            lambda item_ids: self.auto_extract_requested.emit(item_ids, self.controller.table_model.all_records())
+        )
 
         self.table_view.selectionModel().selectionChanged.connect(self._handle_table_selection_changed)
         self.table_view.selectionModel().currentChanged.connect(self._handle_table_selection_changed)
@@ -27,6 +27,7 @@ from app_services import (
     DEFAULT_OUTPUT_PATH,
     LOCAL_OUTPUT_MODE,
     MAX_BATCH_EXTRACT_WORKERS,
+    MAX_EXTRACT_TIMEOUT_SECONDS,
     SEPARATE_OUTPUT_MODE,
     SHARED_OUTPUT_MODE,
 )
@@ -92,6 +93,13 @@ class SettingsPage(QWidget):
         )
         self.path_files_label.setWordWrap(True)
         path_layout.addWidget(self.path_files_label)
+        self.watch_workshop_checkbox = QCheckBox("监视创意工坊目录，自动增量更新壁纸列表")
+        self.auto_extract_checkbox = QCheckBox("新订阅下载完成后自动提取")
+        path_layout.addWidget(self.watch_workshop_checkbox)
+        path_layout.addWidget(self.auto_extract_checkbox)
+        self.watch_description = QLabel()
+        self.watch_description.setWordWrap(True)
+        path_layout.addWidget(self.watch_description)
         root_layout.addWidget(path_group)
 
         option_group = QGroupBox("自定义选项")
@@ -142,9 +150,24 @@ class SettingsPage(QWidget):
         self.batch_workers_spin.setRange(0, MAX_BATCH_EXTRACT_WORKERS)
         self.batch_workers_spin.setSpecialValueText("自动")
         output_form.addRow("批量提取并发：", self.batch_workers_spin)
+        self.adaptive_workers_checkbox = QCheckBox("自适应并发（按磁盘吞吐自动增减线程）")
+        output_form.addRow("", self.adaptive_workers_checkbox)
         self.batch_workers_description = QLabel()
         self.batch_workers_description.setWordWrap(True)
         output_form.addRow("并发说明：", self.batch_workers_description)
+
+        self.extract_timeout_spin = QSpinBox()
+        self.extract_timeout_spin.setRange(0, MAX_EXTRACT_TIMEOUT_SECONDS)
+        self.extract_timeout_spin.setSpecialValueText("不限制")
+        self.extract_timeout_spin.setSuffix(" 秒")
+        output_form.addRow("单项提取超时：", self.extract_timeout_spin)
+        self.extract_timeout_per_gb_spin = QSpinBox()
+        self.extract_timeout_per_gb_spin.setRange(0, MAX_EXTRACT_TIMEOUT_SECONDS)
+        self.extract_timeout_per_gb_spin.setSuffix(" 秒")
+        output_form.addRow("每 GB 追加：", self.extract_timeout_per_gb_spin)
+        self.extract_timeout_description = QLabel()
+        self.extract_timeout_description.setWordWrap(True)
+        output_form.addRow("超时说明：", self.extract_timeout_description)
         root_layout.addWidget(output_group)
 
         theme_group = QGroupBox("主题配色")
@@ -166,7 +189,7 @@ class SettingsPage(QWidget):
 
         scope_group = QGroupBox("持久化范围")
         scope_layout = QVBoxLayout(scope_group)
-        scope_layout.addWidget(QLabel("以下设置会写入 runtime\\config.json：steam.exe、输出目录、批量提取并发、主题预设、主题配色。"))
+        scope_layout.addWidget(QLabel("以下设置会写入 runtime\\config.json：steam.exe、输出目录、批量提取并发、自适应并发、提取超时、创意工坊监视、主题预设、主题配色。"))
         scope_layout.addWidget(
             QLabel(
                 "以下设置仅在当前程序运行期间生效：输出模式、TEX 转换、子目录命名、复制附带文件、覆盖开关。"
@@ -189,6 +212,15 @@ class SettingsPage(QWidget):
         self.output_path_edit.editingFinished.connect(self._persist_output_path)
         self.output_mode_combo.currentTextChanged.connect(self._handle_output_mode_changed)
         self.batch_workers_spin.valueChanged.connect(self.controller.set_batch_extract_workers)
+        self.adaptive_workers_checkbox.toggled.connect(self.controller.set_adaptive_batch_extract_workers)
+        self.watch_workshop_checkbox.toggled.connect(self.controller.set_watch_workshop)
+        self.auto_extract_checkbox.toggled.connect(self.controller.set_auto_extract_new_items)
+        self.extract_timeout_spin.editingFinished.connect(
+            lambda: self.controller.set_extract_timeout_seconds(self.extract_timeout_spin.value())
+        )
+        self.extract_timeout_per_gb_spin.editingFinished.connect(
+            lambda: self.controller.set_extract_timeout_seconds_per_gb(self.extract_timeout_per_gb_spin.value())
+        )
         self.theme_preset_combo.currentIndexChanged.connect(self._handle_theme_preset_changed)
         self.not_convert_checkbox.toggled.connect(
             lambda value: self._set_option("not_convert_tex_to_image", value)
@@ -212,6 +244,18 @@ class SettingsPage(QWidget):
             self.output_mode_combo.setCurrentText(state.output_mode)
         with QSignalBlocker(self.batch_workers_spin):
             self.batch_workers_spin.setValue(state.batch_extract_workers)
+        with QSignalBlocker(self.adaptive_workers_checkbox):
+            self.adaptive_workers_checkbox.setChecked(state.adaptive_batch_extract_workers)
+        with QSignalBlocker(self.watch_workshop_checkbox):
+            self.watch_workshop_checkbox.setChecked(state.watch_workshop)
+        with QSignalBlocker(self.auto_extract_checkbox):
+            self.auto_extract_checkbox.setChecked(state.auto_extract_new_items)
+        self.auto_extract_checkbox.setEnabled(state.watch_workshop)
+        self.watch_description.setText(self.controller.watch_description())
+        with QSignalBlocker(self.extract_timeout_spin):
+            self.extract_timeout_spin.setValue(state.extract_timeout_seconds)
+        with QSignalBlocker(self.extract_timeout_per_gb_spin):
+            self.extract_timeout_per_gb_spin.setValue(state.extract_timeout_seconds_per_gb)
         preset_index = self.theme_preset_combo.findData(state.config.theme_preset)
         with QSignalBlocker(self.theme_preset_combo):
             self.theme_preset_combo.setCurrentIndex(max(preset_index, 0))
@@ -229,6 +273,7 @@ class SettingsPage(QWidget):
         self.output_mode_description.setText(self.controller.output_mode_description())
         self.output_path_hint.setText(self._build_output_path_hint(state.output_mode))
         self.batch_workers_description.setText(self.controller.batch_workers_description())
+        self.extract_timeout_description.setText(self.controller.extract_timeout_description())
         for color_name, color_value in self.controller.theme_color_values().items():
             self._update_theme_button(color_name, color_value)
         self.summary_edit.setPlainText(self.controller.summary_text())
@@ -81,6 +81,14 @@ class ThumbnailView(QListView):
         self._loader.thumbnail_loaded.connect(self._handle_thumbnail_loaded)
         self._loader.thumbnail_failed.connect(self._handle_thumbnail_failed)
 
+    @property
+    def cache(self) -> ThumbnailCache:
+        return self._cache
+
+    @property
+    def loader(self) -> ThumbnailLoader:
+        return self._loader
+
     def thumbnail_for_index(self, index: QModelIndex, size: QSize) -> QPixmap:
         preview_path = str(index.data(CatalogTableModel.PREVIEW_PATH_ROLE) or "")
         cache_key = ThumbnailCache.build_key(preview_path, size)
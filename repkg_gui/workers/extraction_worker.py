@@ -6,6 +6,7 @@ import app_services
 from PySide6.QtCore import QObject, Signal, Slot
 
 from repkg_gui.domain.entities import (
+    ExtractionItemProgress,
     ExtractionItemResult,
     ExtractionOutcome,
     ExtractionPlan,
@@ -14,7 +15,11 @@ from repkg_gui.domain.entities import (
     SessionSettings,
     WallpaperRecord,
 )
-from repkg_gui.services.extraction_service import ExtractionService, ExtractionValidationError
+from repkg_gui.services.extraction_service import (
+    ExtractionCancelToken,
+    ExtractionService,
+    ExtractionValidationError,
+)
 
 
 class ExtractionWorker(QObject):
@@ -35,17 +40,37 @@ class ExtractionWorker(QObject):
         self._records = tuple(records)
         self._item_ids = tuple(item_ids)
         self._settings = settings
+        self._cancel_token = ExtractionCancelToken()
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._cancel_token.is_cancelled
+
+    def cancel(self) -> None:
+        self._cancel_token.cancel()
 
     @Slot()
     def run(self) -> None:
         try:
             self._service.validate_environment(self._settings)
             plan = self._service.prepare_requests(self._records, self._item_ids, self._settings.steam_path)
+            concurrency_limiter = (
+                self._service.create_concurrency_limiter(plan, self._settings) if len(plan.requests) > 1 else None
+            )
+            eta_tracker = (
+                self._service.create_eta_tracker(plan, self._settings, concurrency_limiter) if plan.requests else None
+            )
             task_info = ExtractionTaskInfo(
                 requested_count=plan.total_count,
                 executable_count=len(plan.requests),
                 skipped_count=len(plan.skipped),
-                effective_workers=self._service.resolve_effective_workers(plan, self._settings),
+                effective_workers=(
+                    concurrency_limiter.limit
+                    if concurrency_limiter is not None
+                    else self._service.resolve_effective_workers(plan, self._settings)
+                ),
+                estimated_seconds=eta_tracker.remaining_seconds() if eta_tracker is not None else None,
+                adaptive_workers=concurrency_limiter is not None,
             )
             self.started.emit(task_info)
 
@@ -56,6 +81,24 @@ class ExtractionWorker(QObject):
                         completed=processed,
                         total=plan.total_count,
                         message=self._build_progress_message(processed, plan.total_count, plan),
+                        eta_seconds=task_info.estimated_seconds,
+                        effective_workers=task_info.effective_workers,
+                    )
+                )
+
+            def current_workers() -> int:
+                return concurrency_limiter.limit if concurrency_limiter is not None else task_info.effective_workers
+
+            def on_item_progress(item_progress: ExtractionItemProgress) -> None:
+                self.progress.emit(
+                    ExtractionProgress(
+                        completed=processed,
+                        total=plan.total_count,
+                        current_item_id=item_progress.item_id,
+                        message=self._build_item_progress_message(item_progress),
+                        eta_seconds=eta_tracker.remaining_seconds() if eta_tracker is not None else None,
+                        effective_workers=current_workers(),
+                        item_progress=item_progress,
                     )
                 )
 
@@ -68,10 +111,20 @@ class ExtractionWorker(QObject):
                         total=plan.total_count,
                         current_item_id=result.item_id,
                         message=self._build_result_message(result, processed, plan.total_count),
+                        eta_seconds=eta_tracker.remaining_seconds() if eta_tracker is not None else None,
+                        effective_workers=current_workers(),
                     )
                 )
 
-            summary = self._service.execute_requests(plan, self._settings, on_result=on_result)
+            summary = self._service.execute_requests(
+                plan,
+                self._settings,
+                on_result=on_result,
+                cancel_token=self._cancel_token,
+                eta_tracker=eta_tracker,
+                concurrency_limiter=concurrency_limiter,
+                on_item_progress=on_item_progress,
+            )
             self.finished.emit(ExtractionOutcome(plan=plan, summary=summary))
         except ExtractionValidationError as exc:
             self.failed.emit(str(exc))
@@ -87,7 +140,25 @@ class ExtractionWorker(QObject):
             return f"已准备提取任务（已处理 {processed}/{total} 项，预先跳过 {len(plan.skipped)} 项）。"
         return f"已准备提取任务（0/{total}）。"
 
+    @staticmethod
+    def _build_item_progress_message(item_progress: ExtractionItemProgress) -> str:
+        return (
+            f"正在提取：{item_progress.item_id}（已写出 {item_progress.files_extracted} 个文件，"
+            f"{format_byte_size(item_progress.bytes_extracted)}）"
+        )
+
     @staticmethod
     def _build_result_message(result: ExtractionItemResult, processed: int, total: int) -> str:
+        if result.cancelled:
+            return f"已取消：{result.item_id}（{processed}/{total}）"
         outcome = "成功" if result.success else "失败"
         return f"提取{outcome}：{result.item_id}（{processed}/{total}）"
+
+
+def format_byte_size(size: int) -> str:
+    value = float(max(size, 0))
+    for unit in ("B", "KB", "MB"):
+        if value < 1024:
+            return f"{value:.0f} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.2f} GB"
@@ -6,6 +6,7 @@ from PySide6.QtCore import QObject, QRunnable, QSize, Qt, QThreadPool, Signal
 from PySide6.QtGui import QImage
 from shiboken6 import isValid
 
+from repkg_gui import instrumentation
 from repkg_gui.image_utils import load_static_qimage
 
 
@@ -17,16 +18,19 @@ class _ThumbnailLoadTask(QRunnable):
         self._path = path
         self._size = size
 
+    @instrumentation.timed("thumbnail.load")
     def run(self) -> None:
         if not isValid(self._loader):
             return
         if not os.path.exists(self._path):
+            instrumentation.count("thumbnail.failed")
             if isValid(self._loader):
                 self._loader.thumbnail_failed.emit(self._key)
             return
 
         image = load_static_qimage(self._path)
         if image.isNull():
+            instrumentation.count("thumbnail.failed")
             if isValid(self._loader):
                 self._loader.thumbnail_failed.emit(self._key)
             return
@@ -36,6 +40,7 @@ class _ThumbnailLoadTask(QRunnable):
             Qt.AspectRatioMode.KeepAspectRatio,
             Qt.TransformationMode.SmoothTransformation,
         )
+        instrumentation.count("thumbnail.loaded")
         if isValid(self._loader):
             self._loader.thumbnail_loaded.emit(self._key, scaled_image)
 
@@ -48,7 +53,12 @@ class ThumbnailLoader(QObject):
         super().__init__(parent)
         self._thread_pool = thread_pool or QThreadPool.globalInstance()
 
+    @property
+    def active_thread_count(self) -> int:
+        return self._thread_pool.activeThreadCount()
+
     def request(self, key: str, path: str, size: QSize) -> None:
+        instrumentation.count("thumbnail.requested")
         if not path:
             self.thumbnail_failed.emit(key)
             return
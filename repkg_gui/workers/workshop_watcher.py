@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import os
+import time
+
+from PySide6.QtCore import QFileSystemWatcher, QObject, QTimer, Signal
+
+from repkg_gui.services.runtime_compat import RuntimeCompatService
+from repkg_gui.services.workshop_watch import WorkshopChangeDetector
+
+WATCH_DEBOUNCE_MS = 1500
+WATCH_MAX_DELAY_SECONDS = 10.0
+WATCH_POLL_INTERVAL_MS = 30000
+
+
+class WorkshopWatcher(QObject):
+    changes_detected = Signal(object)
+    watch_failed = Signal(str)
+
+    def __init__(
+        self,
+        runtime: RuntimeCompatService | None = None,
+        debounce_ms: int = WATCH_DEBOUNCE_MS,
+        poll_interval_ms: int = WATCH_POLL_INTERVAL_MS,
+        parent: QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self.runtime = runtime or RuntimeCompatService()
+        self.detector = WorkshopChangeDetector(runtime=self.runtime)
+        self._watched_directories: tuple[str, ...] = ()
+        self._pending_since: float | None = None
+        self._file_watcher = QFileSystemWatcher(self)
+        self._file_watcher.directoryChanged.connect(lambda _path: self.schedule_check())
+        self._debounce_timer = QTimer(self)
+        self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.setInterval(max(debounce_ms, 0))
+        self._debounce_timer.timeout.connect(self.check_now)
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setInterval(max(poll_interval_ms, 1000))
+        self._poll_timer.timeout.connect(self.schedule_check)
+
+    @property
+    def is_active(self) -> bool:
+        return bool(self._watched_directories)
+
+    @property
+    def watched_directories(self) -> tuple[str, ...]:
+        return self._watched_directories
+
+    def start(self, steam_path: str) -> bool:
+        self.stop()
+        candidates = self.runtime.get_workshop_directories(steam_path) if steam_path else ()
+        directories = tuple(directory for directory in candidates if os.path.isdir(directory))
+        if not directories:
+            missing = candidates[0] if candidates else "未设置 steam.exe"
+            self.watch_failed.emit(f"创意工坊目录不存在：{missing}")
+            return False
+
+        self.detector.reset(steam_path)
+        try:
+            self.detector.prime()
+        except OSError as exc:
+            self.watch_failed.emit(f"读取创意工坊目录失败：{exc}")
+            return False
+
+        self._watched_directories = directories
+        self._file_watcher.addPaths(list(directories))
+        self._poll_timer.start()
+        return True
+
+    def stop(self) -> None:
+        self._debounce_timer.stop()
+        self._poll_timer.stop()
+        self._pending_since = None
+        watched_paths = self._file_watcher.directories()
+        if watched_paths:
+            self._file_watcher.removePaths(watched_paths)
+        self._watched_directories = ()
+        self.detector.reset()
+
+    def rebaseline(self) -> None:
+        if not self.is_active:
+            return
+        self._debounce_timer.stop()
+        self._pending_since = None
+        try:
+            self.detector.prime()
+        except OSError as exc:
+            self.watch_failed.emit(f"读取创意工坊目录失败：{exc}")
+
+    def schedule_check(self) -> None:
+        if not self.is_active:
+            return
+        now = time.monotonic()
+        if self._pending_since is None:
+            self._pending_since = now
+        if not self._debounce_timer.isActive() or now - self._pending_since < WATCH_MAX_DELAY_SECONDS:
+            self._debounce_timer.start()
+
+    def check_now(self) -> None:
+        self._debounce_timer.stop()
+        self._pending_since = None
+        if not self.is_active:
+            return
+
+        active_paths = set(self._file_watcher.directories())
+        for directory in self._watched_directories:
+            if directory not in active_paths and os.path.isdir(directory):
+                self._file_watcher.addPath(directory)
+        try:
+            changes = self.detector.poll()
+        except OSError as exc:
+            self.watch_failed.emit(f"读取创意工坊目录失败：{exc}")
+            return
+        if not changes.is_empty:
+            self.changes_detected.emit(changes)
@@ -1,16 +1,30 @@
 import csv
+import io
 import json
 import os
+import pstats
 import subprocess
+import sys
 import tempfile
+import threading
+import time
 import unittest
+import urllib.error
+import urllib.request
 import weakref
 from unittest.mock import patch
 
 os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 
 import app_services
+from repkg_gui import instrumentation, profiling
+from benchmarks.__main__ import main as benchmarks_main
+from benchmarks.catalog_benchmark import run_catalog_benchmark
+from benchmarks.harness import compare_reports
+from benchmarks.extraction_benchmark import FAKE_REPKG_SCRIPT, FakeRepkgProfile, run_extraction_benchmark
+from benchmarks.workshop_fixture import SyntheticWorkshopSpec, generate_synthetic_workshop
 from PySide6.QtCore import QSize
+from PySide6.QtGui import QPixmap
 from PySide6.QtWidgets import QApplication
 from PIL import Image
 from app_services import (
@@ -31,6 +45,7 @@ from app_services import (
     get_item_directory,
     get_scene_pkg_path,
     load_config,
+    log_success,
     normalize_batch_extract_workers,
     parse_tags,
     read_info_csv,
@@ -39,9 +54,13 @@ from app_services import (
     sanitize_wallpaper_title,
     write_config_value,
 )
+from repkg_gui import cli as repkg_cli
 from repkg_gui.app_context import AppContext
+from repkg_gui.bootstrap import build_launch_parser
 from repkg_gui.app_metadata import REPKG_PROJECT_URL, REPKG_VERSION
 from repkg_gui.image_utils import load_static_qimage
+from repkg_gui.controllers.diagnostics_controller import DiagnosticsController, build_diagnostics_sections
+from repkg_gui.controllers.extraction_controller import ExtractionController
 from repkg_gui.controllers.library_controller import LibraryController
 from repkg_gui.controllers.settings_controller import (
     ABOUT_IMAGE_URL,
@@ -56,31 +75,61 @@ from repkg_gui.controllers.settings_controller import (
     get_output_mode_description,
     load_about_metadata,
 )
+from repkg_gui.domain.catalog_store import CatalogStore, CatalogVocabulary
 from repkg_gui.domain.entities import (
+    CatalogSnapshot,
+    ExtractionItemProgress,
     ExtractionItemResult,
+    ExtractionJob,
     ExtractionPlan,
+    ExtractionProgress,
     ExtractionRequest,
     ExtractionSummary,
+    ExtractionTaskInfo,
     FilterState,
     SessionSettings,
     SkippedItem,
     WallpaperRecord,
+    WorkshopChanges,
 )
-from repkg_gui.domain.enums import FilterField, OutputMode
+from repkg_gui.domain.enums import FilterField, JobState, OutputMode
+from repkg_gui.job_server import create_job_server
 from repkg_gui.models.catalog_filter_proxy import CatalogFilterProxyModel
 from repkg_gui.models.selection_model import (
     build_filter_status,
     build_loaded_status,
     build_selection_status,
+    distinct_field_values,
+    filter_records,
     format_visibility as format_visibility_for_display,
     metadata_lines,
 )
 from repkg_gui.models.catalog_table_model import CatalogTableModel
+from repkg_gui.models.thumbnail_cache import ThumbnailCache
 from repkg_gui.services.catalog_service import CatalogService
-from repkg_gui.services.extraction_service import ExtractionService, ExtractionValidationError
+from repkg_gui.services.catalog_snapshot_store import (
+    CatalogSnapshotError,
+    decode_catalog_snapshot,
+    encode_catalog_snapshot,
+    get_snapshot_path,
+    read_catalog_snapshot,
+    write_catalog_snapshot,
+)
+from repkg_gui.services.extraction_concurrency import AdaptiveConcurrencyLimiter, SharedWorkerBudget
+from repkg_gui.services.extraction_jobs import ExtractionJobQueue, ExtractionJobStore
+from repkg_gui.services.extraction_events import read_extraction_events, summarize_extraction_runs
+from repkg_gui.services.extraction_output import ExtractionOutputMonitor, parse_repkg_entry_line
+from repkg_gui.services.extraction_scheduler import ExtractionScheduler, estimate_makespan
+from repkg_gui.services.extraction_service import (
+    ExtractionCancelToken,
+    ExtractionService,
+    ExtractionValidationError,
+)
 from repkg_gui.services.runtime_compat import RuntimeCompatService
 from repkg_gui.services.steam_locator_service import SteamLocatorService
+from repkg_gui.services.workshop_watch import WorkshopChangeDetector
 from repkg_gui.state.session_state import SessionState
+from repkg_gui.ui.main_window import MainWindow
 from repkg_gui.ui.widgets.thumbnail_view import ThumbnailView
 from repkg_gui.workers.extraction_worker import ExtractionWorker
 
@@ -121,6 +170,8 @@ class AppServicesTests(unittest.TestCase):
         app_services.LEGACY_INFO_CSV_FILE = os.path.join(self.temp_legacy_dir, "info.csv")
 
     def tearDown(self):
+        app_services.flush_logs()
+        app_services.invalidate_config_cache()
         app_services.RUNTIME_DIR = self.original_runtime_dir
         app_services.CONFIG_FILE = self.original_config_file
         app_services.LOG_FILE = self.original_log_file
@@ -332,9 +383,72 @@ class AppServicesTests(unittest.TestCase):
                 "visibility": "private",
                 "file": "scene.json",
                 "id": "12345",
+                "library": "",
             },
         )
 
+    def test_parse_vdf_reads_library_folders_with_comments_and_escapes(self):
+        data = app_services.parse_vdf(
+            '''
+            "libraryfolders"
+            {
+                // primary library
+                "0" { "path" "C:\\\\Steam" "apps" { "431960" "1024" } }
+                "1" { "path" "D:\\\\Games \\"Lib\\"" [$WIN32] "apps" { } }
+            }
+            '''
+        )
+
+        self.assertEqual(data["libraryfolders"]["0"]["path"], "C:\\Steam")
+        self.assertEqual(data["libraryfolders"]["0"]["apps"], {"431960": "1024"})
+        self.assertEqual(data["libraryfolders"]["1"]["path"], 'D:\\Games "Lib"')
+        with self.assertRaises(ValueError):
+            app_services.parse_vdf('"libraryfolders" { "0" {')
+
+    def test_collect_workshop_info_merges_every_steam_library(self):
+        steam_path, primary_item_dir = self.create_workshop_item("111", project_data={"title": "Primary", "type": "scene"})
+        primary_root = os.path.dirname(steam_path)
+        second_root = os.path.join(self.temp_dir.name, "SteamLibrary")
+        second_item_dir = os.path.join(second_root, "steamapps", "workshop", "content", app_services.WORKSHOP_APP_ID, "222")
+        os.makedirs(second_item_dir)
+        with open(os.path.join(second_item_dir, "project.json"), "w", encoding="utf-8") as file:
+            json.dump({"title": "Secondary", "type": "scene"}, file)
+        with open(os.path.join(second_item_dir, "scene.pkg"), "wb") as file:
+            file.write(b"pkg")
+        unrelated_root = os.path.join(self.temp_dir.name, "NoWallpapers")
+        os.makedirs(unrelated_root)
+        with open(os.path.join(primary_root, app_services.LIBRARY_FOLDERS_VDF), "w", encoding="utf-8") as file:
+            file.write(
+                "\"libraryfolders\"\n{\n"
+                f"\t\"0\" {{ \"path\" \"{primary_root}\" \"apps\" {{ \"431960\" \"1\" }} }}\n"
+                f"\t\"1\" {{ \"path\" \"{second_root}\" \"apps\" {{ \"431960\" \"1\" }} }}\n"
+                f"\t\"2\" {{ \"path\" \"{unrelated_root}\" \"apps\" {{ \"570\" \"1\" }} }}\n"
+                "}\n"
+            )
+
+        self.assertEqual(app_services.get_steam_library_roots(steam_path), (primary_root, second_root))
+        records = collect_workshop_info(steam_path)
+
+        self.assertEqual([(record.id, record.library) for record in records], [("111", primary_root), ("222", second_root)])
+        self.assertEqual(app_services.get_scene_pkg_path(steam_path, "222"), os.path.join(second_item_dir, "scene.pkg"))
+        self.assertEqual(app_services.get_item_directory(steam_path, "111"), primary_item_dir)
+        self.assertEqual(set(app_services.scan_workshop_signatures(steam_path)), {"111", "222"})
+
+    def test_collect_workshop_info_interns_tags_and_types_in_shared_vocabulary(self):
+        steam_path, _ = self.create_workshop_item("301", project_data={"type": "scene", "tags": ["anime", "City"]})
+        self.create_workshop_item("302", project_data={"type": "Scene", "tags": ["Anime"]})
+        self.create_workshop_item("303", project_data={"type": "SCENE", "tags": ["city", "Rain"]})
+        vocabulary = CatalogVocabulary()
+
+        records = {record.id: record for record in collect_workshop_info(steam_path, vocabulary)}
+
+        self.assertIs(records["301"].tags[0], records["302"].tags[0])
+        self.assertIs(records["301"].tags[1], records["303"].tags[0])
+        self.assertIs(records["301"].type, records["303"].type)
+        self.assertEqual(vocabulary.options(FilterField.TAGS), ("Anime", "City", "Rain"))
+        self.assertEqual(vocabulary.options(FilterField.TYPE), ("Scene",))
+        self.assertEqual(vocabulary.options(FilterField.TITLE), ())
+
     def test_collect_workshop_info_prefers_project_json_and_keeps_needed_fields(self):
         steam_path, workshop_dir = self.create_workshop_item(
             "12345",
@@ -360,6 +474,53 @@ class AppServicesTests(unittest.TestCase):
         self.assertEqual(records[0].visibility, "private")
         self.assertEqual(records[0].preview, os.path.join(workshop_dir, "preview.jpg"))
 
+    def test_project_json_reader_keeps_needed_fields_with_each_json_backend(self):
+        self.addCleanup(app_services.set_json_backend, None)
+        steam_path, workshop_dir = self.create_workshop_item("777", project_data={})
+        project_path = os.path.join(workshop_dir, "project.json")
+        project_data = {
+            "title": "带 BOM 的壁纸",
+            "type": "scene",
+            "tags": ["anime"],
+            "file": "scene.json",
+            "general": {"properties": {"schemecolor": {"type": "color", "value": "0 0 0"}}},
+            "workshopid": "777",
+        }
+        with open(project_path, "w", encoding="utf-8-sig") as file:
+            json.dump(project_data, file, ensure_ascii=False)
+
+        for name in ("json", "orjson", "unknown"):
+            backend = app_services.set_json_backend(name)
+            self.assertIn(backend.name, app_services.JSON_BACKENDS)
+            self.assertEqual(
+                app_services.read_project_fields(project_path),
+                {"title": "带 BOM 的壁纸", "type": "scene", "tags": ["anime"], "file": "scene.json"},
+            )
+            records = collect_workshop_info(steam_path)
+            self.assertEqual((records[0].title, records[0].type, records[0].tags), ("带 BOM 的壁纸", "Scene", ["Anime"]))
+
+        self.assertEqual(app_services.set_json_backend("json").name, "json")
+        with open(project_path, "w", encoding="utf-8") as file:
+            file.write("[1, 2]")
+        with self.assertRaises(ValueError):
+            app_services.read_json_object(project_path)
+
+    def test_project_json_with_nan_property_scans_with_each_json_backend(self):
+        self.addCleanup(app_services.set_json_backend, None)
+        steam_path, workshop_dir = self.create_workshop_item("778", project_data={})
+        project_path = os.path.join(workshop_dir, "project.json")
+        with open(project_path, "w", encoding="utf-8-sig") as file:
+            file.write(
+                '{"title": "NaN 属性", "type": "video", "tags": ["Nature"], "file": "clip.mp4", '
+                '"general": {"properties": {"rate": {"type": "slider", "value": NaN, "max": Infinity}}}}'
+            )
+
+        for name in ("json", "orjson"):
+            app_services.set_json_backend(name)
+            self.assertEqual(app_services.read_project_fields(project_path)["title"], "NaN 属性")
+            records = collect_workshop_info(steam_path)
+            self.assertEqual((records[0].title, records[0].type, records[0].tags), ("NaN 属性", "Video", ["Nature"]))
+
     def test_collect_workshop_info_falls_back_to_other_json_when_project_json_missing(self):
         steam_path, workshop_dir = self.create_workshop_item(
             "54321",
@@ -457,6 +618,150 @@ class AppServicesTests(unittest.TestCase):
         self.assertEqual(resolve_batch_extract_workers(0), get_auto_batch_extract_workers())
         self.assertEqual(resolve_batch_extract_workers(5), 5)
 
+    def test_resolve_extract_timeout_scales_with_package_size(self):
+        self.assertIsNone(app_services.resolve_extract_timeout(1024**3, 0, 600))
+        self.assertEqual(app_services.resolve_extract_timeout(0, 120, 600), 120.0)
+        self.assertEqual(app_services.resolve_extract_timeout(2 * 1024**3, 120, 600), 1320.0)
+
+    def test_load_config_restores_default_for_invalid_extract_timeout(self):
+        with open(app_services.CONFIG_FILE, "w", encoding="utf-8") as file:
+            json.dump({"extract_timeout_seconds": -5, "extract_timeout_seconds_per_gb": "90"}, file)
+
+        config = load_config()
+
+        self.assertEqual(config.extract_timeout_seconds, app_services.DEFAULT_EXTRACT_TIMEOUT_SECONDS)
+        self.assertEqual(config.extract_timeout_seconds_per_gb, 90)
+
+    def test_load_config_normalizes_adaptive_worker_flag(self):
+        with open(app_services.CONFIG_FILE, "w", encoding="utf-8") as file:
+            json.dump({"adaptive_batch_extract_workers": "yes"}, file)
+        self.assertTrue(load_config().adaptive_batch_extract_workers)
+
+        with open(app_services.CONFIG_FILE, "w", encoding="utf-8") as file:
+            json.dump({"adaptive_batch_extract_workers": "sometimes"}, file)
+        self.assertFalse(load_config().adaptive_batch_extract_workers)
+
+    def test_load_config_serves_cached_copies_until_file_changes(self):
+        first = load_config()
+        with patch.object(app_services, "_load_config_from_disk", wraps=app_services._load_config_from_disk) as disk_mock:
+            second = load_config()
+            second.output_path = "mutated"
+            third = load_config()
+            disk_mock.assert_not_called()
+
+            with open(app_services.CONFIG_FILE, "w", encoding="utf-8") as file:
+                json.dump({"output_path": "./changed-externally"}, file)
+            changed = load_config()
+            disk_mock.assert_called_once()
+
+        self.assertIsNot(first, third)
+        self.assertEqual(third.output_path, first.output_path)
+        self.assertEqual(changed.output_path, os.path.normpath("./changed-externally"))
+
+    def test_write_config_value_refreshes_cache_and_invalidate_forces_reload(self):
+        load_config()
+        write_config_value("batch_extract_workers", 5)
+
+        with patch.object(app_services, "_load_config_from_disk", wraps=app_services._load_config_from_disk) as disk_mock:
+            self.assertEqual(load_config().batch_extract_workers, 5)
+            disk_mock.assert_not_called()
+            app_services.invalidate_config_cache()
+            self.assertEqual(load_config().batch_extract_workers, 5)
+            disk_mock.assert_called_once()
+
+    def test_write_json_file_replaces_atomically_and_cleans_up_on_failure(self):
+        target = os.path.join(self.temp_runtime_dir, "atomic.json")
+        app_services._write_json_file(target, {"value": 1})
+
+        with self.assertRaises(TypeError):
+            app_services._write_json_file(target, {"value": object()})
+
+        with open(target, "r", encoding="utf-8") as file:
+            self.assertEqual(json.load(file), {"value": 1})
+        self.assertEqual([name for name in os.listdir(self.temp_runtime_dir) if name.endswith(".tmp")], [])
+
+    def test_app_context_coalesces_config_writes_into_single_flush(self):
+        QApplication.instance() or QApplication([])
+        context = AppContext.from_config(load_config())
+        config_changed_events = []
+        context.config_changed.connect(lambda: config_changed_events.append(True))
+
+        with patch.object(app_services, "_write_json_file", wraps=app_services._write_json_file) as write_mock:
+            for color in ("#101010", "#202020", "#303030"):
+                context.set_theme_color("theme_accent", color)
+            context.set_batch_extract_workers(6)
+
+            self.assertEqual(context.state.config.theme_accent, "#303030")
+            self.assertEqual(context.state.batch_extract_workers, 6)
+            self.assertTrue(context.has_pending_config_writes)
+            write_mock.assert_not_called()
+            self.assertEqual(config_changed_events, [])
+
+            context.flush_config_writes()
+
+            self.assertEqual(write_mock.call_count, 1)
+        self.assertEqual(config_changed_events, [True])
+        self.assertFalse(context.has_pending_config_writes)
+        reloaded = load_config()
+        self.assertEqual(reloaded.theme_preset, app_services.CUSTOM_THEME_PRESET)
+        self.assertEqual(reloaded.theme_accent, "#303030")
+        self.assertEqual(reloaded.batch_extract_workers, 6)
+
+    def test_log_writer_batches_messages_from_threads_off_caller_thread(self):
+        threads = [
+            threading.Thread(target=lambda index=index: [log_success(f"msg-{index}-{n}") for n in range(50)])
+            for index in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        app_services.log_error("boom")
+
+        self.assertTrue(app_services.flush_logs())
+        with open(app_services.LOG_FILE, "r", encoding="utf-8") as file:
+            lines = file.read().splitlines()
+        with open(app_services.ERROR_LOG_FILE, "r", encoding="utf-8") as file:
+            error_lines = file.read().splitlines()
+
+        self.assertEqual(len(lines), 200)
+        self.assertTrue(all("SUCCESS: msg-" in line for line in lines))
+        self.assertTrue(error_lines[-1].endswith(" - boom"))
+
+    def test_log_writer_rotates_files_by_size(self):
+        with patch.object(app_services, "LOG_MAX_BYTES", 200), patch.object(app_services, "LOG_BACKUP_COUNT", 2):
+            for index in range(20):
+                log_success(f"rotation-{index:02d}-" + "x" * 40)
+                app_services.flush_logs()
+
+        self.assertTrue(os.path.exists(f"{app_services.LOG_FILE}.1"))
+        self.assertTrue(os.path.exists(f"{app_services.LOG_FILE}.2"))
+        self.assertFalse(os.path.exists(f"{app_services.LOG_FILE}.3"))
+        with open(app_services.LOG_FILE, "r", encoding="utf-8") as file:
+            self.assertIn("rotation-19-", file.read())
+        self.assertLessEqual(os.path.getsize(app_services.LOG_FILE), 200)
+
+    def test_log_write_failures_go_to_error_log_then_rate_limited_stderr(self):
+        blocker = os.path.join(self.temp_runtime_dir, "not-a-directory")
+        with open(blocker, "w", encoding="utf-8") as file:
+            file.write("x")
+        app_services.LOG_FILE = os.path.join(blocker, "logs.txt")
+        app_services.log_success("无法写入")
+        self.assertTrue(app_services.flush_logs())
+        self.assertTrue(app_services.flush_logs())
+        with open(app_services.ERROR_LOG_FILE, "r", encoding="utf-8") as file:
+            self.assertIn(f"写入日志 {app_services.LOG_FILE} 失败，已丢弃 1 行", file.read())
+
+        app_services.ERROR_LOG_FILE = os.path.join(blocker, "errors.txt")
+        stderr = io.StringIO()
+        with patch.object(app_services._LOG_WRITER, "_last_failure_report", float("-inf")), patch.object(
+            app_services.sys, "stderr", stderr
+        ):
+            for _ in range(3):
+                app_services.log_error("无法写入")
+                self.assertTrue(app_services.flush_logs())
+        self.assertEqual(stderr.getvalue().count("写入日志"), 1)
+
     def test_build_loaded_status_supports_refresh_message(self):
         self.assertEqual(build_loaded_status(12), "已加载 12 项壁纸数据。")
         self.assertEqual(build_loaded_status(12, refreshed=True), "刷新完成，已加载 12 项壁纸数据。")
@@ -634,6 +939,114 @@ class ServiceLayerTests(AppServicesTests):
         self.assertEqual(snapshot.records[0].tags, ("Anime", "Scenery"))
         self.assertEqual(snapshot.records[0].preview_path, os.path.join(workshop_dir, "preview.jpg"))
 
+    def test_catalog_service_scan_writes_checksummed_snapshot_loaded_without_csv(self):
+        steam_path, _ = self.create_workshop_item(
+            "12345",
+            project_data={"title": "Snapshot", "type": "scene", "tags": ["anime"], "preview": "preview.jpg"},
+        )
+        with patch.object(app_services, "read_info_csv", side_effect=AssertionError("csv read")):
+            scanned = self.catalog_service.scan_catalog(steam_path)
+        snapshot_path = get_snapshot_path(app_services.INFO_CSV_FILE)
+        self.assertEqual(
+            [record.title for record in self.catalog_service.load_snapshot_from_csv(app_services.INFO_CSV_FILE).records],
+            ["Snapshot"],
+        )
+
+        with open(app_services.INFO_CSV_FILE, "a", encoding="utf-8") as file:
+            file.write("\n")
+        with patch.object(app_services, "read_info_csv", side_effect=AssertionError("csv read")):
+            cached = self.catalog_service.load_cached_snapshot(app_services.INFO_CSV_FILE, steam_path=steam_path)
+
+        self.assertTrue(os.path.exists(snapshot_path))
+        self.assertEqual(cached.records, scanned.records)
+        self.assertEqual(cached.csv_path, app_services.INFO_CSV_FILE)
+        self.assertEqual(cached.scanned_at, scanned.scanned_at)
+
+        with open(snapshot_path, "rb") as file:
+            data = bytearray(file.read())
+        data[-1] ^= 0xFF
+        with self.assertRaises(CatalogSnapshotError):
+            decode_catalog_snapshot(bytes(data))
+        with open(snapshot_path, "wb") as file:
+            file.write(bytes(data))
+        recovered = self.catalog_service.load_cached_snapshot(app_services.INFO_CSV_FILE, steam_path=steam_path)
+        self.assertEqual(recovered.records, scanned.records)
+        self.assertEqual(read_catalog_snapshot(snapshot_path).records, scanned.records)
+
+    def test_catalog_snapshot_rejects_other_versions_and_steam_paths(self):
+        csv_path = os.path.join(self.temp_runtime_dir, "info.csv")
+        with open(csv_path, "w", encoding="utf-8") as file:
+            file.write("id\n")
+        steam_path = os.path.join(self.temp_dir.name, "Steam")
+        snapshot = CatalogSnapshot(
+            steam_path=steam_path,
+            csv_path=csv_path,
+            records=(WallpaperRecord(id="1", tags=("A",)),),
+        )
+        data = encode_catalog_snapshot(snapshot)
+        with self.assertRaises(CatalogSnapshotError):
+            decode_catalog_snapshot(data[:8] + b"\x63\x00" + data[10:])
+        with self.assertRaises(CatalogSnapshotError):
+            decode_catalog_snapshot(b"not a snapshot")
+
+        with patch("app_services.os.fsync", wraps=os.fsync) as fsync:
+            snapshot_path = write_catalog_snapshot(snapshot)
+        fsync.assert_called_once()
+        self.assertEqual(sorted(os.listdir(os.path.dirname(snapshot_path))), ["catalog.bin", "info.csv"])
+        self.assertEqual(read_catalog_snapshot(snapshot_path).records, snapshot.records)
+        self.assertEqual(read_catalog_snapshot(snapshot_path, steam_path + os.sep).records, snapshot.records)
+        with self.assertRaises(CatalogSnapshotError):
+            read_catalog_snapshot(snapshot_path, os.path.join(self.temp_dir.name, "OtherSteam"))
+
+    def test_catalog_store_row_views_match_records_and_share_tag_instances(self):
+        records = tuple(
+            WallpaperRecord(
+                id=str(1000 + index),
+                title=f"壁纸 {index}",
+                tags=("".join(("Ani", "me")), f"Tag{index % 3}"),
+                type="scene" if index % 2 else "video",
+                visibility="public",
+                file="scene.json",
+                preview_path=f"C:\\Workshop\\{1000 + index}\\preview.jpg",
+                library="C:\\Steam",
+            )
+            for index in range(6)
+        )
+
+        store = CatalogStore.from_records(records)
+        restored = CatalogStore.from_state(store.to_state())
+
+        self.assertEqual(len(store), 6)
+        self.assertEqual(store, records)
+        self.assertEqual(restored, store)
+        self.assertEqual(store[-1].to_record(), records[-1])
+        self.assertEqual(store[1:3], records[1:3])
+        self.assertEqual(store.tags.values, ["Anime", "Tag0", "Tag1", "Tag2"])
+        self.assertEqual(store.types.values, ["video", "scene"])
+        self.assertIs(store[0].tags[0], store[5].tags[0])
+        self.assertEqual(distinct_field_values(store, FilterField.TAGS), ("Anime", "Tag0", "Tag1", "Tag2"))
+        self.assertEqual(distinct_field_values(store, FilterField.TYPE), ("scene", "video"))
+        self.assertEqual(CatalogService().records_from_dataframe(app_services.pd.DataFrame([])), ())
+        with self.assertRaises(IndexError):
+            store[6]
+        with self.assertRaises(ValueError):
+            CatalogStore.from_state((*store.to_state()[:4], b"\x09\x00\x00\x00", *store.to_state()[5:]))
+
+    def test_catalog_store_keeps_astral_titles_compact_and_caches_row_tags(self):
+        records = [WallpaperRecord(id=str(index), title=f"Wallpaper {index}", tags=("Anime",)) for index in range(200)]
+        records.append(WallpaperRecord(id="200", title="Night \U0001f319 \ud800", tags=("Anime", "Moon")))
+        store = CatalogStore.from_records(records)
+        restored = CatalogStore.from_state(store.to_state())
+        ascii_bytes = sum(len(record.title) for record in records[:-1])
+
+        self.assertEqual(store[200].title, "Night \U0001f319 \ud800")
+        self.assertEqual(restored, store)
+        self.assertLess(store._titles.nbytes, sys.getsizeof(b"") + ascii_bytes + 20 + sys.getsizeof(store._titles._offsets))
+        self.assertIs(store.tags_at(200), store.tags_at(200))
+        self.assertEqual(store[200].tags, ("Anime", "Moon"))
+        with self.assertRaises(ValueError):
+            CatalogStore.from_state(((store.to_state()[0][0].decode(), store.to_state()[0][1]), *store.to_state()[1:]))
+
     def test_steam_locator_service_finds_common_install_path_without_drive_scan(self):
         common_install_dir = os.path.join(self.temp_dir.name, "SteamCommon")
         os.makedirs(common_install_dir, exist_ok=True)
@@ -645,6 +1058,277 @@ class ServiceLayerTests(AppServicesTests):
 
         self.assertEqual(service.find_steam_path(include_all_drives=False), expected_path)
 
+    def test_steam_locator_service_checks_cached_locations_before_probing(self):
+        cached_dir = os.path.join(self.temp_dir.name, "SteamCached")
+        os.makedirs(cached_dir, exist_ok=True)
+        cached_path = os.path.join(cached_dir, "steam.exe")
+        with open(cached_path, "w", encoding="utf-8") as file:
+            file.write("")
+        missing_path = os.path.join(self.temp_dir.name, "Gone", "steam.exe")
+        service = SteamLocatorService(common_paths=())
+        service.remember_location(cached_path)
+        service.remember_location(missing_path)
+
+        with (
+            patch.object(SteamLocatorService, "find_in_common_locations", side_effect=AssertionError("common probe")),
+            patch.object(SteamLocatorService, "get_available_drives", side_effect=AssertionError("drive probe")),
+        ):
+            self.assertEqual(service.find_steam_path(), cached_path)
+
+        locations = service.load_cached_locations()
+        self.assertEqual(locations[0]["path"], cached_path)
+        self.assertGreater(locations[0]["validated_at"], 0)
+        self.assertEqual(os.path.dirname(service.resolve_cache_path()), self.temp_runtime_dir)
+
+    def test_steam_locator_service_bounds_cached_location_checks_on_offline_drives(self):
+        release_hung_check = threading.Event()
+        offline_path = r"Z:\Steam\steam.exe"
+        older_path = r"D:\Steam\steam.exe"
+        oldest_path = r"C:\Steam\steam.exe"
+        service = SteamLocatorService(common_paths=(), probe_timeout_seconds=0.2)
+        for path in (oldest_path, older_path, offline_path):
+            service.remember_location(path)
+
+        def fake_is_valid_steam_path(path):
+            if path == offline_path:
+                release_hung_check.wait(5)
+            return path in (older_path, oldest_path)
+
+        started_at = time.monotonic()
+        with patch.object(SteamLocatorService, "is_valid_steam_path", side_effect=fake_is_valid_steam_path):
+            self.assertEqual(service.find_in_cached_locations(), older_path)
+        release_hung_check.set()
+
+        self.assertLess(time.monotonic() - started_at, 2)
+
+    def test_steam_locator_service_drive_probes_time_out_and_stop_after_first_hit(self):
+        release_hung_probe = threading.Event()
+        probed_drives = []
+
+        def fake_find_on_drive(drive, stop_event=None):
+            probed_drives.append(drive)
+            if drive == "N:\\":
+                release_hung_probe.wait(5)
+                return None
+            if drive == "D:\\":
+                return r"D:\Steam\steam.exe"
+            return None
+
+        service = SteamLocatorService(common_paths=(), probe_timeout_seconds=0.2)
+        started_at = time.monotonic()
+        with patch.object(SteamLocatorService, "find_on_drive", side_effect=fake_find_on_drive):
+            self.assertIsNone(service.find_on_drives(["N:\\", "C:\\"], max_workers=2))
+            self.assertLess(time.monotonic() - started_at, 2)
+            self.assertEqual(service.find_on_drives(["C:\\", "D:\\", "E:\\", "F:\\"], max_workers=1), r"D:\Steam\steam.exe")
+        release_hung_probe.set()
+
+        self.assertNotIn("E:\\", probed_drives)
+
+    def test_synthetic_workshop_generator_honours_spec(self):
+        spec = SyntheticWorkshopSpec(
+            item_count=30,
+            tag_count=5,
+            preview_formats=("png", "gif"),
+            preview_size=(8, 8),
+            broken_json_rate=0.2,
+            scene_rate=0.5,
+            pkg_bytes=16,
+            seed=3,
+            properties_per_item=4,
+        )
+
+        workshop = generate_synthetic_workshop(self.temp_dir.name, spec)
+        records = collect_workshop_info(workshop.steam_path)
+        intact_id = next(item_id for item_id in workshop.item_ids if item_id not in workshop.broken_ids)
+        with open(os.path.join(workshop.workshop_directory, intact_id, "project.json"), encoding="utf-8") as file:
+            self.assertEqual(len(json.load(file)["general"]["properties"]), 4)
+
+        self.assertEqual(len(records), 30)
+        self.assertTrue(workshop.broken_ids)
+        self.assertEqual({record.id for record in records if not record.title}, set(workshop.broken_ids))
+        self.assertEqual({os.path.splitext(record.preview)[1] for record in records}, {".png", ".gif"})
+        self.assertLessEqual({tag for record in records for tag in record.tags}, {f"Tag{index:03d}" for index in range(5)})
+        for item_id in workshop.scene_ids:
+            self.assertEqual(os.path.getsize(app_services.get_scene_pkg_path(workshop.steam_path, item_id)), 16)
+
+    def test_catalog_benchmark_reports_json_timings_without_touching_runtime(self):
+        report = run_catalog_benchmark(
+            SyntheticWorkshopSpec(item_count=25, preview_size=(4, 4)),
+            repeat=1,
+            work_dir=self.temp_dir.name,
+        )
+
+        self.assertEqual(report["items"], 25)
+        self.assertEqual(
+            set(report["results"]),
+            {
+                "collect_workshop_info",
+                "write_info_csv",
+                "read_info_csv",
+                "records_from_dataframe",
+                "write_catalog_snapshot",
+                "read_catalog_snapshot",
+                "filter_proxy",
+            },
+        )
+        self.assertGreater(report["snapshot_bytes"], 0)
+        self.assertGreater(report["catalog_store_bytes"], 0)
+        self.assertEqual(report["results"]["read_info_csv"]["runs"], 1)
+        self.assertIn("median_seconds", report["results"]["filter_proxy"]["filter"])
+        self.assertFalse(os.path.exists(app_services.INFO_CSV_FILE))
+
+        stream = io.StringIO()
+        self.assertEqual(
+            benchmarks_main(["catalog", "--items", "5", "--repeat", "1", "--preview-formats", "", "--skip-proxy"], stream=stream),
+            0,
+        )
+        self.assertEqual(json.loads(stream.getvalue())["benchmark"], "catalog")
+
+    def test_repkg_executable_override_runs_python_stand_in(self):
+        with patch.dict(os.environ, {app_services.REPKG_EXECUTABLE_ENV: FAKE_REPKG_SCRIPT}):
+            command = app_services.build_extract_command(self.options, 12345, "Sample")
+            self.assertEqual(RuntimeCompatService().repkg_executable, FAKE_REPKG_SCRIPT)
+
+        self.assertEqual(command[:3], [sys.executable, FAKE_REPKG_SCRIPT, "extract"])
+        self.assertEqual(app_services.build_extract_command(self.options, 12345, "Sample")[0], REPKG_EXECUTABLE)
+
+    def test_extraction_benchmark_reports_throughput_per_worker_count(self):
+        report = run_extraction_benchmark(
+            worker_counts=(1, 2),
+            batch_sizes=(4,),
+            profile=FakeRepkgProfile(latency_seconds=0.01, files=2, file_bytes=8, failure_rate=0.5, seed=1),
+            pkg_bytes=64,
+            work_dir=self.temp_dir.name,
+        )
+
+        self.assertEqual([(case["batch_size"], case["workers"]) for case in report["cases"]], [(4, 1), (4, 2)])
+        for case in report["cases"]:
+            self.assertEqual(case["succeeded"] + case["failed"], 4)
+            self.assertGreater(case["failed"], 0)
+            self.assertGreater(case["items_per_second"], 0)
+            self.assertGreaterEqual(case["progress_events"], 4)
+            self.assertIn("mean_queue_wait_seconds", case)
+        self.assertEqual(report["cases"][1]["effective_workers"], 2)
+        self.assertNotIn(app_services.REPKG_EXECUTABLE_ENV, os.environ)
+
+    def test_instrumentation_records_hot_path_spans_only_when_enabled(self):
+        steam_path, _ = self.create_workshop_item("12345", project_data={"title": "Timed", "type": "scene"})
+        recorder = instrumentation.get_instrumentation()
+        self.addCleanup(recorder.reset)
+        self.addCleanup(recorder.disable)
+
+        collect_workshop_info(steam_path)
+        self.assertEqual(recorder.snapshot()["spans"], {})
+
+        output_path = os.path.join(self.temp_dir.name, "instrumentation.json")
+        recorder.enable(output_path, dump_on_exit=False)
+        csv_path = self.catalog_service.runtime.extract_info_to_csv(steam_path=steam_path)
+        self.catalog_service.load_snapshot_from_csv(csv_path, steam_path=steam_path)
+        with instrumentation.span("custom.block"):
+            instrumentation.count("custom.counter", 3)
+
+        stream = io.StringIO()
+        self.assertEqual(recorder.dump(stream), output_path)
+        with open(output_path, "r", encoding="utf-8") as file:
+            dumped = json.load(file)
+
+        self.assertEqual(dumped["spans"]["catalog.collect_workshop_info"]["count"], 1)
+        self.assertEqual(dumped["spans"]["catalog.read_info_csv"]["count"], 1)
+        self.assertEqual(dumped["spans"]["custom.block"]["count"], 1)
+        self.assertEqual(dumped["counters"], {"catalog.items_scanned": 1, "custom.counter": 3})
+        self.assertIn("catalog.read_info_csv", stream.getvalue())
+        self.assertFalse(instrumentation.configure_from_environment({instrumentation.INSTRUMENTATION_ENV: "0"}))
+
+    def test_app_services_imports_without_loading_repkg_gui(self):
+        script = "import sys, app_services; print(sorted(name for name in sys.modules if name.startswith('repkg_gui')))"
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), "[]")
+
+    def test_profile_session_writes_pstats_and_collapsed_stacks_for_worker_threads(self):
+        stop_event = threading.Event()
+
+        def busy_worker():
+            while not stop_event.is_set():
+                sum(range(200))
+
+        worker = threading.Thread(target=busy_worker, name="repkg-extract_0", daemon=True)
+        worker.start()
+        self.addCleanup(worker.join)
+        self.addCleanup(stop_event.set)
+        session = profiling.ProfileSession(5, sample_interval_seconds=0.001).start()
+        with self.assertRaises(RuntimeError):
+            profiling.ProfileSession(5).start()
+        deadline = time.monotonic() + 2
+        while session._sampler.sample_count < 5 and time.monotonic() < deadline:
+            sorted(range(1000), key=lambda value: -value)
+        result = session.stop()
+
+        self.assertIs(session.stop(), result)
+        self.assertIsNone(profiling.get_active_session())
+        self.assertEqual(os.path.dirname(result.pstats_path), os.path.join(app_services.RUNTIME_DIR, "profiles"))
+        self.assertGreaterEqual(result.sample_count, 5)
+        with open(result.collapsed_path, "r", encoding="utf-8") as file:
+            collapsed = file.read().splitlines()
+        self.assertTrue(any(line.startswith("repkg-extract_0;") and "busy_worker" in line for line in collapsed))
+        self.assertTrue(all(line.rsplit(" ", 1)[1].isdigit() for line in collapsed))
+        stats = pstats.Stats(result.pstats_path)
+        self.assertTrue(any(function_name == "<lambda>" for _path, _line, function_name in stats.stats))
+        with self.assertRaises(ValueError):
+            profiling.ProfileSession(0)
+
+    def test_profile_flags_for_cli_and_gui_launch(self):
+        stream = io.StringIO()
+        exit_code = repkg_cli.main(["--profile", "5", "--profile-mode", "sample", "list"], stream=stream)
+
+        events = [json.loads(line) for line in stream.getvalue().splitlines()]
+        self.assertEqual(exit_code, repkg_cli.EXIT_USAGE_ERROR)
+        self.assertEqual(events[-1]["event"], "profile")
+        self.assertEqual(events[-1]["pstats"], "")
+        self.assertTrue(os.path.exists(events[-1]["collapsed"]))
+
+        launch_args, qt_arguments = build_launch_parser().parse_known_args(["--profile", "-platform", "offscreen"])
+        self.assertEqual(launch_args.profile, profiling.DEFAULT_PROFILE_SECONDS)
+        self.assertEqual(qt_arguments, ["-platform", "offscreen"])
+        parser = repkg_cli.build_parser()
+        for arguments, expected in (
+            (["--profile", "list"], profiling.DEFAULT_PROFILE_SECONDS),
+            (["--profile", "--profile-mode", "sample", "list"], profiling.DEFAULT_PROFILE_SECONDS),
+            (["--profile", "5", "list"], 5.0),
+        ):
+            args = parser.parse_args(repkg_cli._with_default_profile_seconds(arguments))
+            self.assertEqual((args.profile, args.command), (expected, "list"))
+
+    def test_profile_session_stopped_from_timer_thread_bounds_cprofile_window(self):
+        def inside_window():
+            return sum(range(50))
+
+        def after_window():
+            return sum(range(50))
+
+        session = profiling.ProfileSession(5, mode="cprofile").start()
+        timer = threading.Timer(0.05, session.stop)
+        timer.start()
+        while timer.is_alive():
+            inside_window()
+        for _ in range(10):
+            after_window()
+        result = session.stop()
+        self.assertIs(session.stop(), result)
+
+        self.assertIsNone(sys.getprofile())
+        self.assertLessEqual(result.duration_seconds, 1)
+        function_names = {function_name for _path, _line, function_name in pstats.Stats(result.pstats_path).stats}
+        self.assertIn("inside_window", function_names)
+        self.assertNotIn("after_window", function_names)
+
     def test_extraction_service_prepare_requests_tracks_valid_missing_and_unknown_items(self):
         steam_path, valid_dir = self.create_workshop_item(
             "12345",
@@ -710,7 +1394,7 @@ class ServiceLayerTests(AppServicesTests):
             RuntimeCompatService,
             "run_extract_command",
             autospec=True,
-            side_effect=lambda _self, command: fake_run(command),
+            side_effect=lambda _self, command, **_kwargs: fake_run(command),
         ):
             summary = self.extraction_service.execute_requests(plan, settings)
 
@@ -742,6 +1426,690 @@ class ServiceLayerTests(AppServicesTests):
         self.assertEqual(status_message, "提取完成：成功 1 项，缺少资源 1 项，失败 2 项")
         self.assertTrue(has_warning)
 
+    def test_extraction_service_execute_requests_skips_queued_items_after_cancel(self):
+        steam_path, first_dir = self.create_workshop_item("12345", project_data={"title": "First"})
+        _, second_dir = self.create_workshop_item("54321", project_data={"title": "Second"})
+        for item_dir in (first_dir, second_dir):
+            with open(os.path.join(item_dir, "scene.pkg"), "wb") as file:
+                file.write(b"pkg")
+
+        plan = self.extraction_service.prepare_requests(
+            (WallpaperRecord(id="12345", title="First"), WallpaperRecord(id="54321", title="Second")),
+            ["12345", "54321"],
+            steam_path,
+        )
+        settings = SessionSettings(steam_path=steam_path, output_path=os.path.join(self.temp_dir.name, "exports"))
+        cancel_token = ExtractionCancelToken()
+        cancel_token.cancel()
+
+        with patch.object(RuntimeCompatService, "run_extract_command", autospec=True) as run_mock:
+            summary = self.extraction_service.execute_requests(plan, settings, cancel_token=cancel_token)
+
+        run_mock.assert_not_called()
+        self.assertEqual(summary.cancelled_ids, ("12345", "54321"))
+        self.assertFalse(summary.failed)
+        self.assertIn("提取已取消", summary.to_display_messages()[1])
+
+    def test_run_extract_command_terminates_process_when_cancelled(self):
+        cancel_event = threading.Event()
+        timer = threading.Timer(0.3, cancel_event.set)
+        timer.start()
+        self.addCleanup(timer.cancel)
+        started_at = time.monotonic()
+
+        result = app_services.run_extract_command(
+            [sys.executable, "-c", "import time; time.sleep(30)"],
+            cancel_event=cancel_event,
+            grace_period=1.0,
+        )
+
+        self.assertLess(time.monotonic() - started_at, 10)
+        self.assertNotEqual(result.returncode, 0)
+
+    def test_run_extract_command_kills_hung_process_tree_on_timeout(self):
+        script = (
+            "import subprocess, sys, time; "
+            "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)']); "
+            "time.sleep(30)"
+        )
+        started_at = time.monotonic()
+
+        with self.assertRaises(subprocess.TimeoutExpired):
+            app_services.run_extract_command([sys.executable, "-c", script], timeout=0.5)
+
+        self.assertLess(time.monotonic() - started_at, 10)
+
+    def test_extraction_service_records_timeout_as_distinct_failure(self):
+        steam_path, item_dir = self.create_workshop_item("12345", project_data={"title": "Hung"})
+        with open(os.path.join(item_dir, "scene.pkg"), "wb") as file:
+            file.write(b"pkg")
+        plan = self.extraction_service.prepare_requests(
+            (WallpaperRecord(id="12345", title="Hung"),),
+            ["12345"],
+            steam_path,
+        )
+        settings = SessionSettings(
+            steam_path=steam_path,
+            output_path=os.path.join(self.temp_dir.name, "exports"),
+            extract_timeout_seconds=5,
+        )
+
+        def hung_run(_self, command, **kwargs):
+            raise subprocess.TimeoutExpired(command, kwargs["timeout"])
+
+        with patch.object(RuntimeCompatService, "run_extract_command", autospec=True, side_effect=hung_run):
+            summary = self.extraction_service.execute_requests(plan, settings)
+
+        self.assertEqual(plan.requests[0].pkg_bytes, 3)
+        self.assertEqual(summary.timed_out_ids, ("12345",))
+        self.assertTrue(summary.failed[0].timed_out)
+        self.assertIn("超时 1 项", summary.to_display_messages()[1])
+
+    def test_extraction_service_submits_largest_packages_first_and_keeps_plan_order(self):
+        steam_path = None
+        records = []
+        for item_id, size in (("1001", 10), ("1002", 300), ("1003", 40)):
+            steam_path, item_dir = self.create_workshop_item(item_id, project_data={"title": item_id})
+            with open(os.path.join(item_dir, "scene.pkg"), "wb") as file:
+                file.write(b"p" * size)
+            records.append(WallpaperRecord(id=item_id, title=item_id))
+        plan = self.extraction_service.prepare_requests(records, ["1001", "1002", "1003"], steam_path)
+        settings = SessionSettings(
+            steam_path=steam_path,
+            output_path=os.path.join(self.temp_dir.name, "exports"),
+            batch_extract_workers=1,
+        )
+        executed_ids = []
+
+        def fake_run(_self, command, **_kwargs):
+            pkg_path = command[command.index("extract") + 1]
+            executed_ids.append(os.path.basename(os.path.dirname(pkg_path)))
+            return subprocess.CompletedProcess(command, 0, stdout="", stderr="")
+
+        with patch.object(RuntimeCompatService, "run_extract_command", autospec=True, side_effect=fake_run):
+            summary = self.extraction_service.execute_requests(plan, settings)
+
+        self.assertEqual(executed_ids, ["1002", "1003", "1001"])
+        self.assertEqual(summary.success_ids, ("1001", "1002", "1003"))
+        self.assertTrue(all(result.duration_seconds >= 0 for result in summary.succeeded))
+
+    def test_extraction_scheduler_estimates_lpt_makespan_and_blends_history(self):
+        self.assertEqual(estimate_makespan([5, 4, 3, 3, 3], 2), 10)
+        self.assertEqual(estimate_makespan([2, 2], 2, busy_until=[3]), 4)
+        self.assertEqual(estimate_makespan([], 4), 0.0)
+
+        scheduler = ExtractionScheduler()
+        request = ExtractionRequest(
+            item_id="1001",
+            title="Big",
+            scene_pkg_path="scene.pkg",
+            item_directory="1001",
+            pkg_bytes=64 * 1024 * 1024,
+        )
+        tracker = scheduler.create_tracker(ExtractionPlan(requests=(request,)), workers=1)
+        self.assertAlmostEqual(tracker.remaining_seconds(), 2.5)
+
+        tracker.mark_started(request)
+        tracker.mark_finished(request, 4.5)
+        scheduler.record_run(tracker)
+
+        history = scheduler.load_history()
+        self.assertEqual(history.sample_count, 1)
+        self.assertAlmostEqual(history.bytes_per_second, 16 * 1024 * 1024, places=0)
+        self.assertEqual(tracker.remaining_seconds(), 0.0)
+
+    def test_adaptive_concurrency_limiter_climbs_until_throughput_drops(self):
+        clock = [0.0]
+        with patch("repkg_gui.services.extraction_concurrency.time.monotonic", side_effect=lambda: clock[0]):
+            limiter = AdaptiveConcurrencyLimiter(4, initial_workers=2, min_window_seconds=0)
+
+            def complete_window(count, finished_at):
+                for _ in range(count):
+                    self.assertTrue(limiter.acquire())
+                clock[0] = finished_at
+                for _ in range(count):
+                    limiter.release(100)
+
+            complete_window(2, 1.0)
+            self.assertEqual(limiter.limit, 3)
+            complete_window(3, 2.0)
+            self.assertEqual(limiter.limit, 4)
+            complete_window(4, 4.0)
+
+        self.assertEqual(limiter.limit, 3)
+        self.assertEqual(limiter.peak, 4)
+        self.assertEqual([level for level, _rate in limiter.history], [2, 3, 4])
+
+    def test_adaptive_concurrency_limiter_holds_its_level_under_constant_throughput(self):
+        clock = [0.0]
+        with patch("repkg_gui.services.extraction_concurrency.time.monotonic", side_effect=lambda: clock[0]):
+            limiter = AdaptiveConcurrencyLimiter(4, initial_workers=2, min_window_seconds=0)
+            levels = []
+            for _ in range(20):
+                count = limiter.limit
+                for _ in range(count):
+                    self.assertTrue(limiter.acquire())
+                clock[0] += 1.0
+                for _ in range(count):
+                    limiter.release(1200 // count)
+                levels.append(limiter.limit)
+
+        self.assertEqual(levels[:2], [3, 2])
+        self.assertEqual(set(levels[2:]), {2})
+
+    def test_adaptive_concurrency_limiter_stops_waiting_when_cancelled(self):
+        limiter = AdaptiveConcurrencyLimiter(2, initial_workers=1)
+        cancel_event = threading.Event()
+        self.assertTrue(limiter.acquire(cancel_event))
+        threading.Timer(0.1, cancel_event.set).start()
+
+        self.assertFalse(limiter.acquire(cancel_event))
+
+    def test_extraction_service_adaptive_mode_never_exceeds_limiter_level(self):
+        steam_path = None
+        records = []
+        item_ids = [str(1000 + index) for index in range(6)]
+        for item_id in item_ids:
+            steam_path, item_dir = self.create_workshop_item(item_id, project_data={"title": item_id})
+            with open(os.path.join(item_dir, "scene.pkg"), "wb") as file:
+                file.write(b"pkg")
+            records.append(WallpaperRecord(id=item_id, title=item_id))
+        plan = self.extraction_service.prepare_requests(records, item_ids, steam_path)
+        settings = SessionSettings(
+            steam_path=steam_path,
+            output_path=os.path.join(self.temp_dir.name, "exports"),
+            batch_extract_workers=4,
+            adaptive_batch_extract_workers=True,
+        )
+        limiter = self.extraction_service.create_concurrency_limiter(plan, settings)
+        self.assertIsNone(
+            self.extraction_service.create_concurrency_limiter(
+                plan,
+                SessionSettings(steam_path=steam_path, batch_extract_workers=4),
+            )
+        )
+        lock = threading.Lock()
+        active = [0, 0]
+
+        def fake_run(_self, command, **_kwargs):
+            with lock:
+                active[0] += 1
+                active[1] = max(active[1], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+            return subprocess.CompletedProcess(command, 0, stdout="", stderr="")
+
+        with patch.object(RuntimeCompatService, "run_extract_command", autospec=True, side_effect=fake_run):
+            summary = self.extraction_service.execute_requests(plan, settings, concurrency_limiter=limiter)
+
+        self.assertEqual(len(summary.succeeded), 6)
+        self.assertLessEqual(active[1], limiter.peak)
+        self.assertEqual(summary.effective_workers, limiter.limit)
+
+    def test_extraction_service_starts_largest_items_first_under_adaptive_limiter(self):
+        steam_path = None
+        records = []
+        item_ids = [str(1100 + index) for index in range(6)]
+        for index, item_id in enumerate(item_ids):
+            steam_path, item_dir = self.create_workshop_item(item_id, project_data={"title": item_id})
+            with open(os.path.join(item_dir, "scene.pkg"), "wb") as file:
+                file.write(b"p" * (10 + (index * 7) % 6 * 100))
+            records.append(WallpaperRecord(id=item_id, title=item_id))
+        plan = self.extraction_service.prepare_requests(records, item_ids, steam_path)
+        settings = SessionSettings(
+            steam_path=steam_path,
+            output_path=os.path.join(self.temp_dir.name, "exports"),
+            batch_extract_workers=4,
+        )
+        limiter = AdaptiveConcurrencyLimiter(4, initial_workers=1, min_window_seconds=60)
+        started = []
+
+        def fake_run(_self, command, **_kwargs):
+            started.append(next(request.item_id for request in plan.requests if request.scene_pkg_path in command))
+            time.sleep(0.01)
+            return subprocess.CompletedProcess(command, 0, stdout="", stderr="")
+
+        with patch.object(RuntimeCompatService, "run_extract_command", autospec=True, side_effect=fake_run):
+            summary = self.extraction_service.execute_requests(plan, settings, concurrency_limiter=limiter)
+
+        self.assertEqual(len(summary.succeeded), 6)
+        self.assertEqual(started, [request.item_id for request in self.extraction_service.scheduler.order_requests(plan.requests)])
+        self.assertEqual(len(set(request.pkg_bytes for request in plan.requests)), 6)
+
+    def test_run_extract_command_streams_lines_and_bounds_captured_output(self):
+        streamed_lines = []
+        script = "import sys\nfor index in range(500):\n    print(f'* Extracting: materials/{index}.tex', flush=True)\nprint('boom', file=sys.stderr)"
+
+        result = app_services.run_extract_command(
+            [sys.executable, "-c", script],
+            on_output=lambda stream_name, line: streamed_lines.append((stream_name, line)),
+            tail_lines=10,
+        )
+
+        self.assertEqual(result.returncode, 0)
+        self.assertEqual(len([line for stream_name, line in streamed_lines if stream_name == "stdout"]), 500)
+        self.assertIn(("stderr", "boom"), streamed_lines)
+        self.assertEqual(len(result.stdout.splitlines()), 10)
+        self.assertTrue(result.stdout.endswith("materials/499.tex"))
+        self.assertEqual(result.stderr, "boom")
+
+    def test_extraction_output_monitor_counts_files_and_bytes(self):
+        output_directory = os.path.join(self.temp_dir.name, "out")
+        os.makedirs(os.path.join(output_directory, "materials"))
+        with open(os.path.join(output_directory, "scene.json"), "wb") as file:
+            file.write(b"x" * 10)
+        with open(os.path.join(output_directory, "materials", "a.png"), "wb") as file:
+            file.write(b"x" * 32)
+        request = ExtractionRequest(item_id="1001", title="Item", scene_pkg_path="scene.pkg", item_directory="1001")
+        events = []
+        monitor = ExtractionOutputMonitor(request, output_directory, events.append, min_interval=0)
+
+        monitor.feed("stdout", "Extracting package: scene.pkg")
+        monitor.feed("stdout", "* Extracting: scene.json")
+        monitor.feed("stderr", "* Extracting: ignored.json")
+        monitor.feed("stdout", "* Extracting: materials/a.tex")
+        final_progress = monitor.finish()
+
+        self.assertIsNone(parse_repkg_entry_line("Done"))
+        self.assertEqual([event.files_extracted for event in events], [1, 2, 2])
+        self.assertEqual(events[1].current_entry, "materials/a.tex")
+        self.assertEqual(final_progress.files_extracted, 2)
+        self.assertEqual(final_progress.bytes_extracted, 42)
+
+    def test_extraction_service_forwards_item_progress_from_streamed_output(self):
+        steam_path, item_dir = self.create_workshop_item("12345", project_data={"title": "Streamed"})
+        with open(os.path.join(item_dir, "scene.pkg"), "wb") as file:
+            file.write(b"pkg")
+        plan = self.extraction_service.prepare_requests(
+            (WallpaperRecord(id="12345", title="Streamed"),),
+            ["12345"],
+            steam_path,
+        )
+        settings = SessionSettings(steam_path=steam_path, output_path=os.path.join(self.temp_dir.name, "exports"))
+
+        def streaming_run(_self, command, on_output=None, **_kwargs):
+            on_output("stdout", "* Extracting: scene.json")
+            return subprocess.CompletedProcess(command, 0, stdout="", stderr="")
+
+        item_progress = []
+        with patch.object(RuntimeCompatService, "run_extract_command", autospec=True, side_effect=streaming_run):
+            summary = self.extraction_service.execute_requests(plan, settings, on_item_progress=item_progress.append)
+
+        self.assertEqual(summary.success_ids, ("12345",))
+        self.assertEqual(item_progress[-1].item_id, "12345")
+        self.assertEqual(item_progress[-1].files_extracted, 1)
+
+    def test_extraction_service_writes_structured_events_per_item_and_run(self):
+        steam_path = None
+        records = []
+        for item_id in ("1001", "1002"):
+            steam_path, item_dir = self.create_workshop_item(item_id, project_data={"title": item_id})
+            with open(os.path.join(item_dir, "scene.pkg"), "wb") as file:
+                file.write(b"p" * 64)
+            records.append(WallpaperRecord(id=item_id, title=item_id))
+        plan = self.extraction_service.prepare_requests(records, ["1001", "1002"], steam_path)
+        settings = SessionSettings(
+            steam_path=steam_path,
+            output_path=os.path.join(self.temp_dir.name, "exports"),
+            batch_extract_workers=2,
+        )
+
+        def fake_run(_self, command, **_kwargs):
+            returncode = 0 if "1001" in command[2] else 3
+            return subprocess.CompletedProcess(command, returncode, stdout="", stderr="bad")
+
+        with patch.object(RuntimeCompatService, "run_extract_command", autospec=True, side_effect=fake_run):
+            self.extraction_service.execute_requests(plan, settings)
+        app_services.flush_logs()
+
+        events = list(read_extraction_events())
+        item_events = {event["item_id"]: event for event in events if event["event"] == "item"}
+        self.assertEqual(set(item_events), {"1001", "1002"})
+        self.assertEqual(item_events["1002"]["returncode"], 3)
+        self.assertEqual(item_events["1001"]["pkg_bytes"], 64)
+        self.assertTrue(item_events["1001"]["worker"].startswith("repkg-extract"))
+        self.assertGreaterEqual(item_events["1001"]["queue_wait_seconds"], 0)
+        self.assertEqual(len({event["run_id"] for event in events}), 1)
+
+        (stats,) = self.extraction_service.events.summarize()
+        self.assertEqual(stats.item_count, 2)
+        self.assertEqual(stats.succeeded_count, 1)
+        self.assertEqual(stats.failed_count, 1)
+        self.assertAlmostEqual(stats.failure_rate, 0.5)
+        self.assertEqual(stats.worker_count, 2)
+
+    def test_summarize_extraction_runs_aggregates_throughput_per_run(self):
+        events = [
+            {"event": "item", "run_id": "a", "ts": 12.0, "item_id": "1", "pkg_bytes": 300, "duration_seconds": 2.0,
+             "queue_wait_seconds": 0.0, "success": True},
+            {"event": "item", "run_id": "a", "ts": 13.0, "item_id": "2", "pkg_bytes": 100, "duration_seconds": 1.0,
+             "queue_wait_seconds": 2.0, "success": False, "timed_out": True},
+            {"event": "run", "run_id": "a", "ts": 13.0, "wall_seconds": 3.0, "effective_workers": 1},
+            {"event": "item", "run_id": "b", "ts": 20.0, "item_id": "3", "pkg_bytes": 50, "duration_seconds": 1.0,
+             "queue_wait_seconds": 0.0, "cancelled": True},
+        ]
+
+        first, second = summarize_extraction_runs(events)
+
+        self.assertEqual(first.run_id, "a")
+        self.assertEqual(first.started_at, 10.0)
+        self.assertEqual(first.timed_out_count, 1)
+        self.assertEqual(first.total_bytes, 400)
+        self.assertAlmostEqual(first.bytes_per_second, 100.0)
+        self.assertAlmostEqual(first.mean_queue_wait_seconds, 1.0)
+        self.assertEqual(first.p95_duration_seconds, 2.0)
+        self.assertEqual(second.cancelled_count, 1)
+        self.assertEqual(second.failure_rate, 0.0)
+
+    def test_cli_extracts_filtered_items_with_json_events_and_exit_codes(self):
+        steam_path = None
+        for item_id, tags in (("1001", ["Anime"]), ("1002", ["Nature"]), ("1003", ["Anime"])):
+            steam_path, item_dir = self.create_workshop_item(
+                item_id,
+                project_data={"title": f"Item {item_id}", "tags": tags, "type": "scene"},
+            )
+            if item_id != "1003":
+                with open(os.path.join(item_dir, "scene.pkg"), "wb") as file:
+                    file.write(b"pkg")
+
+        def fake_run(_self, command, **_kwargs):
+            return subprocess.CompletedProcess(command, 0, stdout="", stderr="")
+
+        stream = io.StringIO()
+        with patch.object(RuntimeCompatService, "run_extract_command", autospec=True, side_effect=fake_run):
+            exit_code = repkg_cli.main(
+                [
+                    "--steam-path",
+                    steam_path,
+                    "extract",
+                    "--tag",
+                    "anime",
+                    "--output",
+                    os.path.join(self.temp_dir.name, "exports"),
+                ],
+                stream=stream,
+            )
+
+        events = [json.loads(line) for line in stream.getvalue().splitlines()]
+        self.assertEqual(exit_code, repkg_cli.EXIT_EXTRACTION_FAILED)
+        self.assertEqual(events[0]["event"], "started")
+        self.assertEqual(events[0]["requested"], 2)
+        self.assertEqual([event["item_id"] for event in events if event["event"] == "item"], ["1001"])
+        self.assertEqual(events[-1]["event"], "finished")
+        self.assertEqual(events[-1]["succeeded"], ["1001"])
+        self.assertEqual(events[-1]["skipped"][0]["item_id"], "1003")
+
+        list_stream = io.StringIO()
+        self.assertEqual(repkg_cli.main(["list", "--type", "video"], stream=list_stream), repkg_cli.EXIT_NOTHING_TO_DO)
+        self.assertEqual(repkg_cli.main(["extract"], stream=io.StringIO()), repkg_cli.EXIT_USAGE_ERROR)
+
+    def test_cli_module_does_not_import_pyside(self):
+        completed = subprocess.run(
+            [sys.executable, "-c", "import sys, repkg_gui.cli; print('PySide6' in sys.modules)"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+        )
+
+        self.assertEqual(completed.returncode, 0, completed.stderr)
+        self.assertEqual(completed.stdout.strip(), "False")
+
+    def test_gui_startup_modules_defer_pandas_pil_and_secondary_pages(self):
+        script = (
+            "import sys, app_services, repkg_gui.bootstrap, repkg_gui.ui.main_window;"
+            "loaded = ('pandas', 'PIL', 'repkg_gui.ui.pages.settings_page', 'repkg_gui.ui.pages.about_page');"
+            "print(','.join(name for name in loaded if name in sys.modules));"
+            "app_services.pd;"
+            "print('pandas' in sys.modules)"
+        )
+        completed = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+            env={**os.environ, "QT_QPA_PLATFORM": "offscreen"},
+        )
+
+        self.assertEqual(completed.returncode, 0, completed.stderr)
+        self.assertEqual(completed.stdout.splitlines(), ["", "True"])
+
+    def test_filter_records_applies_all_active_filters(self):
+        records = (
+            WallpaperRecord(id="1", title="Sunset Beach", tags=("Nature",), type="scene"),
+            WallpaperRecord(id="2", title="Sunset City", tags=("Anime",), type="video"),
+        )
+
+        matched = filter_records(
+            records,
+            (FilterState(FilterField.TITLE, "sunset"), FilterState(FilterField.TYPE, "VIDEO"), FilterState()),
+        )
+
+        self.assertEqual([record.id for record in matched], ["2"])
+
+    def test_job_server_queues_extraction_and_reports_progress_over_http(self):
+        steam_path = None
+        for item_id in ("2001", "2002"):
+            steam_path, item_dir = self.create_workshop_item(
+                item_id,
+                project_data={"title": f"Job {item_id}", "tags": ["Anime"], "type": "scene"},
+            )
+            with open(os.path.join(item_dir, "scene.pkg"), "wb") as file:
+                file.write(b"pkg")
+
+        def fake_run(_self, command, **_kwargs):
+            return subprocess.CompletedProcess(command, 0, stdout="", stderr="")
+
+        def request(method, path, payload=None, headers=None):
+            data = json.dumps(payload).encode("utf-8") if payload is not None else None
+            request_headers = {"Content-Type": "application/json"} if method == "POST" else {}
+            request_headers.update(headers or {})
+            http_request = urllib.request.Request(f"{server.url}{path}", data=data, method=method, headers=request_headers)
+            try:
+                with urllib.request.urlopen(http_request, timeout=5) as response:
+                    return response.status, json.loads(response.read().decode("utf-8"))
+            except urllib.error.HTTPError as exc:
+                return exc.code, json.loads(exc.read().decode("utf-8"))
+
+        with patch.object(RuntimeCompatService, "run_extract_command", autospec=True, side_effect=fake_run):
+            server = create_job_server(port=0, steam_path=steam_path, workers=2)
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            try:
+                status, body = request(
+                    "POST",
+                    "/jobs",
+                    {"tag": "anime", "options": {"output": os.path.join(self.temp_dir.name, "exports")}},
+                )
+                self.assertEqual(status, 202)
+                job_id = body["job"]["job_id"]
+                self.assertEqual(body["job"]["item_ids"], ["2001", "2002"])
+
+                deadline = time.monotonic() + 5
+                while time.monotonic() < deadline:
+                    status, body = request("GET", f"/jobs/{job_id}")
+                    if body["job"]["state"] not in ("queued", "running"):
+                        break
+                    time.sleep(0.05)
+
+                self.assertEqual(body["job"]["state"], "succeeded")
+                self.assertEqual(body["job"]["completed"], 2)
+                self.assertEqual(body["job"]["summary"]["succeeded"], ["2001", "2002"])
+                self.assertEqual(request("GET", "/jobs")[1]["jobs"][0]["job_id"], job_id)
+                self.assertEqual(request("GET", "/health")[1]["workers"], 2)
+                self.assertEqual(request("POST", "/jobs/missing/cancel", {})[0], 404)
+                self.assertEqual(request("POST", "/jobs", {"ids": "2001"})[0], 400)
+
+                browser_job = {"all": True, "options": {"output": os.path.join(self.temp_dir.name, "elsewhere")}}
+                self.assertEqual(request("POST", "/jobs", browser_job, {"Content-Type": "text/plain"})[0], 415)
+                self.assertEqual(request("POST", "/jobs", browser_job, {"Host": "attacker.example:8765"})[0], 403)
+                self.assertEqual(request("POST", "/jobs", browser_job, {"Origin": "https://attacker.example"})[0], 403)
+                self.assertEqual(request("GET", "/jobs", headers={"Origin": "null"})[0], 403)
+                self.assertEqual(request("POST", "/jobs", browser_job, {"Content-Length": "-1"})[0], 400)
+                self.assertEqual(len(request("GET", "/jobs")[1]["jobs"]), 1)
+            finally:
+                server.close()
+
+        with self.assertRaises(ValueError):
+            create_job_server(host="0.0.0.0", port=0, steam_path=steam_path)
+
+    def test_job_queue_shares_worker_budget_and_requeues_pending_jobs(self):
+        records = []
+        steam_path = None
+        for item_id in ("3001", "3002", "3003", "3004"):
+            steam_path, item_dir = self.create_workshop_item(item_id, project_data={"title": item_id})
+            with open(os.path.join(item_dir, "scene.pkg"), "wb") as file:
+                file.write(b"pkg")
+            records.append(WallpaperRecord(id=item_id, title=item_id))
+
+        lock = threading.Lock()
+        running = 0
+        peak = 0
+
+        def fake_run(_self, command, **_kwargs):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.05)
+            with lock:
+                running -= 1
+            return subprocess.CompletedProcess(command, 0, stdout="", stderr="")
+
+        store_path = os.path.join(self.temp_runtime_dir, "jobs.sqlite3")
+        settings = SessionSettings(steam_path=steam_path, output_path=self.temp_dir.name, batch_extract_workers=4)
+        pending_store = ExtractionJobStore(store_path)
+        pending_queue = ExtractionJobQueue(
+            ExtractionService(),
+            lambda: tuple(records),
+            lambda: settings,
+            pending_store,
+            SharedWorkerBudget(2),
+        )
+        pending_queue.shutdown()
+        with self.assertRaises(RuntimeError):
+            pending_queue.submit(["3001"])
+        pending_store.insert(
+            ExtractionJob(job_id="restored", item_ids=("3004",), created_at=time.time(), total=1)
+        )
+        pending_store.insert(
+            ExtractionJob(job_id="crashed", state=JobState.RUNNING, item_ids=("3001",), created_at=time.time())
+        )
+        pending_store.close()
+
+        store = ExtractionJobStore(store_path)
+        budget = SharedWorkerBudget(2)
+        queue = ExtractionJobQueue(ExtractionService(), lambda: tuple(records), lambda: settings, store, budget)
+        with patch.object(RuntimeCompatService, "run_extract_command", autospec=True, side_effect=fake_run):
+            restored = queue.resume_pending()
+            first = queue.submit(["3001", "3002"])
+            second = queue.submit(["3003", "3001"])
+            queue.shutdown(cancel_running=False)
+
+        self.assertEqual([job.job_id for job in restored], ["restored"])
+        self.assertLessEqual(peak, 2)
+        self.assertLessEqual(budget.peak, 2)
+        self.assertEqual(store.get("restored").state, JobState.SUCCEEDED)
+        self.assertEqual(store.get("crashed").state, JobState.INTERRUPTED)
+        self.assertEqual(store.get(first.job_id).summary["succeeded"], ["3001", "3002"])
+        self.assertEqual(store.get(second.job_id).state, JobState.SUCCEEDED)
+        store.close()
+
+    def test_job_queue_marks_jobs_stopped_by_shutdown_as_interrupted(self):
+        records = []
+        steam_path = None
+        for item_id in ("5001", "5002"):
+            steam_path, item_dir = self.create_workshop_item(item_id, project_data={"title": item_id})
+            with open(os.path.join(item_dir, "scene.pkg"), "wb") as file:
+                file.write(b"pkg")
+            records.append(WallpaperRecord(id=item_id, title=item_id))
+        started = threading.Semaphore(0)
+
+        def fake_run(_self, command, cancel_event=None, **_kwargs):
+            started.release()
+            cancel_event.wait(5)
+            return subprocess.CompletedProcess(command, 1, stdout="", stderr="")
+
+        settings = SessionSettings(steam_path=steam_path, output_path=self.temp_dir.name, batch_extract_workers=2)
+        store = ExtractionJobStore(os.path.join(self.temp_runtime_dir, "jobs.sqlite3"))
+        queue = ExtractionJobQueue(
+            ExtractionService(),
+            lambda: tuple(records),
+            lambda: settings,
+            store,
+            SharedWorkerBudget(2),
+        )
+        with patch.object(RuntimeCompatService, "run_extract_command", autospec=True, side_effect=fake_run):
+            user_cancelled = queue.submit(["5001"])
+            stopped = queue.submit(["5002"])
+            self.assertTrue(started.acquire(timeout=5))
+            self.assertTrue(started.acquire(timeout=5))
+            queue.cancel(user_cancelled.job_id)
+            queue.shutdown(cancel_running=True)
+
+        self.assertEqual(store.get(user_cancelled.job_id).state, JobState.CANCELLED)
+        self.assertEqual(store.get(stopped.job_id).state, JobState.INTERRUPTED)
+        self.assertEqual(store.get(stopped.job_id).error, "服务在任务运行时退出")
+        store.close()
+
+    def test_workshop_change_detector_feeds_only_touched_folders_into_catalog(self):
+        steam_path, _ = self.create_workshop_item("4001", project_data={"title": "Keep"})
+        _, changed_dir = self.create_workshop_item("4002", project_data={"title": "Before"})
+        _, removed_dir = self.create_workshop_item("4003", project_data={"title": "Gone"})
+        snapshot = self.catalog_service.scan_catalog(steam_path)
+        detector = WorkshopChangeDetector(steam_path=steam_path)
+        detector.prime()
+
+        self.create_workshop_item("4004", project_data={"title": "New", "type": "scene"})
+        with open(os.path.join(changed_dir, "project.json"), "w", encoding="utf-8") as file:
+            json.dump({"title": "After", "tags": ["Updated"]}, file)
+        for filename in os.listdir(removed_dir):
+            os.remove(os.path.join(removed_dir, filename))
+        os.rmdir(removed_dir)
+
+        changes = detector.poll()
+        self.assertEqual(changes, WorkshopChanges(added=("4004",), changed=("4002",), removed=("4003",)))
+        self.assertTrue(detector.poll().is_empty)
+
+        with patch.object(app_services, "collect_workshop_info", side_effect=AssertionError("full rescan")):
+            updated = self.catalog_service.apply_workshop_changes(snapshot, changes)
+
+        titles = {record.id: record.title for record in updated.records}
+        self.assertEqual(titles, {"4001": "Keep", "4002": "After", "4004": "New"})
+        reloaded = self.catalog_service.load_snapshot_from_csv(updated.csv_path, steam_path=steam_path)
+        self.assertEqual({record.id: record.tags for record in reloaded.records}["4002"], ("Updated",))
+
+    def test_library_controller_watch_mode_applies_changes_and_queues_auto_extract(self):
+        QApplication.instance() or QApplication([])
+        steam_path, _ = self.create_workshop_item("5001", project_data={"title": "Existing"})
+        app_services.write_config_values(
+            {"steam_path": steam_path, "watch_workshop": True, "auto_extract_new_items": True}
+        )
+        self.catalog_service.scan_catalog(steam_path)
+        context = AppContext.from_config(load_config())
+        with patch("repkg_gui.controllers.library_controller.INFO_CSV_FILE", app_services.INFO_CSV_FILE):
+            controller = LibraryController(context)
+            controller.initialize()
+        requested = []
+        controller.auto_extract_requested.connect(requested.append)
+        controller.handle_table_selection(("5001",), "5001")
+        self.assertTrue(controller.workshop_watcher.is_active)
+
+        _, new_dir = self.create_workshop_item("5002", project_data={"title": "Fresh", "type": "scene"})
+        controller.workshop_watcher.check_now()
+
+        self.assertIsNotNone(controller.record_by_id("5002"))
+        self.assertEqual(context.state.selected_wallpaper_ids, {"5001"})
+        self.assertIn("新增 1 项", context.state.status_message)
+        self.assertEqual(requested, [])
+
+        with open(os.path.join(new_dir, "scene.pkg"), "wb") as file:
+            file.write(b"pkg")
+        controller.workshop_watcher.check_now()
+        self.assertEqual(requested, [("5002",)])
+
+        context.set_watch_workshop(False)
+        self.assertFalse(controller.workshop_watcher.is_active)
+
     def test_extraction_service_resolve_effective_workers_returns_zero_without_requests(self):
         settings = SessionSettings(batch_extract_workers=8)
 
@@ -754,6 +2122,24 @@ class PySideArchitectureTests(unittest.TestCase):
         super().setUpClass()
         cls.qt_app = QApplication.instance() or QApplication([])
 
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_runtime_dir = os.path.join(self.temp_dir.name, "runtime")
+        os.makedirs(self.temp_runtime_dir, exist_ok=True)
+        self.original_runtime_dir = app_services.RUNTIME_DIR
+        self.original_log_file = app_services.LOG_FILE
+        self.original_error_log_file = app_services.ERROR_LOG_FILE
+        app_services.RUNTIME_DIR = self.temp_runtime_dir
+        app_services.LOG_FILE = os.path.join(self.temp_runtime_dir, "logs.txt")
+        app_services.ERROR_LOG_FILE = os.path.join(self.temp_runtime_dir, "errors.txt")
+
+    def tearDown(self):
+        app_services.flush_logs()
+        app_services.RUNTIME_DIR = self.original_runtime_dir
+        app_services.LOG_FILE = self.original_log_file
+        app_services.ERROR_LOG_FILE = self.original_error_log_file
+        self.temp_dir.cleanup()
+
     def _build_context(self, config: AppConfig | None = None) -> AppContext:
         return AppContext.from_config(config or AppConfig())
 
@@ -816,6 +2202,31 @@ class PySideArchitectureTests(unittest.TestCase):
         self.qt_app.processEvents()
         self.assertEqual(proxy.visible_item_ids(), ("1", "2", "10"))
 
+    def test_catalog_store_is_shared_by_model_context_and_filters_by_interned_ids(self):
+        store = CatalogStore.from_records(
+            (
+                WallpaperRecord(id="10", title="Alpha", tags=("Anime",), type="Scene"),
+                WallpaperRecord(id="2", title="City Lights", tags=("City", "SciFi"), type="Video"),
+                WallpaperRecord(id="1", title="", tags=("City",), type="Scene"),
+            )
+        )
+        context = self._build_context()
+        context.set_catalog_records(store)
+        model = CatalogTableModel(store)
+        proxy = CatalogFilterProxyModel()
+        proxy.setSourceModel(model)
+
+        self.assertIs(context.state.catalog_records, store)
+        self.assertIs(model.all_records(), store)
+        self.assertEqual(model.record_at(2).display_title, "1")
+        proxy.set_filter_state(FilterState(field=FilterField.TAGS, value="city"))
+        self.assertEqual(proxy.visible_item_ids(), ("2", "1"))
+        proxy.set_filter_state(FilterState(field=FilterField.TYPE, value="scene"))
+        self.assertEqual(proxy.visible_item_ids(), ("10", "1"))
+        proxy.set_filter_state(FilterState(field=FilterField.TITLE, value="1"))
+        self.assertEqual(proxy.visible_item_ids(), ("1",))
+        self.assertEqual(proxy.record_for_proxy_row(0), WallpaperRecord(id="1", tags=("City",), type="Scene"))
+
     def test_load_static_qimage_supports_gif_first_frame(self):
         gif_path = os.path.join(tempfile.gettempdir(), "repkg_gui_test_preview.gif")
         first_frame = Image.new("RGBA", (24, 24), color=(0, 0, 0, 255))
@@ -845,6 +2256,140 @@ class PySideArchitectureTests(unittest.TestCase):
         self.assertFalse(pixmap.isNull())
         self.assertEqual(pixmap.toImage().pixelColor(pixmap.width() // 2, pixmap.height() // 2).red(), 255)
 
+    def test_thumbnail_cache_tracks_hits_and_misses(self):
+        cache = ThumbnailCache()
+        key = ThumbnailCache.build_key("preview.png", QSize(4, 4))
+        pixmap = QPixmap(4, 4)
+
+        self.assertIsNone(cache.get(key))
+        cache.store(key, pixmap)
+        self.assertIs(cache.get(key), pixmap)
+        self.assertIs(cache.get(key), pixmap)
+
+        self.assertEqual((cache.hit_count, cache.miss_count), (2, 1))
+        self.assertAlmostEqual(cache.hit_rate, 2 / 3)
+        self.assertEqual(cache.cached_count, 1)
+        self.assertGreater(cache.cached_bytes, 0)
+        cache.reset_stats()
+        self.assertEqual(cache.hit_rate, 0.0)
+
+    def test_thumbnail_benchmark_scrolls_offscreen_and_reports_diffable_json(self):
+        from benchmarks.thumbnail_benchmark import run_thumbnail_benchmark
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            report = run_thumbnail_benchmark(
+                SyntheticWorkshopSpec(item_count=24, preview_size=(32, 24), broken_json_rate=0.0),
+                passes=2,
+                viewport_size=QSize(480, 360),
+                work_dir=temp_dir,
+            )
+
+        decode = report["results"]["decode"]
+        passes = report["results"]["scrolling"]["passes"]
+        self.assertEqual(decode["decoded"], 24)
+        self.assertEqual(set(decode["formats"]), {"jpg", "png", "gif"})
+        self.assertGreater(passes[0]["cache_misses"], 0)
+        self.assertEqual(passes[1]["cache_misses"], 0)
+        self.assertEqual(passes[1]["cache_hit_rate"], 1.0)
+        self.assertGreater(passes[0]["paint"]["count"], 0)
+
+        comparison = compare_reports(report, report)
+        self.assertEqual(comparison["changes"]["items"]["change_percent"], 0.0)
+        self.assertIn("results.scrolling.passes[1].cache_hit_rate", comparison["changes"])
+        self.assertFalse(comparison["only_in_current"])
+
+    def test_diagnostics_controller_collects_timings_and_worker_activity(self):
+        context = self._build_context()
+        library_controller = LibraryController(context)
+        library_controller.table_model.set_records(
+            (
+                WallpaperRecord(id="1001", title="Alpha"),
+                WallpaperRecord(id="1002", title="Beta"),
+            )
+        )
+        library_controller.set_filter_state(FilterState(field=FilterField.TITLE, value="alp"))
+        view = ThumbnailView()
+        view.cache.get("missing")
+        extraction_controller = ExtractionController(context)
+        controller = DiagnosticsController(library_controller, thumbnail_view=view, extraction_controller=extraction_controller)
+
+        extraction_controller.task_started.emit(
+            ExtractionTaskInfo(requested_count=3, executable_count=2, skipped_count=1, effective_workers=2)
+        )
+        extraction_controller.task_progress.emit(
+            ExtractionProgress(
+                completed=1,
+                total=3,
+                current_item_id="1001",
+                item_progress=ExtractionItemProgress(
+                    item_id="1001", files_extracted=2, bytes_extracted=2048, worker="repkg-extract_0"
+                ),
+            )
+        )
+        running = controller.snapshot()
+        extraction_controller.task_progress.emit(ExtractionProgress(completed=2, total=3, current_item_id="1001"))
+        finished_item = controller.snapshot()
+
+        self.assertEqual((running.catalog_count, running.visible_count), (2, 1))
+        self.assertIsNotNone(running.catalog.filter_seconds)
+        self.assertEqual(running.catalog.filtered_count, 2)
+        self.assertEqual(running.thumbnail_misses, 1)
+        self.assertTrue(running.extraction_running)
+        self.assertEqual([activity.worker for activity in running.workers], ["repkg-extract_0"])
+        self.assertEqual((finished_item.extraction_completed, finished_item.extraction_total), (1, 2))
+        self.assertEqual(finished_item.extraction_bytes, 2048)
+        self.assertEqual(finished_item.workers, ())
+        self.assertEqual([section.title for section in build_diagnostics_sections(finished_item)], ["壁纸目录", "缩略图", "提取"])
+
+    def test_diagnostics_controller_exports_snapshot_json(self):
+        library_controller = LibraryController(self._build_context())
+        controller = DiagnosticsController(library_controller)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            export_path = controller.export_snapshot(os.path.join(temp_dir, "diagnostics.json"))
+            with open(export_path, "r", encoding="utf-8") as file:
+                payload = json.load(file)
+
+        self.assertEqual(set(payload), {"captured_at", "catalog", "thumbnails", "extraction", "spans"})
+        self.assertIsNone(payload["catalog"]["scan_seconds"])
+        self.assertEqual(payload["extraction"]["workers"], [])
+
+    def test_main_window_builds_secondary_pages_on_first_show(self):
+        window = MainWindow(self._build_context())
+        self.addCleanup(window.deleteLater)
+
+        self.assertFalse(window.settings_tab.is_loaded)
+        self.assertFalse(window.about_tab.is_loaded)
+        window.tabs.setCurrentWidget(window.help_tab)
+        window.show()
+        self.qt_app.processEvents()
+
+        self.assertTrue(window.help_tab.is_loaded)
+        self.assertFalse(window.diagnostics_tab.is_loaded)
+        self.assertIs(window.settings_page, window.settings_tab.page())
+        self.assertTrue(window.settings_tab.is_loaded)
+        window.close()
+
+    def test_diagnostics_controller_runs_bounded_profiling_window(self):
+        controller = DiagnosticsController(LibraryController(self._build_context()))
+        finished = []
+        controller.profiling_finished.connect(finished.append)
+
+        session = controller.start_profiling(0.2, "cprofile")
+        self.assertIs(controller.start_profiling(), session)
+        deadline = time.monotonic() + 5
+        while not finished and time.monotonic() < deadline:
+            self.qt_app.processEvents()
+            time.sleep(0.01)
+
+        self.assertFalse(controller.is_profiling)
+        self.assertEqual(len(finished), 1)
+        self.assertTrue(os.path.exists(finished[0].pstats_path))
+        self.assertEqual(finished[0].collapsed_path, "")
+        self.assertTrue(app_services.flush_logs())
+        with open(app_services.LOG_FILE, "r", encoding="utf-8") as file:
+            self.assertIn(finished[0].pstats_path, file.read())
+
     def test_extraction_worker_emits_started_progress_and_finished(self):
         plan = ExtractionPlan(
             requests=(
@@ -877,7 +2422,22 @@ class PySideArchitectureTests(unittest.TestCase):
             def resolve_effective_workers(self, resolved_plan, settings):
                 return 1
 
-            def execute_requests(self, resolved_plan, settings, on_result=None):
+            def create_concurrency_limiter(self, resolved_plan, settings):
+                return None
+
+            def create_eta_tracker(self, resolved_plan, settings, concurrency_limiter=None):
+                return None
+
+            def execute_requests(
+                self,
+                resolved_plan,
+                settings,
+                on_result=None,
+                cancel_token=None,
+                eta_tracker=None,
+                concurrency_limiter=None,
+                on_item_progress=None,
+            ):
                 if on_result is not None:
                     on_result(summary.succeeded[0])
                 return summary